@@ -91,4 +91,5 @@ CACHE_DURATION_HOURS = {
     "videos": 24,
     "channels": 168,  # 7일
     "comments": 6,
+    "trend_channels": 24,  # 채널 트렌드 일괄 분석용 채널 정보
 }
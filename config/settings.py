@@ -125,6 +125,21 @@ TOGETHER_DEFAULT_MODEL = "black-forest-labs/FLUX.2-dev"  # $0.0154/장 (~20원)
 TOGETHER_IMAGE_WIDTH = 1792  # max 1792
 TOGETHER_IMAGE_HEIGHT = 1024  # 16:9 비율에 가까움
 
+# === 이미지 API Rate limit (제공자/모델별 분당 요청 수 + 동시 요청 수) ===
+# 모델 키는 모델 ID에 포함되는 문자열 (먼저 일치하는 항목 사용), "*"는 제공자 기본값
+# burst: 한 번에 몰아서 보낼 수 있는 요청 수 (1이면 60/rpm 초 간격을 정확히 유지)
+IMAGE_RATE_LIMITS = {
+    "together": {
+        "Free": {"rpm": 10, "concurrency": 1, "burst": 1},   # Together Free: 분당 10개
+        "*": {"rpm": 60, "concurrency": 4},
+    },
+    "imagefx": {"*": {"rpm": 20, "concurrency": 1, "burst": 1}},  # 3초 간격 권장
+    "openai": {"*": {"rpm": 60, "concurrency": 2}},
+    "stability": {"*": {"rpm": 60, "concurrency": 4}},
+    "replicate": {"*": {"rpm": 120, "concurrency": 4}},
+    "google": {"*": {"rpm": 60, "concurrency": 2}},
+}
+
 # === TTS 설정 ===
 TTS_DEFAULT_RATE = "-10%"
 TTS_DEFAULT_SILENCE_MS = 1500
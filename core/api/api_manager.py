@@ -4,7 +4,7 @@ API 관리 시스템 - .env 파일 자동 관리
 기능:
 1. API 키 관리 (.env 자동 저장/로드)
 2. API 키 실제 검증 (API 호출)
-3. API 사용량 추적
+3. API 사용량 추적 (추가 전용 SQLite + 일별 롤업, core/api/usage_store.py)
 4. API 선택 및 설정
 5. 비용 계산
 """
@@ -18,6 +18,8 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import threading
 
+from .usage_store import UsageStore
+
 
 # .env 파일 관리
 try:
@@ -81,6 +83,8 @@ class APIUsageRecord:
     error_message: str = ""
     project_name: str = ""
     step_name: str = ""
+    cache_hit: bool = False       # 캐시에서 제공 (API 호출 없음)
+    cost_saved: float = 0.0       # 캐시 덕분에 아낀 비용 (USD)
 
 
 @dataclass
@@ -335,10 +339,9 @@ class APIManager:
         self.config_dir = Path("data/config")
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        self.usage_file = self.config_dir / "api_usage.json"
+        self.usage_file = self.config_dir / "api_usage.json"  # 레거시 (최초 1회 가져오기)
         self.settings_file = self.config_dir / "api_settings.json"
 
-        self.usage_records: List[APIUsageRecord] = []
         self.settings: Dict = {}
         self._lock = threading.Lock()
 
@@ -347,7 +350,9 @@ class APIManager:
         self._load_env_file()
 
         self._load_settings()
-        self._load_usage()
+
+        # 사용 기록: 추가 전용 SQLite + 일별 롤업
+        self.usage_store = UsageStore(self.config_dir / "api_usage.db", legacy_json=self.usage_file)
 
     def _ensure_env_file(self):
         """.env 파일이 없으면 생성"""
@@ -406,23 +411,6 @@ YOUTUBE_API_KEY=
         with open(self.settings_file, "w", encoding="utf-8") as f:
             json.dump(self.settings, f, ensure_ascii=False, indent=2)
 
-    def _load_usage(self):
-        """사용량 로드"""
-        if self.usage_file.exists():
-            try:
-                with open(self.usage_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.usage_records = [APIUsageRecord(**r) for r in data]
-            except Exception:
-                self.usage_records = []
-
-    def _save_usage(self):
-        """사용량 저장"""
-        with self._lock:
-            with open(self.usage_file, "w", encoding="utf-8") as f:
-                data = [asdict(r) for r in self.usage_records]
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
     # === API 키 관리 (개선됨) ===
 
     def get_api_key(self, provider: str) -> str:
@@ -844,8 +832,15 @@ YOUTUBE_API_KEY=
                      success: bool = True,
                      error_message: str = "",
                      project_name: str = "",
-                     step_name: str = ""):
-        """API 사용 기록"""
+                     step_name: str = "",
+                     cache_hit: bool = False,
+                     cost_saved: float = None):
+        """
+        API 사용 기록
+
+        cache_hit=True면 실제 호출 없이 캐시로 처리한 요청 - 비용은 0으로,
+        원래 냈을 비용은 cost_saved로 기록 (cost_saved를 생략하면 단가로 계산)
+        """
 
         api_config = None
         for api in self.AVAILABLE_APIS.values():
@@ -860,6 +855,11 @@ YOUTUBE_API_KEY=
             else:
                 cost = units_used * api_config.price_per_unit
 
+        saved = 0.0
+        if cache_hit:
+            saved = cost if cost_saved is None else cost_saved
+            cost = 0.0
+
         record = APIUsageRecord(
             provider=provider,
             model_id=model_id,
@@ -873,86 +873,97 @@ YOUTUBE_API_KEY=
             success=success,
             error_message=error_message,
             project_name=project_name,
-            step_name=step_name
+            step_name=step_name,
+            cache_hit=cache_hit,
+            cost_saved=saved
         )
 
-        with self._lock:
-            self.usage_records.append(record)
-
-        self._save_usage()
+        # 백그라운드에서 모아서 저장 (파일 전체를 다시 쓰지 않음)
+        self.usage_store.append(asdict(record))
         return record
 
     def get_usage_summary(self,
                           start_date: datetime = None,
                           end_date: datetime = None,
                           provider: str = None) -> Dict:
-        """사용량 요약"""
-
-        records = self.usage_records
-
-        if start_date:
-            records = [r for r in records
-                      if datetime.fromisoformat(r.timestamp) >= start_date]
-        if end_date:
-            records = [r for r in records
-                      if datetime.fromisoformat(r.timestamp) <= end_date]
-        if provider:
-            records = [r for r in records if r.provider == provider]
+        """사용량 요약 (일별 롤업에서 계산)"""
 
         summary = {
-            "total_requests": len(records),
-            "successful_requests": sum(1 for r in records if r.success),
-            "failed_requests": sum(1 for r in records if not r.success),
-            "total_cost": sum(r.cost_estimate for r in records),
-            "total_tokens_input": sum(r.tokens_input for r in records),
-            "total_tokens_output": sum(r.tokens_output for r in records),
-            "total_duration": sum(r.duration_seconds for r in records),
+            "total_requests": 0,
+            "successful_requests": 0,
+            "failed_requests": 0,
+            "total_cost": 0.0,
+            "total_tokens_input": 0,
+            "total_tokens_output": 0,
+            "total_duration": 0.0,
+            "cache_hits": 0,
+            "cache_hit_rate": 0.0,
+            "cost_saved": 0.0,
             "by_provider": {},
             "by_function": {},
             "by_date": {},
         }
 
-        for r in records:
-            if r.provider not in summary["by_provider"]:
-                summary["by_provider"][r.provider] = {"requests": 0, "cost": 0, "tokens": 0}
-            summary["by_provider"][r.provider]["requests"] += 1
-            summary["by_provider"][r.provider]["cost"] += r.cost_estimate
-            summary["by_provider"][r.provider]["tokens"] += r.tokens_input + r.tokens_output
-
-        for r in records:
-            if r.function not in summary["by_function"]:
-                summary["by_function"][r.function] = {"requests": 0, "cost": 0}
-            summary["by_function"][r.function]["requests"] += 1
-            summary["by_function"][r.function]["cost"] += r.cost_estimate
-
-        for r in records:
-            date = r.timestamp[:10]
-            if date not in summary["by_date"]:
-                summary["by_date"][date] = {"requests": 0, "cost": 0}
-            summary["by_date"][date]["requests"] += 1
-            summary["by_date"][date]["cost"] += r.cost_estimate
+        for row in self.usage_store.rollup_rows(start_date, end_date, provider):
+            summary["total_requests"] += row["requests"]
+            summary["successful_requests"] += row["successes"]
+            summary["failed_requests"] += row["requests"] - row["successes"]
+            summary["total_cost"] += row["cost"]
+            summary["total_tokens_input"] += row["tokens_input"]
+            summary["total_tokens_output"] += row["tokens_output"]
+            summary["total_duration"] += row["duration"]
+            summary["cache_hits"] += row["cache_hits"]
+            summary["cost_saved"] += row["cost_saved"]
+
+            by_provider = summary["by_provider"].setdefault(
+                row["provider"], {"requests": 0, "cost": 0, "tokens": 0}
+            )
+            by_provider["requests"] += row["requests"]
+            by_provider["cost"] += row["cost"]
+            by_provider["tokens"] += row["tokens_input"] + row["tokens_output"]
+
+            by_function = summary["by_function"].setdefault(
+                row["function"], {"requests": 0, "cost": 0, "cache_hits": 0, "cost_saved": 0}
+            )
+            by_function["requests"] += row["requests"]
+            by_function["cost"] += row["cost"]
+            by_function["cache_hits"] += row["cache_hits"]
+            by_function["cost_saved"] += row["cost_saved"]
+
+            by_date = summary["by_date"].setdefault(row["day"], {"requests": 0, "cost": 0})
+            by_date["requests"] += row["requests"]
+            by_date["cost"] += row["cost"]
+
+        # 적중률은 기능별 (캐시 적중 + 실제 호출) 기준 - 다른 API 호출이 분모에 섞이지 않도록
+        for by_function in summary["by_function"].values():
+            by_function["cache_hit_rate"] = (
+                by_function["cache_hits"] / by_function["requests"] if by_function["requests"] else 0.0
+            )
+
+        # 전체 적중률 = 이미지 캐시 적중률 (캐시 적중을 기록하는 기능)
+        image_usage = summary["by_function"].get("image_generation")
+        if image_usage:
+            summary["cache_hit_rate"] = image_usage["cache_hit_rate"]
+
+        # 날짜순 (기존 기록 순서와 동일)
+        summary["by_date"] = dict(sorted(summary["by_date"].items()))
 
         return summary
 
     def get_recent_usage(self, limit: int = 100) -> List[APIUsageRecord]:
         """최근 사용 기록"""
-        return sorted(self.usage_records, key=lambda r: r.timestamp, reverse=True)[:limit]
+        return [APIUsageRecord(**r) for r in self.usage_store.recent(limit)]
 
     def get_error_logs(self, limit: int = 50) -> List[APIUsageRecord]:
         """에러 로그"""
-        errors = [r for r in self.usage_records if not r.success]
-        return sorted(errors, key=lambda r: r.timestamp, reverse=True)[:limit]
+        return [APIUsageRecord(**r) for r in self.usage_store.recent(limit, errors_only=True)]
 
     def clear_usage_history(self, before_date: datetime = None):
         """사용 기록 삭제"""
         if before_date:
-            self.usage_records = [
-                r for r in self.usage_records
-                if datetime.fromisoformat(r.timestamp) >= before_date
-            ]
+            self.usage_store.delete_before(before_date)
         else:
-            self.usage_records = []
-        self._save_usage()
+            self.usage_store.clear()
 
 
 # 싱글톤 인스턴스
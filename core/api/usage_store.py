@@ -0,0 +1,391 @@
+"""
+API 사용 기록 저장소 - 추가 전용 SQLite + 일별 롤업
+
+기존 문제:
+  record_usage 한 번마다 api_usage.json 전체를 indent=2로 다시 씀 → 기록이 쌓일수록 느려짐
+  get_usage_summary는 모든 기록의 timestamp를 매번 다시 파싱하며 여러 번 순회
+
+해결책:
+  - usage 테이블: 기록 1건 = 1행 (추가 전용), day/provider/function/timestamp 인덱스
+  - usage_daily 테이블: (day, provider, function)별 누적 카운터 - 쓰기와 같은 트랜잭션에서 갱신
+  - 쓰기는 백그라운드 스레드가 모아서 한 트랜잭션으로 (호출 스레드는 큐에 넣고 바로 반환)
+  - 요약은 롤업 행에서 계산, 기간 경계의 부분 일자만 원본 행을 인덱스로 조회
+  - 롤업은 메모리에도 유지 (append 즉시 반영) → 온전한 날짜 요약은 쓰기 대기/DB 조회 없이 O(일수)
+
+기존 api_usage.json은 처음 열 때 한 번 가져옵니다 (파일은 그대로 둠).
+"""
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# usage 테이블 컬럼 (APIUsageRecord 필드와 같은 순서)
+RECORD_FIELDS = [
+    "provider", "model_id", "function", "timestamp",
+    "tokens_input", "tokens_output", "units_used", "cost_estimate", "duration_seconds",
+    "success", "error_message", "project_name", "step_name", "cache_hit", "cost_saved",
+]
+
+# usage_daily 누적 컬럼
+ROLLUP_FIELDS = [
+    "requests", "successes", "cost", "tokens_input", "tokens_output",
+    "duration", "cache_hits", "cost_saved",
+]
+
+# 원본 행 → 롤업 카운터 집계식
+_ROLLUP_SELECT = """
+    COUNT(*), SUM(success), SUM(cost_estimate), SUM(tokens_input), SUM(tokens_output),
+    SUM(duration_seconds), SUM(cache_hit), SUM(cost_saved)
+"""
+
+_UPSERT_ROLLUP = f"""
+    INSERT INTO usage_daily (day, provider, function, {", ".join(ROLLUP_FIELDS)})
+    VALUES (?, ?, ?, {", ".join("?" for _ in ROLLUP_FIELDS)})
+    ON CONFLICT (day, provider, function) DO UPDATE SET
+    {", ".join(f"{f} = {f} + excluded.{f}" for f in ROLLUP_FIELDS)}
+"""
+
+
+def _rollup_delta(record: Dict) -> List:
+    """기록 1건의 롤업 증가분"""
+    return [
+        1,
+        1 if record.get("success") else 0,
+        record.get("cost_estimate") or 0.0,
+        record.get("tokens_input") or 0,
+        record.get("tokens_output") or 0,
+        record.get("duration_seconds") or 0.0,
+        1 if record.get("cache_hit") else 0,
+        record.get("cost_saved") or 0.0,
+    ]
+
+
+class UsageStore:
+    """API 사용 기록 SQLite 저장소 (비동기 일괄 쓰기)"""
+
+    # 한 트랜잭션에 쓰는 최대 기록 수
+    BATCH_SIZE = 500
+
+    # 첫 기록 후 더 모으는 시간 (초)
+    FLUSH_INTERVAL = 0.2
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            legacy_json: 예전 api_usage.json (있으면 최초 1회 가져오기)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 스레드별 연결
+        self._local = threading.local()
+
+        # 쓰기 큐 + 백그라운드 writer
+        self._queue: "queue.Queue[Dict]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+        # 메모리 롤업 {day: {(provider, function): [ROLLUP_FIELDS 순서 카운터]}}
+        self._daily: Dict[str, Dict[tuple, List]] = {}
+        self._daily_lock = threading.Lock()
+
+        self._init_db(legacy_json)
+        self._load_daily()
+        atexit.register(self.flush)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결 (WAL 모드)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self, legacy_json: Optional[Path]):
+        """테이블/인덱스 생성 + 레거시 JSON 가져오기"""
+        conn = self._get_conn()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                day TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                function TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                tokens_input INTEGER DEFAULT 0,
+                tokens_output INTEGER DEFAULT 0,
+                units_used REAL DEFAULT 0,
+                cost_estimate REAL DEFAULT 0,
+                duration_seconds REAL DEFAULT 0,
+                success INTEGER DEFAULT 1,
+                error_message TEXT DEFAULT '',
+                project_name TEXT DEFAULT '',
+                step_name TEXT DEFAULT '',
+                cache_hit INTEGER DEFAULT 0,
+                cost_saved REAL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_usage_timestamp ON usage (timestamp);
+            CREATE INDEX IF NOT EXISTS idx_usage_day ON usage (day);
+            CREATE INDEX IF NOT EXISTS idx_usage_provider ON usage (provider, day);
+            CREATE INDEX IF NOT EXISTS idx_usage_function ON usage (function, day);
+
+            CREATE TABLE IF NOT EXISTS usage_daily (
+                day TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                function TEXT NOT NULL,
+                requests INTEGER DEFAULT 0,
+                successes INTEGER DEFAULT 0,
+                cost REAL DEFAULT 0,
+                tokens_input INTEGER DEFAULT 0,
+                tokens_output INTEGER DEFAULT 0,
+                duration REAL DEFAULT 0,
+                cache_hits INTEGER DEFAULT 0,
+                cost_saved REAL DEFAULT 0,
+                PRIMARY KEY (day, provider, function)
+            );
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        conn.commit()
+
+        imported = conn.execute("SELECT value FROM meta WHERE key = 'legacy_json'").fetchone()
+        if imported is None and legacy_json and Path(legacy_json).exists():
+            try:
+                with open(legacy_json, "r", encoding="utf-8") as f:
+                    records = json.load(f)
+            except (OSError, ValueError):
+                records = []
+            self._write_batch(conn, records)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_json', ?)", (str(len(records)),))
+            conn.commit()
+            if records:
+                print(f"[UsageStore] 기존 사용 기록 {len(records)}건 가져옴")
+
+    def _load_daily(self):
+        """usage_daily → 메모리 롤업"""
+        self.flush()
+        rows = self._get_conn().execute(
+            f"SELECT day, provider, function, {', '.join(ROLLUP_FIELDS)} FROM usage_daily"
+        ).fetchall()
+        daily: Dict[str, Dict[tuple, List]] = {}
+        for row in rows:
+            daily.setdefault(row[0], {})[tuple(row[1:3])] = list(row[3:])
+        with self._daily_lock:
+            self._daily = daily
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+
+    def _write_batch(self, conn: sqlite3.Connection, records: List[Dict]):
+        """기록 여러 건 + 롤업 갱신 (한 트랜잭션)"""
+        if not records:
+            return
+
+        rows = []
+        deltas: Dict[tuple, List] = {}
+        for record in records:
+            day = record["timestamp"][:10]
+            rows.append([day] + [record.get(field, 0) for field in RECORD_FIELDS])
+
+            key = (day, record["provider"], record["function"])
+            delta = _rollup_delta(record)
+            if key in deltas:
+                deltas[key] = [a + b for a, b in zip(deltas[key], delta)]
+            else:
+                deltas[key] = delta
+
+        with conn:
+            conn.executemany(
+                f"INSERT INTO usage (day, {', '.join(RECORD_FIELDS)}) "
+                f"VALUES (?, {', '.join('?' for _ in RECORD_FIELDS)})",
+                rows
+            )
+            conn.executemany(_UPSERT_ROLLUP, [list(key) + delta for key, delta in deltas.items()])
+
+    def append(self, record: Dict):
+        """기록 추가 (메모리 롤업 즉시 갱신, 저장은 큐에 넣고 백그라운드에서 일괄)"""
+        key = (record["provider"], record["function"])
+        delta = _rollup_delta(record)
+        with self._daily_lock:
+            day_rollup = self._daily.setdefault(record["timestamp"][:10], {})
+            counters = day_rollup.get(key)
+            if counters is None:
+                day_rollup[key] = delta
+            else:
+                for i, value in enumerate(delta):
+                    counters[i] += value
+
+        self._queue.put(record)
+        if self._writer is None or not self._writer.is_alive():
+            with self._writer_lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(
+                        target=self._writer_loop, name="usage-store-writer", daemon=True
+                    )
+                    self._writer.start()
+
+    def _writer_loop(self):
+        """큐에서 기록을 모아 FLUSH_INTERVAL/BATCH_SIZE 단위로 저장"""
+        conn = self._get_conn()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(conn, batch)
+            except sqlite3.Error as e:
+                print(f"[UsageStore] 저장 실패 ({len(batch)}건): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self):
+        """대기 중인 기록이 모두 저장될 때까지 대기"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def recent(self, limit: int = 100, errors_only: bool = False) -> List[Dict]:
+        """최근 기록 (timestamp 내림차순)"""
+        self.flush()
+        where = "WHERE success = 0" if errors_only else ""
+        cursor = self._get_conn().execute(
+            f"SELECT {', '.join(RECORD_FIELDS)} FROM usage {where} "
+            f"ORDER BY timestamp DESC LIMIT ?",
+            (limit,)
+        )
+        records = []
+        for row in cursor:
+            record = dict(zip(RECORD_FIELDS, row))
+            record["success"] = bool(record["success"])
+            record["cache_hit"] = bool(record["cache_hit"])
+            records.append(record)
+        return records
+
+    def rollup_rows(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        provider: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        기간 내 (day, provider, function)별 카운터
+
+        온전한 날짜는 메모리 롤업(usage_daily 사본)에서, 기간 경계의 부분 일자는 원본 행에서 집계합니다.
+
+        Returns:
+            [{"day", "provider", "function", "requests", "successes", "cost", ...}, ...]
+        """
+        start_day = start.date().isoformat() if start else None
+        end_day = end.date().isoformat() if end else None
+
+        # 온전한 날짜 범위는 메모리 롤업에서 (쓰기 대기 불필요)
+        first_full = None
+        if start is not None:
+            start_is_midnight = start.time() == datetime.min.time()
+            first_full = start_day if start_is_midnight else (start.date() + timedelta(days=1)).isoformat()
+
+        rows = []
+        with self._daily_lock:
+            for day, day_rollup in self._daily.items():
+                if first_full is not None and day < first_full:
+                    continue
+                if end_day is not None and day >= end_day:
+                    continue
+                for (row_provider, function), counters in day_rollup.items():
+                    if provider and row_provider != provider:
+                        continue
+                    rows.append((day, row_provider, function, *counters))
+
+        # 경계 부분 일자 (시작일이 자정이 아니면 시작일, 종료일은 항상) - 원본 행 조회
+        partial = []
+        if start is not None and start.time() != datetime.min.time():
+            partial.append(start_day)
+        if end is not None and end_day not in partial:
+            partial.append(end_day)
+
+        if partial:
+            self.flush()
+            conn = self._get_conn()
+
+        for day in partial:
+            conditions, params = ["day = ?"], [day]
+            if start is not None:
+                conditions.append("timestamp >= ?")
+                params.append(start.isoformat())
+            if end is not None:
+                conditions.append("timestamp <= ?")
+                params.append(end.isoformat())
+            if provider:
+                conditions.append("provider = ?")
+                params.append(provider)
+            rows.extend(conn.execute(
+                f"SELECT day, provider, function, {_ROLLUP_SELECT} FROM usage "
+                f"WHERE {' AND '.join(conditions)} GROUP BY provider, function",
+                params
+            ).fetchall())
+
+        keys = ["day", "provider", "function"] + ROLLUP_FIELDS
+        return [dict(zip(keys, row)) for row in rows if row[3]]
+
+    # ------------------------------------------------------------
+    # 삭제
+    # ------------------------------------------------------------
+
+    def delete_before(self, before: datetime):
+        """before 이전 기록 삭제 (경계 일자 롤업은 남은 행으로 재계산)"""
+        self.flush()
+        conn = self._get_conn()
+        day = before.date().isoformat()
+        with conn:
+            conn.execute("DELETE FROM usage WHERE timestamp < ?", (before.isoformat(),))
+            conn.execute("DELETE FROM usage_daily WHERE day <= ?", (day,))
+            conn.execute(
+                f"INSERT INTO usage_daily (day, provider, function, {', '.join(ROLLUP_FIELDS)}) "
+                f"SELECT day, provider, function, {_ROLLUP_SELECT} FROM usage "
+                f"WHERE day = ? GROUP BY provider, function",
+                (day,)
+            )
+            boundary = conn.execute(
+                f"SELECT day, provider, function, {', '.join(ROLLUP_FIELDS)} FROM usage_daily WHERE day = ?",
+                (day,)
+            ).fetchall()
+
+        # 메모리 롤업: 이전 날짜는 버리고 경계 일자만 DB 값으로 교체 (이후 날짜는 그대로)
+        with self._daily_lock:
+            self._daily = {d: day_rollup for d, day_rollup in self._daily.items() if d > day}
+            if boundary:
+                self._daily[day] = {tuple(row[1:3]): list(row[3:]) for row in boundary}
+
+    def clear(self):
+        """전체 삭제"""
+        self.flush()
+        conn = self._get_conn()
+        with conn:
+            conn.execute("DELETE FROM usage")
+            conn.execute("DELETE FROM usage_daily")
+        with self._daily_lock:
+            self._daily = {}
@@ -9,12 +9,16 @@
 """
 import os
 import base64
+import shutil
 import time
 import requests
 from pathlib import Path
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
 
+from utils.image_cache import get_image_cache, normalize_prompt, report_cache_hit, report_generation
+from utils.rate_limiter import get_rate_limiter, is_rate_limit_error, map_rate_limited
+
 
 @dataclass
 class ImageConfig:
@@ -160,6 +164,11 @@ class ImageGenerator:
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = str(output_dir / f"generated_{int(time.time())}.png")
 
+        # 같은 seed 요청은 디스크 캐시에서 (비용 없음)
+        cached = self._load_cached(prompt, output_path, cfg)
+        if cached:
+            return cached
+
         try:
             if cfg.provider == "together":
                 result = self._generate_together(prompt, output_path, cfg)
@@ -176,11 +185,23 @@ class ImageGenerator:
                 )
 
             result.generation_time = time.time() - start_time
+            report_generation(cfg.provider, cfg.model, result.success,
+                              duration_seconds=result.generation_time, error_message=result.error)
+
+            cache_key = self._image_cache_key(prompt, cfg)
+            if cache_key and result.success:
+                try:
+                    get_image_cache().put(cache_key, Path(result.image_path).read_bytes(), model=cfg.model)
+                except OSError as e:
+                    print(f"[ImageGenerator] 캐시 저장 실패: {e}")
+
             return result
 
         except Exception as e:
             import traceback
             print(f"[ImageGenerator.generate] 예외 발생: {str(e)}")
+            report_generation(cfg.provider, cfg.model, False,
+                              duration_seconds=time.time() - start_time, error_message=str(e))
             return ImageResult(
                 success=False,
                 prompt=prompt,
@@ -191,6 +212,39 @@ class ImageGenerator:
                 metadata={"traceback": traceback.format_exc()}
             )
 
+    def _image_cache_key(self, prompt: str, cfg: ImageConfig) -> Optional[str]:
+        """seed가 있는 요청만 캐시 키 (seed 없이 재생성하면 새 이미지를 원하는 것)"""
+        if cfg.seed is None:
+            return None
+        return get_image_cache().make_key(
+            prompt, cfg.provider, cfg.model, cfg.width, cfg.height,
+            steps=cfg.steps, seed=cfg.seed, negative_prompt=cfg.negative_prompt
+        )
+
+    def _load_cached(self, prompt: str, output_path: str, cfg: ImageConfig) -> Optional[ImageResult]:
+        """캐시 적중 시 output_path에 저장하고 결과 반환"""
+        cache_key = self._image_cache_key(prompt, cfg)
+        image_data = get_image_cache().get(cache_key) if cache_key else None
+        if not image_data:
+            return None
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(image_data)
+
+        print(f"[ImageGenerator] 캐시 사용: {Path(output_path).name}")
+        report_cache_hit(cfg.provider, cfg.model)
+
+        return ImageResult(
+            success=True,
+            image_path=output_path,
+            path=output_path,
+            prompt=prompt,
+            model=cfg.model,
+            provider=cfg.provider,
+            metadata={"cache_hit": True}
+        )
+
     def generate_image(
         self,
         prompt: str,
@@ -243,7 +297,8 @@ class ImageGenerator:
                     height=height,
                     steps=config.steps,
                     n=1,
-                    response_format="b64_json"
+                    response_format="b64_json",
+                    **({"seed": config.seed} if config.seed is not None else {})
                 )
                 image_data = base64.b64decode(response.data[0].b64_json)
                 print(f"[ImageGenerator] SDK 성공 - 이미지 데이터 수신")
@@ -273,6 +328,9 @@ class ImageGenerator:
                 if config.negative_prompt:
                     payload["negative_prompt"] = config.negative_prompt
 
+                if config.seed is not None:
+                    payload["seed"] = config.seed
+
                 print(f"[ImageGenerator] API 호출 - payload prompt 길이: {len(payload['prompt'])} 문자")
 
                 response = requests.post(
@@ -652,41 +710,94 @@ class ImageGenerator:
         on_progress=None
     ) -> List[ImageResult]:
         """
-        배치 이미지 생성
+        배치 이미지 생성 (제공자/모델 Rate limit 한도 안에서 병렬)
+
+        같은 프롬프트는 한 번만 생성하고, seed가 있으면 이전 결과를 캐시에서 재사용합니다.
 
         Args:
             prompts: 프롬프트 리스트
             output_dir: 출력 디렉토리
             config: 이미지 설정
-            on_progress: 진행 콜백 (current, total, result)
+            on_progress: 진행 콜백 (완료 수, total, result)
 
         Returns:
-            List[ImageResult]: 결과 리스트
+            List[ImageResult]: 결과 리스트 (프롬프트 순서)
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        results = []
         total = len(prompts)
         cfg = config or self.config
-
-        for i, prompt in enumerate(prompts):
-            # 파일명 생성
-            filename = f"image_{i+1:03d}.png"
-            file_path = output_path / filename
-
-            # 이미지 생성
-            result = self.generate(prompt, str(file_path), cfg)
-            results.append(result)
-
-            # 콜백 호출
+        results: List[Optional[ImageResult]] = [None] * total
+        completed = 0
+
+        def file_path(index: int) -> str:
+            return str(output_path / f"image_{index+1:03d}.png")
+
+        # 같은 프롬프트는 한 번만 생성하고 나머지는 복사
+        duplicates: Dict[int, List[int]] = {}
+        first_of: Dict[str, int] = {}
+        for index, prompt in enumerate(prompts):
+            first = first_of.setdefault(normalize_prompt(prompt), index)
+            duplicates.setdefault(first, [])
+            if first != index:
+                duplicates[first].append(index)
+
+        def finish(index: int, result: ImageResult):
+            nonlocal completed
+            results[index] = result
+            completed += 1
             if on_progress:
-                on_progress(i + 1, total, result)
-
-            # Rate limit 대기 (무료 모델인 경우)
-            if "Free" in cfg.model or cfg.provider == "together":
-                if i < total - 1:  # 마지막이 아닌 경우에만 대기
-                    time.sleep(6)  # Together Free는 분당 10개 제한
+                on_progress(completed, total, result)
+
+            copies = duplicates.get(index, [])
+            for dup in copies:
+                if result.success:
+                    shutil.copyfile(result.image_path, file_path(dup))
+                    dup_result = ImageResult(
+                        success=True,
+                        image_path=file_path(dup),
+                        prompt=prompts[dup],
+                        model=result.model,
+                        provider=result.provider,
+                        metadata={"deduplicated_from": index}
+                    )
+                else:
+                    dup_result = ImageResult(
+                        success=False,
+                        prompt=prompts[dup],
+                        model=result.model,
+                        provider=result.provider,
+                        error=result.error
+                    )
+                results[dup] = dup_result
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total, dup_result)
+
+            if copies and result.success:
+                print(f"[ImageGenerator] 중복 프롬프트 {len(copies)}개 복사 (생성 생략)")
+                report_cache_hit(cfg.provider, cfg.model, count=len(copies), step_name="image_dedup")
+
+        # 캐시 적중은 Rate limit 없이 바로 처리
+        pending = []
+        for index in duplicates:
+            cached = self._load_cached(prompts[index], file_path(index), cfg)
+            if cached:
+                finish(index, cached)
+            else:
+                pending.append(index)
+
+        # 제공자/모델별 한도(분당 요청/동시 요청) 안에서 병렬 생성, 429면 백오프 후 재시도
+        limiter = get_rate_limiter(cfg.provider, cfg.model)
+
+        for index, result in map_rate_limited(
+            lambda i: self.generate(prompts[i], file_path(i), cfg),
+            pending,
+            limiter,
+            is_throttled=lambda r: not r.success and is_rate_limit_error(r.error)
+        ):
+            finish(pending[index], result)
 
         return results
 
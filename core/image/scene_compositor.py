@@ -5,9 +5,13 @@
 AI 분석 기반 자동 배치 지원
 """
 import json
+import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Any
 from io import BytesIO
 import requests
 
@@ -27,6 +31,62 @@ from core.image.ai_composition_analyzer import (
 )
 
 
+class CharacterImageCache:
+    """
+    디코딩/배경 제거/리사이즈된 캐릭터 이미지 캐시 (LRU, 최대 항목 수 제한)
+
+    키 예시 (버전 = 로컬 파일 (mtime, 크기), URL은 None):
+        ("base", 경로, 버전, remove_bg)                        - 로드 + 배경 제거
+        ("sized", 경로, 버전, remove_bg, size_preset, 배경 높이) - 크기 조정까지 완료
+    같은 경로의 파일을 교체하면 버전이 바뀌어 새로 로드됩니다.
+    """
+
+    def __init__(self, max_items: int = 64):
+        self.max_items = max_items
+        self._items: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional["Image.Image"]:
+        image = self._items.get(key)
+        if image is not None:
+            self._items.move_to_end(key)
+        return image
+
+    def put(self, key: Tuple, image: "Image.Image"):
+        if self.max_items <= 0:
+            return
+        self._items[key] = image
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def items(self) -> List[Tuple[Tuple, "Image.Image"]]:
+        return list(self._items.items())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# === 프로세스 풀 워커 ===
+_worker_compositor: Optional["SceneCompositor"] = None
+
+
+def _init_composite_worker(output_dir: str, cache_entries: List[Tuple[Tuple, Any]], max_items: int):
+    """워커 프로세스 초기화 - 메인에서 준비한 캐릭터 캐시를 한 번만 전달받음"""
+    global _worker_compositor
+    compositor = SceneCompositor.__new__(SceneCompositor)
+    compositor.project_path = None
+    compositor.output_dir = Path(output_dir)
+    compositor._char_cache = CharacterImageCache(max_items=max(max_items, len(cache_entries)))
+    for key, image in cache_entries:
+        compositor._char_cache.put(key, image)
+    _worker_compositor = compositor
+
+
+def _composite_scene_job(index: int, job: Dict) -> Tuple[int, Dict]:
+    """워커 프로세스에서 씬 하나 합성"""
+    return index, _worker_compositor.composite_scene(**job)
+
+
 class SceneCompositor:
     """씬 이미지 합성기"""
 
@@ -57,6 +117,12 @@ class SceneCompositor:
         "group": [(0.15, 0.85), (0.38, 0.85), (0.62, 0.85), (0.85, 0.85)],
     }
 
+    # 캐릭터 이미지 캐시 최대 항목 수
+    CHARACTER_CACHE_SIZE = 64
+
+    # composite_all_scenes 자동 파이프라인 모드 기준 (합성할 씬 수)
+    PARALLEL_MIN_SCENES = 8
+
     def __init__(self, project_path: str = None):
         """
         Args:
@@ -77,6 +143,9 @@ class SceneCompositor:
         # AI 합성 분석기
         self.ai_analyzer = AICompositionAnalyzer()
 
+        # 캐릭터 이미지 캐시 (같은 캐릭터를 씬마다 다시 다운로드/배경 제거하지 않음)
+        self._char_cache = CharacterImageCache(max_items=self.CHARACTER_CACHE_SIZE)
+
     def _load_image(self, url_or_path: str) -> Image.Image:
         """이미지 로드 (URL 또는 로컬 경로)"""
         if url_or_path.startswith("http"):
@@ -85,11 +154,78 @@ class SceneCompositor:
         else:
             return Image.open(url_or_path).convert("RGBA")
 
+    @staticmethod
+    def _source_version(url_or_path: str) -> Optional[Tuple[int, int]]:
+        """캐시 키용 파일 버전 (mtime, 크기) - URL이나 없는 파일은 None"""
+        if url_or_path.startswith("http"):
+            return None
+        try:
+            stat = os.stat(url_or_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_character_base(
+        self,
+        char_path: str,
+        remove_bg: bool,
+        version: Optional[Tuple[int, int]] = None
+    ) -> Image.Image:
+        """캐릭터 이미지 로드 + 배경 제거 (캐시 사용)"""
+        cache = getattr(self, "_char_cache", None)
+        if version is None:
+            version = self._source_version(char_path)
+        key = ("base", char_path, version, remove_bg)
+
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        char_image = self._load_image(char_path)
+        if remove_bg:
+            char_image = self._remove_solid_background(char_image)
+
+        if cache is not None:
+            cache.put(key, char_image)
+        return char_image
+
+    def _prepare_character(
+        self,
+        char_path: str,
+        bg_height: int,
+        size_preset: str,
+        remove_bg: bool
+    ) -> Image.Image:
+        """캐릭터 이미지 로드 + 배경 제거 + 크기 조정 (캐시 사용)"""
+        cache = getattr(self, "_char_cache", None)
+        version = self._source_version(char_path)
+        key = ("sized", char_path, version, remove_bg, size_preset, bg_height)
+
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        char_image = self._get_character_base(char_path, remove_bg, version)
+        char_image = self._resize_character(char_image, bg_height, size_preset)
+
+        if cache is not None:
+            cache.put(key, char_image)
+        return char_image
+
+    def _get_image_size(self, url_or_path: str) -> Tuple[int, int]:
+        """이미지 크기 조회 (로컬 파일은 헤더만 읽음)"""
+        if url_or_path.startswith("http"):
+            return self._load_image(url_or_path).size
+        with Image.open(url_or_path) as image:
+            return image.size
+
     def _remove_solid_background(
         self,
         image: Image.Image,
         tolerance: int = 40,
-        edge_blur: int = 2
+        edge_blur: int = 0
     ) -> Image.Image:
         """
         단색 배경 제거 (크로마키 효과)
@@ -99,7 +235,7 @@ class SceneCompositor:
         Args:
             image: RGBA 이미지
             tolerance: 배경색 허용 오차 (높을수록 더 많이 제거)
-            edge_blur: 가장자리 부드럽게 (미구현)
+            edge_blur: 가장자리 부드럽게 (알파 가우시안 블러 반경, 0이면 사용 안 함)
 
         Returns:
             배경이 제거된 RGBA 이미지
@@ -127,7 +263,45 @@ class SceneCompositor:
 
         print(f"  [배경제거] 배경색 감지: RGB({bg_color[0]}, {bg_color[1]}, {bg_color[2]})")
 
-        # 배경색과 비슷한 픽셀을 투명하게
+        try:
+            import numpy as np
+        except ImportError:
+            return self._remove_solid_background_pure(image, bg_color, tolerance)
+
+        # 배경색과의 차이 (채널별 절대값 합)
+        pixels = np.asarray(image, dtype=np.uint8)
+        rgb = pixels[:, :, :3].astype(np.int32)
+        diff = np.abs(rgb - np.array(bg_color, dtype=np.int32)).sum(axis=2)
+
+        # 경계 - 반투명 (부드러운 전환)
+        ramp = (255 * (diff - tolerance)) / (tolerance * 0.5)
+        ramp = np.clip(ramp, 0, 255).astype(np.uint8)
+
+        alpha = pixels[:, :, 3].copy()
+        edge = diff < tolerance * 1.5
+        alpha[edge] = ramp[edge]
+
+        # 배경색 - 완전 투명
+        alpha[diff < tolerance] = 0
+
+        if edge_blur > 0:
+            from PIL import ImageFilter
+
+            # 알파만 블러하고, 원래보다 불투명해지지 않도록 최소값 사용 (배경 번짐 방지)
+            blurred = Image.fromarray(alpha, "L").filter(ImageFilter.GaussianBlur(edge_blur))
+            alpha = np.minimum(alpha, np.asarray(blurred, dtype=np.uint8))
+
+        result = pixels.copy()
+        result[:, :, 3] = alpha
+        return Image.fromarray(result, "RGBA")
+
+    def _remove_solid_background_pure(
+        self,
+        image: Image.Image,
+        bg_color: Tuple[int, int, int],
+        tolerance: int
+    ) -> Image.Image:
+        """단색 배경 제거 - 순수 Python 구현 (NumPy 없을 때)"""
         data = list(image.getdata())
         new_data = []
 
@@ -266,16 +440,9 @@ class SceneCompositor:
                 print(f"  캐릭터 '{char_name}' 합성 중...")
 
                 try:
-                    # 캐릭터 이미지 로드
-                    char_image = self._load_image(char_path)
-
-                    # 배경 제거
-                    if remove_bg:
-                        char_image = self._remove_solid_background(char_image)
-
-                    # 크기 조정
+                    # 캐릭터 이미지 로드 + 배경 제거 + 크기 조정 (캐시)
                     size_preset = char.get("size", "medium")
-                    char_image = self._resize_character(char_image, bg_height, size_preset)
+                    char_image = self._prepare_character(char_path, bg_height, size_preset, remove_bg)
 
                     # 위치 결정
                     if char.get("position"):
@@ -344,7 +511,9 @@ class SceneCompositor:
         scenes: List[Dict],
         background_images: Dict[int, Dict],
         character_images: Dict[str, Dict],
-        on_progress=None
+        on_progress=None,
+        parallel: Optional[bool] = None,
+        max_workers: int = None
     ) -> List[Dict]:
         """
         모든 씬 자동 합성
@@ -354,11 +523,15 @@ class SceneCompositor:
             background_images: {scene_id: {"image_path": ...}}
             character_images: {character_name: {"image_path": ...}}
             on_progress: 진행 콜백 (current, total, result)
+            parallel: 파이프라인 모드 (캐릭터를 한 번만 준비한 뒤 프로세스 풀에서 씬 합성)
+                None이면 합성할 씬이 PARALLEL_MIN_SCENES개 이상일 때 자동 사용
+            max_workers: 파이프라인 모드 워커 수 (기본: CPU 코어 수)
 
         Returns:
-            합성 결과 목록
+            합성 결과 목록 (씬 순서)
         """
-        results = []
+        results: List[Optional[Dict]] = []
+        jobs: List[Tuple[int, int, Dict]] = []  # (results 인덱스, 씬 순번, composite_scene 인자)
         total = len(scenes)
 
         print(f"\n{'='*50}")
@@ -396,18 +569,27 @@ class SceneCompositor:
                         **char_info
                     })
 
-            # 합성
-            result = self.composite_scene(
-                background_path=bg_path,
-                characters=chars_for_scene,
-                scene_id=scene_id,
-                layout="auto"
-            )
+            jobs.append((len(results), i, {
+                "background_path": bg_path,
+                "characters": chars_for_scene,
+                "scene_id": scene_id,
+                "layout": "auto"
+            }))
+            results.append(None)
 
-            results.append(result)
+        if parallel is None:
+            parallel = len(jobs) >= self.PARALLEL_MIN_SCENES
 
-            if on_progress:
-                on_progress(i + 1, total, result)
+        if parallel and len(jobs) > 1:
+            self._composite_jobs_parallel(jobs, results, total, on_progress, max_workers)
+        else:
+            for index, i, job in jobs:
+                # 합성
+                result = self.composite_scene(**job)
+                results[index] = result
+
+                if on_progress:
+                    on_progress(i + 1, total, result)
 
         # 로그 저장
         log_path = self.output_dir / "compositing_log.json"
@@ -419,6 +601,84 @@ class SceneCompositor:
 
         return results
 
+    def _composite_jobs_parallel(
+        self,
+        jobs: List[Tuple[int, int, Dict]],
+        results: List[Optional[Dict]],
+        total: int,
+        on_progress=None,
+        max_workers: int = None
+    ):
+        """
+        파이프라인 합성
+
+        1. 메인 프로세스에서 씬에 쓰이는 (캐릭터, 크기, 배경 높이) 조합을 한 번씩 준비
+        2. 준비된 캐시를 워커 초기화 시 한 번만 전달하고, 씬 합성은 프로세스 풀에서 실행
+        """
+        start_time = time.time()
+
+        # 1. 캐릭터 준비 (조합당 1회)
+        bg_heights: Dict[str, int] = {}
+        for _, _, job in jobs:
+            bg_path = job["background_path"]
+            try:
+                if bg_path not in bg_heights:
+                    bg_heights[bg_path] = self._get_image_size(bg_path)[1]
+            except Exception as e:
+                print(f"  배경 크기 확인 실패 ({bg_path[:60]}): {e}")
+                continue
+
+            for char in job["characters"]:
+                char_path = char.get("image_path") or char.get("image_url")
+                try:
+                    self._prepare_character(
+                        char_path, bg_heights[bg_path], char.get("size", "medium"), True
+                    )
+                except Exception as e:
+                    print(f"  캐릭터 '{char.get('name', '')}' 준비 실패: {e}")
+
+        # 크기 조정까지 끝난 항목만 워커로 전달
+        cache_entries = [(key, image) for key, image in self._char_cache.items() if key[0] == "sized"]
+        print(f"  캐릭터 준비 완료: {len(cache_entries)}개 ({time.time() - start_time:.1f}초)")
+
+        # 2. 프로세스 풀 합성
+        workers = max_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(jobs)))
+        done = 0
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_composite_worker,
+            initargs=(str(self.output_dir), cache_entries, self.CHARACTER_CACHE_SIZE)
+        ) as executor:
+            futures = {
+                executor.submit(_composite_scene_job, index, job): (index, job)
+                for index, _, job in jobs
+            }
+
+            for future in as_completed(futures):
+                index, job = futures[future]
+                try:
+                    _, result = future.result()
+                except BrokenProcessPool:
+                    # 워커 프로세스가 죽으면 남은 씬은 메인 프로세스에서 합성
+                    result = self.composite_scene(**job)
+                except Exception as e:
+                    result = {
+                        "success": False,
+                        "scene_id": job["scene_id"],
+                        "is_composited": True,
+                        "error": str(e)
+                    }
+
+                results[index] = result
+                done += 1
+
+                if on_progress:
+                    on_progress(done, total, result)
+
+        print(f"  파이프라인 합성: {len(jobs)}개 씬, 워커 {workers}개, {time.time() - start_time:.1f}초")
+
     # ==================== AI 합성 메서드 ====================
 
     def composite_scene_with_ai(
@@ -588,12 +848,8 @@ class SceneCompositor:
                 print(f"    이유: {placement.reasoning[:50]}...")
 
                 try:
-                    # 캐릭터 이미지 로드
-                    char_image = self._load_image(char_path)
-
-                    # 배경 제거
-                    if remove_bg:
-                        char_image = self._remove_solid_background(char_image)
+                    # 캐릭터 이미지 로드 + 배경 제거 (캐시)
+                    char_image = self._get_character_base(char_path, remove_bg)
 
                     # 스케일 적용 (배경 높이 기준)
                     target_height = int(bg_height * placement.scale)
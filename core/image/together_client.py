@@ -14,6 +14,12 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from config.settings import TOGETHER_API_KEY, IMAGE_MODELS
+from utils.rate_limiter import (
+    get_rate_limit_config,
+    get_rate_limiter,
+    is_rate_limit_error,
+    map_rate_limited,
+)
 
 # 모델별 가격 정보 (USD/장)
 MODEL_PRICING = {
@@ -40,8 +46,8 @@ class TogetherImageClient:
 
     특징:
     - FLUX 모델 (Free, Schnell, Pro) 지원
-    - 배치 생성 지원
-    - 스마트 rate limit 관리
+    - 배치 생성 지원 (Rate limit 한도 안에서 병렬)
+    - 모델별 토큰 버킷 rate limit 관리 (utils.rate_limiter)
     - 실시간 로깅
     """
 
@@ -49,9 +55,6 @@ class TogetherImageClient:
     MAX_SIZE = 1792
     MIN_SIZE = 64
 
-    # Rate limit: Free 모델은 분당 10개 = 6초 간격
-    RATE_LIMIT_DELAY = 6.0
-
     def __init__(self, api_key: str = None):
         """
         Args:
@@ -62,7 +65,6 @@ class TogetherImageClient:
             raise ValueError("Together.ai API Key가 필요합니다. .env 파일을 확인하세요.")
 
         self.client = Together(api_key=self.api_key)
-        self._last_request_time = 0
 
     @classmethod
     def get_models(cls) -> List[Dict]:
@@ -75,17 +77,6 @@ class TogetherImageClient:
         height = max(self.MIN_SIZE, min(height, self.MAX_SIZE))
         return width, height
 
-    def _wait_for_rate_limit(self, model: str):
-        """Rate limit 대기 (필요한 경우에만)"""
-        if "Free" not in model:
-            return
-
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            wait_time = self.RATE_LIMIT_DELAY - elapsed
-            print(f"  [Rate limit] {wait_time:.1f}초 대기 중...")
-            time.sleep(wait_time)
-
     def generate_image(
         self,
         prompt: str,
@@ -155,7 +146,6 @@ class TogetherImageClient:
 
         try:
             response = self.client.images.generate(**kwargs)
-            self._last_request_time = time.time()
 
             # b64_json 우선 사용
             if response.data and response.data[0].b64_json:
@@ -206,7 +196,7 @@ class TogetherImageClient:
         on_progress: Optional[Callable[[int, int], None]] = None
     ) -> List[Dict]:
         """
-        배치 이미지 생성 - 속도 최적화
+        배치 이미지 생성 - 속도 최적화 (모델 Rate limit 한도 안에서 병렬)
 
         Args:
             prompts: 프롬프트 딕셔너리 리스트
@@ -218,17 +208,15 @@ class TogetherImageClient:
             height: 이미지 높이
             steps: 생성 단계
             seed: 랜덤 시드
-            on_progress: 진행 상황 콜백 함수
+            on_progress: 진행 상황 콜백 함수 (완료 수, total)
 
         Returns:
-            결과 딕셔너리 리스트
+            결과 딕셔너리 리스트 (프롬프트 순서)
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
         total = len(prompts)
-        is_free_model = "Free" in model
         batch_start_time = time.time()
 
         # 모델 가격 정보
@@ -248,7 +236,8 @@ class TogetherImageClient:
         print(f"[배치 생성] 📌 총 이미지: {total}개")
         print(f"{'='*60}\n")
 
-        for i, p in enumerate(prompts):
+        def generate_one(i: int) -> Dict:
+            p = prompts[i]
             item_start_time = time.time()
             filename = p.get("filename", f"{i+1:03d}.png")
 
@@ -261,10 +250,6 @@ class TogetherImageClient:
 
             print(f"[{i+1}/{total}] {filename}")
 
-            # Rate limit 대기 (첫 번째 이미지 제외, Free 모델만)
-            if i > 0 and is_free_model:
-                self._wait_for_rate_limit(model)
-
             try:
                 # 이미지 생성
                 gen_start = time.time()
@@ -284,30 +269,42 @@ class TogetherImageClient:
                     f.write(img_data)
 
                 item_total_time = time.time() - item_start_time
-                print(f"  -> 성공! (API: {gen_time:.1f}s, 총: {item_total_time:.1f}s, 크기: {len(img_data):,} bytes)")
+                print(f"  -> {filename} 성공! (API: {gen_time:.1f}s, 총: {item_total_time:.1f}s, 크기: {len(img_data):,} bytes)")
 
-                results.append({
+                return {
                     "filename": filename,
                     "status": "success",
                     "path": str(filepath),
                     "generation_time": gen_time,
                     "total_time": item_total_time
-                })
+                }
 
             except Exception as e:
                 item_total_time = time.time() - item_start_time
-                print(f"  -> 실패! ({item_total_time:.1f}s): {str(e)}")
+                print(f"  -> {filename} 실패! ({item_total_time:.1f}s): {str(e)}")
 
-                results.append({
+                return {
                     "filename": filename,
                     "status": "failed",
                     "error": str(e),
                     "total_time": item_total_time
-                })
+                }
+
+        # Rate limit 한도 안에서 병렬 생성 (Free 모델은 6초 간격 유지, 429면 백오프 후 재시도)
+        results: List[Optional[Dict]] = [None] * total
+        completed = 0
+        for index, result in map_rate_limited(
+            generate_one,
+            range(total),
+            get_rate_limiter("together", model),
+            is_throttled=lambda r: r["status"] == "failed" and is_rate_limit_error(r.get("error"))
+        ):
+            results[index] = result
+            completed += 1
 
             # 진행 상황 콜백
             if on_progress:
-                on_progress(i + 1, total)
+                on_progress(completed, total)
 
         # 최종 요약
         batch_total_time = time.time() - batch_start_time
@@ -342,12 +339,13 @@ class TogetherImageClient:
         예상 소요 시간 계산 (초)
 
         Free 모델: API ~15초 + rate limit 6초 = ~21초/개
-        유료 모델: API ~10초
+        유료 모델: API ~10초, 동시 요청 수만큼 병렬
         """
         if "Free" in model:
             return num_images * 21  # 보수적 추정
         else:
-            return num_images * 12
+            concurrency = get_rate_limit_config("together", model).get("concurrency", 1)
+            return -(-num_images // concurrency) * 12
 
     def get_model_info(self, model: str) -> Optional[Dict]:
         """모델 정보 조회"""
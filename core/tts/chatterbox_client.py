@@ -459,6 +459,20 @@ class ChatterboxTTSClient:
             logger.error(f"배치 TTS 생성 실패: {e}")
             return {"success": False, "error": str(e)}
 
+    def iter_batch(self, scenes: List[Dict], params: Dict, **kwargs):
+        """
+        파이프라인 배치 생성 - 청크 단위로 제출하고 완료된 씬부터 반환
+
+        generate_batch + download_file 순차 호출 대신, 다음 청크를 합성하는 동안
+        앞 청크 파일을 다운로드합니다. (utils.chatterbox_async.iter_batch_results_sync)
+
+        Yields:
+            완료 순서대로 {"index", "scene_id", "audio_data", "duration", "success", ...}
+        """
+        from utils.chatterbox_async import iter_batch_results_sync
+
+        return iter_batch_results_sync(scenes, params, base_url=self.base_url, **kwargs)
+
     # ============================================================
     # Voice Analysis API (음성 분석 & 자동 파라미터 추천)
     # ============================================================
@@ -3,19 +3,57 @@ Edge TTS 클라이언트
 
 Edge TTS를 활용한 음성 생성
 문단별 무음 패딩 자동 삽입
+씬 배치 생성 (동시 합성 + 전역 SRT)
 """
 import edge_tts
 import asyncio
+import io
+import subprocess
+import time
 from pathlib import Path
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from config.settings import TTS_VOICES, TTS_DEFAULT_RATE, TTS_DEFAULT_SILENCE_MS
 from core.tts.silence_padder import SilencePadder, ms_to_srt_time, srt_time_to_ms
+from utils.audio_concat import concat_audio
+
+# 배치 생성 기본 동시 요청 수
+EDGE_TTS_BATCH_CONCURRENCY = 4
+
+# Edge TTS 출력 형식 (audio-24khz-48kbitrate-mono-mp3)
+EDGE_TTS_SAMPLE_RATE = 24000
+
+
+def _decode_mp3(data: bytes):
+    """
+    MP3 바이트 → AudioSegment (FFmpeg 파이프로 PCM 직접 디코딩, 임시파일/ffprobe 없음)
+
+    파이프 실패 시 pydub 디코딩으로 폴백
+    """
+    from pydub import AudioSegment
+
+    cmd = [
+        "ffmpeg", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-ar", str(EDGE_TTS_SAMPLE_RATE), "pipe:1",
+    ]
+    try:
+        result = subprocess.run(cmd, input=data, capture_output=True, timeout=60)
+        if result.returncode == 0 and result.stdout:
+            return AudioSegment(
+                data=result.stdout,
+                sample_width=2,
+                frame_rate=EDGE_TTS_SAMPLE_RATE,
+                channels=1
+            )
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+    return AudioSegment.from_file(io.BytesIO(data), format="mp3")
 
 
 class EdgeTTSClient:
@@ -315,6 +353,176 @@ class EdgeTTSClient:
 
         return result
 
+    async def _stream_scene(
+        self,
+        text: str,
+        voice: str,
+        rate: str,
+        pitch: str,
+        volume: str
+    ) -> Tuple[bytes, List[Dict]]:
+        """
+        씬 1개 합성 - 오디오는 메모리 버퍼로, 경계 이벤트는 ms 단위 큐로 수집
+
+        Returns:
+            (MP3 바이트, [{"start_ms", "end_ms", "text"}, ...]) - 시간은 씬 시작 기준
+        """
+        communicate = edge_tts.Communicate(
+            text=text,
+            voice=voice,
+            rate=rate,
+            pitch=pitch,
+            volume=volume
+        )
+
+        audio = io.BytesIO()
+        cues = []
+
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                audio.write(chunk["data"])
+            elif chunk["type"] in ("WordBoundary", "SentenceBoundary"):
+                offset = chunk.get("offset", 0)
+                cues.append({
+                    "start_ms": offset / 10000,
+                    "end_ms": (offset + chunk.get("duration", 0)) / 10000,
+                    "text": chunk.get("text", "")
+                })
+
+        return audio.getvalue(), cues
+
+    @staticmethod
+    def _merge_scene_cues(
+        scene_cues: List[List[Dict]],
+        offsets_ms: List[int],
+        durations_ms: List[int]
+    ) -> List[Dict]:
+        """
+        씬별 자막 큐를 씬 시작 위치만큼 밀어 전역 타임라인으로 병합
+
+        각 큐의 끝은 해당 씬 오디오 끝을 넘지 않도록 자름
+        """
+        merged = []
+        for cues, offset, duration in zip(scene_cues, offsets_ms, durations_ms):
+            scene_end = offset + duration
+            for cue in cues:
+                start_ms = offset + cue["start_ms"]
+                if start_ms >= scene_end:
+                    continue
+                merged.append({
+                    "start_ms": int(round(start_ms)),
+                    "end_ms": int(round(min(offset + cue["end_ms"], scene_end))),
+                    "text": cue["text"]
+                })
+        return merged
+
+    async def generate_scenes_batch(
+        self,
+        scenes: List[str],
+        voice: str,
+        output_path: str,
+        rate: str = None,
+        pitch: str = "+0Hz",
+        volume: str = "+0%",
+        scene_gap_ms: int = 0,
+        max_concurrent: int = EDGE_TTS_BATCH_CONCURRENCY,
+        progress_callback: Optional[Callable] = None
+    ) -> Dict:
+        """
+        씬 배치 생성 - 씬들을 동시에 합성하고 하나의 오디오 + 전역 SRT로 병합
+
+        Args:
+            scenes: 씬 텍스트 리스트 (순서대로 이어붙임)
+            voice: 음성 ID
+            output_path: 출력 MP3 경로 (SRT는 같은 이름 .srt)
+            rate / pitch / volume: Edge TTS 설정
+            scene_gap_ms: 씬 사이 무음 (ms)
+            max_concurrent: 동시 합성 수 (Semaphore)
+            progress_callback: (current, total, message)
+
+        Returns:
+            {
+                "audio_path", "srt_path",
+                "scene_offsets_ms": 씬 시작 위치, "scene_durations_ms": 씬 길이,
+                "failed_scenes": [{"index", "error"}], "elapsed": float
+            }
+        """
+        rate = rate or TTS_DEFAULT_RATE
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        srt_path = output_path.with_suffix(".srt")
+
+        total = len(scenes)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        completed = 0
+        start_time = time.time()
+
+        async def synthesize(index: int, text: str):
+            nonlocal completed
+            if not text.strip():
+                return b"", [], None
+
+            async with semaphore:
+                try:
+                    audio_data, cues = await self._stream_scene(text, voice, rate, pitch, volume)
+                    error = None if audio_data else "오디오 없음"
+                except Exception as e:
+                    audio_data, cues, error = b"", [], str(e)
+
+            completed += 1
+            if progress_callback:
+                try:
+                    progress_callback(completed, total, f"씬 {index + 1} 합성 완료 ({completed}/{total})")
+                except Exception:
+                    pass
+            return audio_data, cues, error
+
+        outputs = await asyncio.gather(*(synthesize(i, text) for i, text in enumerate(scenes)))
+
+        # 디코딩 (실패한 씬은 길이 0으로 자리만 유지)
+        from pydub import AudioSegment
+
+        segments = []
+        scene_cues = []
+        failed = []
+        for index, (audio_data, cues, error) in enumerate(outputs):
+            segment = AudioSegment.empty()
+            if audio_data:
+                try:
+                    segment = _decode_mp3(audio_data)
+                except Exception as e:
+                    error = f"디코딩 실패: {e}"
+                    cues = []
+            if error:
+                failed.append({"index": index, "error": error})
+                print(f"[EdgeTTS] 씬 {index + 1} 실패: {error}")
+            segments.append(segment)
+            scene_cues.append(cues)
+
+        # 한 번의 병합 + 씬 시작 위치
+        combined, offsets_ms = concat_audio(segments, scene_gap_ms)
+        durations_ms = [len(segment) for segment in segments]
+        combined.export(str(output_path), format="mp3")
+
+        self._write_srt(self._merge_scene_cues(scene_cues, offsets_ms, durations_ms), srt_path)
+
+        elapsed = time.time() - start_time
+        print(f"[EdgeTTS] 배치 완료: {total - len(failed)}/{total}개 씬, "
+              f"{len(combined) / 1000:.1f}초 오디오, {elapsed:.1f}초 소요 (동시 {max_concurrent}개)")
+
+        return {
+            "audio_path": str(output_path),
+            "srt_path": str(srt_path),
+            "scene_offsets_ms": offsets_ms,
+            "scene_durations_ms": durations_ms,
+            "failed_scenes": failed,
+            "elapsed": elapsed
+        }
+
+    def generate_scenes_batch_sync(self, *args, **kwargs) -> Dict:
+        """generate_scenes_batch 동기 래퍼 (이벤트 루프 1개에서 전체 배치 실행)"""
+        return run_async(self.generate_scenes_batch(*args, **kwargs))
+
     def _parse_srt(self, srt_path: Path) -> List[Dict]:
         """
         SRT 파일 파싱
@@ -16,6 +16,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from config.settings import TTS_DEFAULT_SILENCE_MS
+from utils.audio_concat import insert_silences
 
 
 class SilencePadder:
@@ -104,25 +105,12 @@ class SilencePadder:
         # 오디오 로드
         audio = AudioSegment.from_file(audio_path)
 
-        # 타이밍 역순 정렬 (뒤에서부터 삽입해야 앞의 타이밍이 밀리지 않음)
-        sorted_timings = sorted(
-            paragraph_timings,
-            key=lambda x: x["time_ms"],
-            reverse=True
-        )
-
-        # 각 문단 구분점에 무음 삽입
-        for timing in sorted_timings:
-            insert_point = timing["time_ms"]
-            silence_ms = timing.get("silence_ms", self.silence_duration)
-
-            # 무음 생성
-            silence = AudioSegment.silent(duration=silence_ms)
-
-            # 오디오 분할 후 무음 삽입
-            before = audio[:insert_point]
-            after = audio[insert_point:]
-            audio = before + silence + after
+        # 원본 기준 삽입 위치 목록 → 한 번의 병합으로 무음 삽입
+        insertions = [
+            (timing["time_ms"], timing.get("silence_ms", self.silence_duration))
+            for timing in paragraph_timings
+        ]
+        audio = insert_silences(audio, insertions)
 
         # 저장
         output = output_path or audio_path
@@ -23,13 +23,28 @@ YouTube API 캐싱 시스템
     result = youtube.search().list(...).execute()
     cache.set("search", {"keyword": "...", "region": "KR"}, result)
     cache.log_api_call("search")  # 할당량 추적
+
+    # 여러 건을 한 번에 조회 / 한 트랜잭션으로 저장
+    hits, misses = cache.get_many("videos", [{"video_id": vid} for vid in video_ids])
+    cache.set_many("videos", [({"video_id": vid}, data), ...])
+
+연결 정책:
+- 스레드별 SQLite 연결을 재사용 (WAL 모드)
+- 최근 조회한 키는 프로세스 내 LRU에서 바로 반환 (Streamlit 재실행 시 디스크 접근 없음)
+
+저장 정책:
+- 데이터는 압축된 JSON 바이너리로 저장 (codec 컬럼으로 형식 구분, 기존 텍스트 행도 그대로 읽음)
+- DB 사용 용량이 MAX_DB_SIZE_MB를 넘으면 마지막 접근이 오래된 항목부터 삭제
 """
 import sqlite3
 import json
 import hashlib
+import threading
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -37,6 +52,73 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.settings import CACHE_DIR, YOUTUBE_DAILY_QUOTA
 from config.constants import CACHE_DURATION_HOURS
 
+# zstd 압축 (선택)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+
+# === 페이로드 코덱 ===
+# 새 코덱을 추가할 때는 번호를 새로 부여하고 기존 번호는 절대 재사용하지 않습니다.
+CODEC_JSON_TEXT = 0   # 레거시: 압축 없는 JSON 텍스트
+CODEC_JSON_ZLIB = 1   # zlib 압축 JSON
+CODEC_JSON_ZSTD = 2   # zstd 압축 JSON (zstandard 설치 시)
+
+DEFAULT_CODEC = CODEC_JSON_ZSTD if HAS_ZSTD else CODEC_JSON_ZLIB
+
+
+def encode_payload(text: str, codec: int = DEFAULT_CODEC) -> Any:
+    """
+    JSON 텍스트를 저장용 페이로드로 인코딩
+
+    Args:
+        text: 직렬화된 JSON 문자열
+        codec: 코덱 번호
+
+    Returns:
+        DB에 저장할 값 (str 또는 bytes)
+    """
+    if codec == CODEC_JSON_TEXT:
+        return text
+    if codec == CODEC_JSON_ZLIB:
+        return zlib.compress(text.encode("utf-8"), 6)
+    if codec == CODEC_JSON_ZSTD:
+        if not HAS_ZSTD:
+            raise ValueError("zstandard가 설치되지 않았습니다. pip install zstandard")
+        return zstandard.ZstdCompressor(level=3).compress(text.encode("utf-8"))
+    raise ValueError(f"알 수 없는 캐시 코덱: {codec}")
+
+
+def decode_payload(data: Any, codec: int) -> str:
+    """
+    저장된 페이로드를 JSON 텍스트로 디코딩
+
+    Args:
+        data: DB에서 읽은 값
+        codec: 행에 기록된 코덱 번호 (NULL이면 레거시 텍스트)
+
+    Returns:
+        JSON 문자열
+    """
+    if not codec:
+        return data if isinstance(data, str) else bytes(data).decode("utf-8")
+    if codec == CODEC_JSON_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == CODEC_JSON_ZSTD:
+        if not HAS_ZSTD:
+            raise ValueError("zstandard가 설치되지 않았습니다. pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"알 수 없는 캐시 코덱: {codec}")
+
+
+# 디코딩 실패로 보는 예외 (zstd 미설치 환경에서 zstd 행, 손상된 압축 데이터 등)
+_DECODE_ERRORS: Tuple[type, ...] = (ValueError, zlib.error)
+if HAS_ZSTD:
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
 
 class YouTubeCache:
     """
@@ -52,6 +134,7 @@ class YouTubeCache:
         "videos": timedelta(hours=CACHE_DURATION_HOURS.get("videos", 24)),
         "channels": timedelta(hours=CACHE_DURATION_HOURS.get("channels", 168)),
         "comments": timedelta(hours=CACHE_DURATION_HOURS.get("comments", 6)),
+        "trend_channels": timedelta(hours=CACHE_DURATION_HOURS.get("trend_channels", 24)),
     }
 
     # API 호출 비용 (포인트)
@@ -62,19 +145,122 @@ class YouTubeCache:
         "comments": 1,
     }
 
-    def __init__(self, cache_dir: Path = None):
+    # 프로세스 내 LRU 최대 항목 수
+    MEMORY_CACHE_SIZE = 512
+
+    # DB 최대 사용 용량 (MB, 0이면 무제한)
+    MAX_DB_SIZE_MB = 200
+
+    # 용량 초과 시 목표 비율 (한 번에 여유를 두고 정리)
+    EVICT_TARGET_RATIO = 0.8
+
+    # 용량 검사 주기 - 저장 횟수 또는 추정 증가량 (한도의 비율) 중 먼저 도달하는 쪽
+    SIZE_CHECK_EVERY_WRITES = 200
+    SIZE_CHECK_GROWTH_RATIO = 0.02
+
+    # 행당 추정 오버헤드 (키/인덱스/타임스탬프, 바이트)
+    ROW_OVERHEAD_BYTES = 200
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        memory_cache_size: int = None,
+        max_db_size_mb: float = None,
+        codec: int = None
+    ):
         """
         Args:
             cache_dir: 캐시 디렉토리 경로 (기본: data/cache)
+            memory_cache_size: 메모리 LRU 최대 항목 수 (0이면 비활성화)
+            max_db_size_mb: DB 최대 사용 용량 (기본: MAX_DB_SIZE_MB)
+            codec: 저장 코덱 (기본: DEFAULT_CODEC)
         """
         self.cache_dir = cache_dir or CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.cache_dir / "youtube_cache.db"
+
+        # 스레드별 연결 풀
+        self._local = threading.local()
+
+        # 메모리 LRU: cache_key -> (expires_at, 직렬화된 데이터)
+        self.memory_cache_size = (
+            self.MEMORY_CACHE_SIZE if memory_cache_size is None else memory_cache_size
+        )
+        self._memory: "OrderedDict[str, Tuple[datetime, str]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+        self.max_db_size_mb = (
+            self.MAX_DB_SIZE_MB if max_db_size_mb is None else max_db_size_mb
+        )
+        self.codec = DEFAULT_CODEC if codec is None else codec
+
+        # 마지막 용량 검사 이후 저장 횟수/추정 증가 바이트 (첫 저장 시 한 번 검사)
+        self._size_check_lock = threading.Lock()
+        self._writes_since_size_check = self.SIZE_CHECK_EVERY_WRITES
+        self._bytes_since_size_check = 0
+
         self._init_db()
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 SQLite 연결 반환 (없으면 생성)
+
+        WAL 모드로 열어 읽기와 쓰기가 서로 막지 않도록 합니다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # === 메모리 LRU ===
+
+    def _memory_get(self, cache_key: str) -> Optional[str]:
+        """메모리 LRU 조회 (만료 시 제거)"""
+        if self.memory_cache_size <= 0:
+            return None
+
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= datetime.now():
+                del self._memory[cache_key]
+                return None
+
+            self._memory.move_to_end(cache_key)
+            return payload
+
+    def _memory_put(self, cache_key: str, expires_at: datetime, payload: str):
+        """메모리 LRU 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        if self.memory_cache_size <= 0:
+            return
+
+        with self._memory_lock:
+            self._memory[cache_key] = (expires_at, payload)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.memory_cache_size:
+                self._memory.popitem(last=False)
+
+    def _memory_clear(self):
+        """메모리 LRU 비우기"""
+        with self._memory_lock:
+            self._memory.clear()
+
     def _init_db(self):
         """캐시 DB 초기화"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         # 캐시 테이블
@@ -88,6 +274,18 @@ class YouTubeCache:
             )
         """)
 
+        # 코덱/마지막 접근 컬럼 (기존 DB 마이그레이션)
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(cache)")}
+        if "codec" not in columns:
+            cursor.execute("ALTER TABLE cache ADD COLUMN codec INTEGER")
+        if "last_accessed" not in columns:
+            cursor.execute("ALTER TABLE cache ADD COLUMN last_accessed TIMESTAMP")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cache_last_accessed
+            ON cache (last_accessed)
+        """)
+
         # 할당량 로그 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS quota_log (
@@ -105,7 +303,6 @@ class YouTubeCache:
         """)
 
         conn.commit()
-        conn.close()
 
     def _generate_cache_key(self, cache_type: str, params: Dict) -> str:
         """캐시 키 생성"""
@@ -126,21 +323,131 @@ class YouTubeCache:
         """
         cache_key = self._generate_cache_key(cache_type, params)
 
-        conn = sqlite3.connect(self.db_path)
+        payload = self._memory_get(cache_key)
+        if payload is not None:
+            return json.loads(payload)
+
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
-            SELECT data FROM cache
+            SELECT data, codec, expires_at FROM cache
             WHERE cache_key = ? AND cache_type = ? AND expires_at > datetime('now')
         """, (cache_key, cache_type))
 
         row = cursor.fetchone()
-        conn.close()
 
         if row:
-            return json.loads(row[0])
+            payload = self._decode_row(conn, cache_key, row[0], row[1])
+            if payload is None:
+                return None
+            self._memory_put(cache_key, self._parse_expires_at(row[2]), payload)
+            self._touch(conn, [cache_key])
+            return json.loads(payload)
         return None
 
+    def _decode_row(self, conn: sqlite3.Connection, cache_key: str, data: Any, codec: int) -> Optional[str]:
+        """
+        DB 행 디코딩 - 실패하면 캐시 미스로 처리하고 행 삭제
+
+        (zstd가 설치된 환경에서 만든 DB를 zstd 없는 환경에서 열 때 등)
+        """
+        try:
+            return decode_payload(data, codec)
+        except _DECODE_ERRORS as e:
+            print(f"[YouTubeCache] 캐시 항목 디코딩 실패, 미스로 처리: {cache_key} ({e})")
+            with conn:
+                conn.execute("DELETE FROM cache WHERE cache_key = ?", (cache_key,))
+            return None
+
+    def _touch(self, conn: sqlite3.Connection, cache_keys: List[str]):
+        """디스크에서 읽은 항목의 마지막 접근 시각 갱신 (용량 기반 LRU용)"""
+        if not cache_keys:
+            return
+
+        now = datetime.now()
+        with conn:
+            for i in range(0, len(cache_keys), self._MAX_IN_PARAMS):
+                chunk = cache_keys[i:i + self._MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(
+                    f"UPDATE cache SET last_accessed = ? WHERE cache_key IN ({placeholders})",
+                    (now, *chunk)
+                )
+
+    # SQLite 바인딩 변수 한도(999) 이내로 IN 절 분할
+    _MAX_IN_PARAMS = 500
+
+    def get_many(
+        self, cache_type: str, params_list: List[Dict]
+    ) -> Tuple[List[Tuple[Dict, Any]], List[Dict]]:
+        """
+        여러 캐시 키를 한 번의 쿼리로 조회
+
+        Args:
+            cache_type: 캐시 타입
+            params_list: 캐시 키 생성용 파라미터 리스트
+
+        Returns:
+            (hits, misses)
+            - hits: (params, data) 튜플 리스트 (입력 순서 유지)
+            - misses: 캐시에 없거나 만료된 params 리스트 (입력 순서 유지)
+        """
+        keys = [self._generate_cache_key(cache_type, p) for p in params_list]
+        payloads: Dict[str, str] = {}
+
+        # 1. 메모리 LRU
+        disk_keys = []
+        for key in keys:
+            payload = self._memory_get(key)
+            if payload is not None:
+                payloads[key] = payload
+            elif key not in disk_keys:
+                disk_keys.append(key)
+
+        # 2. 나머지는 IN 쿼리로 한 번에 조회
+        if disk_keys:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+            found_keys = []
+            for i in range(0, len(disk_keys), self._MAX_IN_PARAMS):
+                chunk = disk_keys[i:i + self._MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT cache_key, data, codec, expires_at FROM cache
+                    WHERE cache_key IN ({placeholders})
+                      AND cache_type = ? AND expires_at > datetime('now')
+                """, (*chunk, cache_type))
+
+                for cache_key, data, codec, expires_at in cursor.fetchall():
+                    payload = self._decode_row(conn, cache_key, data, codec)
+                    if payload is None:
+                        continue
+                    payloads[cache_key] = payload
+                    found_keys.append(cache_key)
+                    self._memory_put(cache_key, self._parse_expires_at(expires_at), payload)
+
+            self._touch(conn, found_keys)
+
+        hits = []
+        misses = []
+        for params, key in zip(params_list, keys):
+            if key in payloads:
+                hits.append((params, json.loads(payloads[key])))
+            else:
+                misses.append(params)
+
+        return hits, misses
+
+    def _parse_expires_at(self, value: Any) -> datetime:
+        """DB에 저장된 만료 시각을 datetime으로 변환"""
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            return datetime.now()
+
     def set(self, cache_type: str, params: Dict, data: Any):
         """
         캐시에 데이터 저장
@@ -150,20 +457,133 @@ class YouTubeCache:
             params: 캐시 키 생성용 파라미터
             data: 저장할 데이터
         """
-        cache_key = self._generate_cache_key(cache_type, params)
+        self.set_many(cache_type, [(params, data)])
+
+    def set_many(self, cache_type: str, items: List[Tuple[Dict, Any]]):
+        """
+        여러 캐시 항목을 한 트랜잭션으로 저장
+
+        Args:
+            cache_type: 캐시 타입
+            items: (params, data) 튜플 리스트
+        """
+        if not items:
+            return
+
+        now = datetime.now()
         duration = self.CACHE_DURATIONS.get(cache_type, timedelta(hours=24))
-        expires_at = datetime.now() + duration
+        expires_at = now + duration
+
+        rows = []
+        payloads = []
+        written_bytes = 0
+        for params, data in items:
+            cache_key = self._generate_cache_key(cache_type, params)
+            payload = json.dumps(data, ensure_ascii=False)
+            payloads.append((cache_key, payload))
+            encoded = encode_payload(payload, self.codec)
+            written_bytes += len(encoded) + self.ROW_OVERHEAD_BYTES
+            rows.append((
+                cache_key, cache_type, encoded,
+                self.codec, expires_at, now
+            ))
+
+        conn = self._get_conn()
+        with conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO cache
+                    (cache_key, cache_type, data, codec, expires_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+
+        for cache_key, payload in payloads:
+            self._memory_put(cache_key, expires_at, payload)
+
+        if self._size_check_due(written_bytes):
+            self.enforce_size_limit()
+
+    def _size_check_due(self, written_bytes: int) -> bool:
+        """
+        용량 검사가 필요한지 (PRAGMA 3회를 매 저장마다 하지 않도록)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        SIZE_CHECK_EVERY_WRITES번 저장했거나 추정 증가량이 한도의
+        SIZE_CHECK_GROWTH_RATIO를 넘으면 True (카운터 초기화)
+        """
+        if not self.max_db_size_mb or self.max_db_size_mb <= 0:
+            return False
+
+        growth_limit = self.max_db_size_mb * 1024 * 1024 * self.SIZE_CHECK_GROWTH_RATIO
+        with self._size_check_lock:
+            self._writes_since_size_check += 1
+            self._bytes_since_size_check += written_bytes
+            if (self._writes_since_size_check < self.SIZE_CHECK_EVERY_WRITES
+                    and self._bytes_since_size_check < growth_limit):
+                return False
+            self._writes_since_size_check = 0
+            self._bytes_since_size_check = 0
+        return True
+
+    def get_db_size_bytes(self) -> int:
+        """
+        DB 사용 용량 조회 (빈 페이지 제외)
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache (cache_key, cache_type, data, expires_at)
-            VALUES (?, ?, ?, ?)
-        """, (cache_key, cache_type, json.dumps(data, ensure_ascii=False), expires_at))
+        Returns:
+            사용 중인 바이트 수
+        """
+        conn = self._get_conn()
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return (page_count - freelist) * page_size
+
+    def enforce_size_limit(self) -> int:
+        """
+        DB 사용 용량이 max_db_size_mb를 넘으면 마지막 접근이 오래된 항목부터 삭제
+
+        삭제된 페이지는 파일을 줄이지 않고 이후 저장에 재사용됩니다.
+
+        Returns:
+            삭제된 항목 수
+        """
+        if not self.max_db_size_mb or self.max_db_size_mb <= 0:
+            return 0
+
+        limit = int(self.max_db_size_mb * 1024 * 1024)
+        used = self.get_db_size_bytes()
+        if used <= limit:
+            return 0
+
+        conn = self._get_conn()
+        cursor = conn.cursor()
 
+        # 만료 항목 먼저 정리
+        cursor.execute("DELETE FROM cache WHERE expires_at < datetime('now')")
+        deleted = cursor.rowcount
         conn.commit()
-        conn.close()
+
+        # 행 크기 비율로 삭제할 양을 추정해 LRU 순으로 삭제
+        target = int(limit * self.EVICT_TARGET_RATIO)
+        while self.get_db_size_bytes() > target:
+            total_rows = cursor.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            if total_rows == 0:
+                break
+
+            used = self.get_db_size_bytes()
+            batch = max(1, int(total_rows * (used - target) / used))
+            cursor.execute("""
+                DELETE FROM cache WHERE cache_key IN (
+                    SELECT cache_key FROM cache
+                    ORDER BY COALESCE(last_accessed, created_at) ASC
+                    LIMIT ?
+                )
+            """, (batch,))
+            deleted += cursor.rowcount
+            conn.commit()
+
+        if deleted:
+            self._memory_clear()
+
+        return deleted
 
     def log_api_call(self, cache_type: str):
         """
@@ -175,7 +595,7 @@ class YouTubeCache:
         cost = self.API_COSTS.get(cache_type, 1)
         today = datetime.now().strftime("%Y-%m-%d")
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -184,7 +604,6 @@ class YouTubeCache:
         """, (today, cache_type, cost))
 
         conn.commit()
-        conn.close()
 
     def get_quota_used_today(self) -> int:
         """
@@ -195,7 +614,7 @@ class YouTubeCache:
         """
         today = datetime.now().strftime("%Y-%m-%d")
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -203,7 +622,6 @@ class YouTubeCache:
         """, (today,))
 
         result = cursor.fetchone()
-        conn.close()
 
         return result[0] if result else 0
 
@@ -249,7 +667,7 @@ class YouTubeCache:
                 "comments": 20
             }
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -260,7 +678,6 @@ class YouTubeCache:
         """)
 
         stats = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
 
         return stats
 
@@ -274,7 +691,7 @@ class YouTubeCache:
         Returns:
             일별 호출 통계 리스트
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -286,7 +703,6 @@ class YouTubeCache:
         """, (f"-{days} days",))
 
         results = cursor.fetchall()
-        conn.close()
 
         history = []
         for row in results:
@@ -300,36 +716,35 @@ class YouTubeCache:
 
     def clear_expired(self):
         """만료된 캐시 삭제"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("DELETE FROM cache WHERE expires_at < datetime('now')")
         deleted = cursor.rowcount
 
         conn.commit()
-        conn.close()
+        self._memory_clear()
 
         return deleted
 
     def clear_all(self):
         """모든 캐시 삭제"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("DELETE FROM cache")
 
         conn.commit()
-        conn.close()
+        self._memory_clear()
 
     def clear_quota_log(self):
         """할당량 로그 초기화 (주의: 테스트용)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("DELETE FROM quota_log")
 
         conn.commit()
-        conn.close()
 
 
 # === 싱글톤 인스턴스 ===
@@ -8,10 +8,13 @@ YouTube API는 채널 생성일 기준 검색이 안 되므로,
 """
 import os
 import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
-from collections import Counter
+from dataclasses import dataclass, field, replace
+from collections import Counter, defaultdict
 from dateutil import parser
 import hashlib
 
@@ -142,6 +145,11 @@ class TrendAnalysisResult:
     # AI 인사이트
     ai_insight: str = ""
 
+    # 단계별 소요 시간 (초) - 캐시에는 저장하지 않음
+    # {"search": 검색 페이지네이션, "channels_fetch": 채널 배치 요청 합계,
+    #  "channels_wait": 검색 종료 후 남은 채널 배치 대기, "analysis": 필터링/관련성, "total": 전체}
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
     def calculate_summary(self):
         """요약 통계 및 시장 기회 지표 계산"""
         if self.new_channels:
@@ -215,6 +223,12 @@ class TrendAnalysisResult:
 class ChannelTrendAnalyzer:
     """채널 트렌드 분석기"""
 
+    # 채널 상세 조회 동시 요청 수 (검색 페이지네이션과 병행)
+    CHANNEL_FETCH_WORKERS = 4
+
+    # 키워드 일괄 분석 시 채널 정보 공유 저장소 (YouTubeCache 캐시 타입)
+    CHANNEL_STORE_TYPE = "trend_channels"
+
     def __init__(self, api_key: str = None, cache_dir: str = "data/cache/channel_trends"):
         """
         Args:
@@ -232,6 +246,39 @@ class ChannelTrendAnalyzer:
         self.cache_expiry_days = 7
         self._cache = get_cache()
 
+        # 워커 스레드별 YouTube 클라이언트 (httplib2는 스레드 안전하지 않음)
+        self._thread_local = threading.local()
+
+    def _get_thread_youtube(self):
+        """현재 워커 스레드 전용 YouTube 클라이언트 반환"""
+        youtube = getattr(self._thread_local, "youtube", None)
+        if youtube is None:
+            youtube = build('youtube', 'v3', developerKey=self.api_key)
+            self._thread_local.youtube = youtube
+        return youtube
+
+    def _fetch_channel_batch(self, batch_ids: List[str]) -> Tuple[List[dict], float, Optional[str]]:
+        """
+        채널 상세 정보 배치 조회 (워커 스레드에서 실행)
+
+        Returns:
+            (채널 아이템 리스트, 소요 시간(초), 오류 메시지 또는 None)
+        """
+        start = time.perf_counter()
+        try:
+            channels_response = self._get_thread_youtube().channels().list(
+                part="snippet,statistics",
+                id=",".join(batch_ids)
+            ).execute()
+
+            # 할당량 기록
+            self._cache.log_api_call("channels")
+
+            return channels_response.get('items', []), time.perf_counter() - start, None
+
+        except Exception as e:
+            return [], time.perf_counter() - start, str(e)
+
     def _get_cache_key(self, keyword: str, region: str, months: int) -> str:
         """캐시 키 생성"""
         key_str = f"trend_{keyword}_{region}_{months}"
@@ -291,53 +338,103 @@ class ChannelTrendAnalyzer:
                 progress_callback(msg)
             print(f"[ChannelTrend] {msg}")
 
+        total_start = time.perf_counter()
+        timings: Dict[str, float] = {}
+
         # 캐시 확인
         cache_key = self._get_cache_key(keyword, region, months)
         if use_cache:
             cached = self._get_cached_result(cache_key)
             if cached:
                 update_progress("캐시된 결과 사용")
-                return self._dict_to_result(cached)
+                result = self._dict_to_result(cached)
+                result.stage_timings = {"cache": round(time.perf_counter() - total_start, 3)}
+                return result
 
         # 1. 기준 날짜 설정
         cutoff_date = datetime.now() - timedelta(days=months * 30)
         published_after = cutoff_date.isoformat() + "Z"
 
-        # 2. 최근 영상 검색 (Step 1)
+        # 2. 최근 영상 검색 (Step 1) + 채널 ID 추출 (Step 2) + 채널 상세 조회 (Step 3)
+        # 검색 페이지가 도착할 때마다 새 채널 ID를 모아 50개 단위로 워커에 넘겨,
+        # 채널 조회가 다음 검색 페이지 요청과 겹쳐서 진행되도록 함
         update_progress(f"키워드 '{keyword}' 영상 검색 중...")
 
         all_videos = []
         next_page_token = None
+        channel_ids: List[str] = []
+        seen_channel_ids = set()
+        pending_ids: List[str] = []
+        futures = []
+
+        search_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.CHANNEL_FETCH_WORKERS) as executor:
+            while len(all_videos) < max_videos:
+                try:
+                    search_response = self.youtube.search().list(
+                        q=keyword,
+                        part="snippet",
+                        type="video",
+                        order="date",  # 최신순
+                        publishedAfter=published_after,
+                        regionCode=region,
+                        maxResults=min(50, max_videos - len(all_videos)),
+                        pageToken=next_page_token
+                    ).execute()
+
+                    # 할당량 기록
+                    self._cache.log_api_call("search")
+
+                    items = search_response.get('items', [])
+                    all_videos.extend(items)
+                    next_page_token = search_response.get('nextPageToken')
+
+                    for item in items:
+                        cid = item['snippet'].get('channelId')
+                        if cid and cid not in seen_channel_ids:
+                            seen_channel_ids.add(cid)
+                            channel_ids.append(cid)
+                            pending_ids.append(cid)
+
+                    while len(pending_ids) >= 50:
+                        futures.append(executor.submit(self._fetch_channel_batch, pending_ids[:50]))
+                        pending_ids = pending_ids[50:]
+
+                    if not next_page_token:
+                        break
 
-        while len(all_videos) < max_videos:
-            try:
-                search_response = self.youtube.search().list(
-                    q=keyword,
-                    part="snippet",
-                    type="video",
-                    order="date",  # 최신순
-                    publishedAfter=published_after,
-                    regionCode=region,
-                    maxResults=min(50, max_videos - len(all_videos)),
-                    pageToken=next_page_token
-                ).execute()
-
-                # 할당량 기록
-                self._cache.log_api_call("search")
-
-                all_videos.extend(search_response.get('items', []))
-                next_page_token = search_response.get('nextPageToken')
-
-                if not next_page_token:
+                except Exception as e:
+                    update_progress(f"영상 검색 오류: {e}")
                     break
 
-            except Exception as e:
-                update_progress(f"영상 검색 오류: {e}")
-                break
+            timings["search"] = time.perf_counter() - search_start
+            update_progress(f"총 {len(all_videos)}개 영상 검색됨")
+
+            if pending_ids:
+                futures.append(executor.submit(self._fetch_channel_batch, pending_ids))
+                pending_ids = []
 
-        update_progress(f"총 {len(all_videos)}개 영상 검색됨")
+            if channel_ids:
+                update_progress(f"고유 채널 {len(channel_ids)}개 발견")
+                update_progress("채널 정보 조회 중...")
+
+            wait_start = time.perf_counter()
+            wait(futures)
+            timings["channels_wait"] = time.perf_counter() - wait_start
+
+        # 배치 제출 순서대로 결과 수집 (오류는 메인 스레드에서 보고)
+        all_channel_data = []
+        channels_fetch_time = 0.0
+        for future in futures:
+            items, elapsed, error = future.result()
+            channels_fetch_time += elapsed
+            if error:
+                update_progress(f"채널 조회 오류: {error}")
+            all_channel_data.extend(items)
+        timings["channels_fetch"] = channels_fetch_time
 
         if not all_videos:
+            timings["total"] = time.perf_counter() - total_start
             return TrendAnalysisResult(
                 keyword=keyword,
                 region=region,
@@ -347,128 +444,348 @@ class ChannelTrendAnalyzer:
                 unique_channels_found=0,
                 new_channels_count=0,
                 new_channels=[],
-                monthly_trend={}
+                monthly_trend={},
+                stage_timings={k: round(v, 3) for k, v in timings.items()}
             )
 
-        # 3. 채널 ID 추출 (Step 2)
-        channel_ids = list(set([
-            item['snippet']['channelId']
-            for item in all_videos
-            if 'channelId' in item['snippet']
-        ]))
+        # 5. 채널 생성일 필터링 + 키워드 관련성 계산 (Step 4) - 핵심!
+        update_progress("신규 채널 필터링 및 관련성 분석 중...")
+        analysis_start = time.perf_counter()
+        new_channels: List[NewChannel] = []
 
-        update_progress(f"고유 채널 {len(channel_ids)}개 발견")
+        # 키워드 변형 준비 (관련성 검사용)
+        keyword_variants = self._get_keyword_variants(keyword)
 
-        # 4. 채널 상세 정보 조회 (Step 3)
-        update_progress("채널 정보 조회 중...")
-        all_channel_data = []
+        for ch in all_channel_data:
+            new_channel = self._parse_new_channel(ch, cutoff_date)
+            if new_channel is None:
+                continue
 
-        for i in range(0, len(channel_ids), 50):
-            batch_ids = channel_ids[i:i+50]
+            # ⭐ 키워드 관련성 계산 (핵심!)
+            self._apply_relevance(new_channel, keyword_variants)
+            new_channels.append(new_channel)
 
-            try:
-                channels_response = self.youtube.channels().list(
-                    part="snippet,statistics",
-                    id=",".join(batch_ids)
-                ).execute()
+        # 6~7. 결과 정렬 및 생성
+        result = self._build_trend_result(
+            keyword=keyword,
+            region=region,
+            months=months,
+            total_videos=len(all_videos),
+            unique_channels=len(channel_ids),
+            new_channels=new_channels
+        )
 
-                # 할당량 기록
-                self._cache.log_api_call("channels")
+        # 관련성 통계 로깅
+        relevant_count = len([c for c in new_channels if c.keyword_relevant])
+        update_progress(f"신규 채널 {len(new_channels)}개 발견 (키워드 관련: {relevant_count}개)")
 
-                all_channel_data.extend(channels_response.get('items', []))
+        timings["analysis"] = time.perf_counter() - analysis_start
 
-            except Exception as e:
-                update_progress(f"채널 조회 오류: {e}")
+        # 캐싱
+        self._save_cache(cache_key, self._result_to_dict(result))
 
-        # 5. 채널 생성일 필터링 + 키워드 관련성 계산 (Step 4) - 핵심!
-        update_progress("신규 채널 필터링 및 관련성 분석 중...")
-        new_channels: List[NewChannel] = []
-        monthly_counter = Counter()
+        timings["total"] = time.perf_counter() - total_start
+        result.stage_timings = {k: round(v, 3) for k, v in timings.items()}
+        update_progress(
+            "단계별 소요 시간: " + ", ".join(f"{k} {v:.2f}s" for k, v in result.stage_timings.items())
+        )
 
-        # 키워드 변형 준비 (관련성 검사용)
-        keyword_lower = keyword.lower()
-        keyword_variants = self._get_keyword_variants(keyword)
+        return result
 
-        for ch in all_channel_data:
-            try:
-                # 채널 생성일 파싱
-                created_at_str = ch['snippet']['publishedAt']
-                created_at = parser.parse(created_at_str).replace(tzinfo=None)
-
-                # 신규 채널 필터링 (기준일 이후 생성)
-                if created_at > cutoff_date:
-                    stats = ch.get('statistics', {})
-
-                    # 비공개 통계 처리
-                    subscribers = int(stats.get('subscriberCount', 0))
-                    video_count = int(stats.get('videoCount', 0))
-                    view_count = int(stats.get('viewCount', 0))
-
-                    title = ch['snippet']['title']
-                    description = ch['snippet'].get('description', '')
-
-                    new_channel = NewChannel(
-                        channel_id=ch['id'],
-                        title=title,
-                        description=description,
-                        created_at=created_at.strftime('%Y-%m-%d'),
-                        created_at_dt=created_at,
-                        subscribers=subscribers,
-                        video_count=video_count,
-                        view_count=view_count,
-                        thumbnail_url=ch['snippet']['thumbnails']['default']['url'],
-                        channel_url=f"https://youtube.com/channel/{ch['id']}"
-                    )
-
-                    new_channel.calculate_metrics()
-
-                    # ⭐ 키워드 관련성 계산 (핵심!)
-                    relevance_score, is_relevant, reason = self._calculate_keyword_relevance(
-                        title, description, keyword_variants
-                    )
-                    new_channel.relevance_score = relevance_score
-                    new_channel.keyword_relevant = is_relevant
-                    new_channel.relevance_reason = reason
-
-                    new_channels.append(new_channel)
-
-                    # 월별 카운트
-                    month_key = created_at.strftime('%Y-%m')
-                    monthly_counter[month_key] += 1
+    def analyze_keywords(
+        self,
+        keywords: List[str],
+        region: str = "KR",
+        months: int = 6,
+        max_videos: int = 100,
+        use_cache: bool = True,
+        progress_callback=None
+    ) -> Dict[str, TrendAnalysisResult]:
+        """
+        여러 키워드 일괄 분석 (채널 정보 공유)
 
-            except Exception as e:
-                print(f"[ChannelTrend] 채널 처리 오류: {e}")
+        키워드별 영상 검색은 각각 수행하되, 채널 상세 정보는 채널 ID 기준 공유 저장소
+        (YouTubeCache "trend_channels", 별도 TTL)에서 먼저 찾고 스윕 전체에서 채널당 한 번만 조회합니다.
+        관련성 점수는 채널을 한 번 순회하면서 그 채널이 검색된 모든 키워드에 대해 계산합니다.
+
+        Args:
+            keywords: 검색 키워드 리스트
+            region: 국가 코드 (KR, JP, US 등)
+            months: 분석 기간 (개월)
+            max_videos: 키워드당 최대 검색 영상 수
+            use_cache: 키워드별 결과 캐시 사용 여부
+            progress_callback: 진행 상황 콜백 함수
+
+        Returns:
+            {키워드: TrendAnalysisResult} (입력 순서 유지, 중복 키워드 제거)
+        """
+        def update_progress(msg):
+            if progress_callback:
+                progress_callback(msg)
+            print(f"[ChannelTrend] {msg}")
+
+        total_start = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        keywords = list(dict.fromkeys(kw for kw in keywords if kw))
+        results: Dict[str, TrendAnalysisResult] = {}
+
+        # 1. 키워드별 결과 캐시 확인
+        pending_keywords = []
+        for kw in keywords:
+            if use_cache:
+                cached = self._get_cached_result(self._get_cache_key(kw, region, months))
+                if cached:
+                    results[kw] = self._dict_to_result(cached)
+                    continue
+            pending_keywords.append(kw)
+
+        if len(results):
+            update_progress(f"캐시된 결과 {len(results)}개 사용")
+
+        if not pending_keywords:
+            return {kw: results[kw] for kw in keywords}
+
+        cutoff_date = datetime.now() - timedelta(days=months * 30)
+        published_after = cutoff_date.isoformat() + "Z"
+
+        # 2. 키워드별 검색 + 공유 저장소 조회 + 미보유 채널만 배치 조회 (검색과 병행)
+        keyword_video_counts: Dict[str, int] = {}
+        keyword_channel_ids: Dict[str, List[str]] = {}
+        channel_items: Dict[str, dict] = {}
+        requested_ids = set()  # 이번 스윕에서 이미 저장소 조회/API 요청한 채널
+        fetch_queue: List[str] = []
+        futures = []
+        store_hits = 0
+
+        search_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.CHANNEL_FETCH_WORKERS) as executor:
+            for idx, kw in enumerate(pending_keywords, 1):
+                update_progress(f"[{idx}/{len(pending_keywords)}] 키워드 '{kw}' 영상 검색 중...")
+
+                video_count = 0
+                channel_ids: List[str] = []
+                seen_ids = set()
+                next_page_token = None
+
+                while video_count < max_videos:
+                    try:
+                        search_response = self.youtube.search().list(
+                            q=kw,
+                            part="snippet",
+                            type="video",
+                            order="date",  # 최신순
+                            publishedAfter=published_after,
+                            regionCode=region,
+                            maxResults=min(50, max_videos - video_count),
+                            pageToken=next_page_token
+                        ).execute()
+
+                        # 할당량 기록
+                        self._cache.log_api_call("search")
+
+                        items = search_response.get('items', [])
+                        video_count += len(items)
+                        next_page_token = search_response.get('nextPageToken')
+
+                        new_ids = []
+                        for item in items:
+                            cid = item['snippet'].get('channelId')
+                            if not cid or cid in seen_ids:
+                                continue
+                            seen_ids.add(cid)
+                            channel_ids.append(cid)
+                            if cid not in requested_ids:
+                                requested_ids.add(cid)
+                                new_ids.append(cid)
+
+                        # 공유 저장소에 없는 채널만 조회 대기열에 추가
+                        if new_ids:
+                            hits, misses = self._cache.get_many(
+                                self.CHANNEL_STORE_TYPE, [{"channel_id": cid} for cid in new_ids]
+                            )
+                            for params, item in hits:
+                                channel_items[params["channel_id"]] = item
+                            store_hits += len(hits)
+                            fetch_queue.extend(params["channel_id"] for params in misses)
+
+                        while len(fetch_queue) >= 50:
+                            futures.append(executor.submit(self._fetch_channel_batch, fetch_queue[:50]))
+                            fetch_queue = fetch_queue[50:]
+
+                        if not next_page_token:
+                            break
+
+                    except Exception as e:
+                        update_progress(f"영상 검색 오류 ({kw}): {e}")
+                        break
+
+                keyword_video_counts[kw] = video_count
+                keyword_channel_ids[kw] = channel_ids
+
+            timings["search"] = time.perf_counter() - search_start
+
+            if fetch_queue:
+                futures.append(executor.submit(self._fetch_channel_batch, fetch_queue))
+                fetch_queue = []
+
+            update_progress(
+                f"고유 채널 {len(requested_ids)}개 (저장소 {store_hits}개, API 조회 {len(requested_ids) - store_hits}개)"
+            )
+
+            wait_start = time.perf_counter()
+            wait(futures)
+            timings["channels_wait"] = time.perf_counter() - wait_start
+
+        # 조회 결과 수집 후 공유 저장소에 한 트랜잭션으로 저장
+        channels_fetch_time = 0.0
+        to_store = []
+        for future in futures:
+            items, elapsed, error = future.result()
+            channels_fetch_time += elapsed
+            if error:
+                update_progress(f"채널 조회 오류: {error}")
+            for item in items:
+                channel_items[item['id']] = item
+                to_store.append(({"channel_id": item['id']}, item))
+        self._cache.set_many(self.CHANNEL_STORE_TYPE, to_store)
+        timings["channels_fetch"] = channels_fetch_time
+
+        # 3. 채널 단위 한 번 순회: 파싱/지표 계산은 한 번, 관련성은 해당 키워드 전부에 대해
+        update_progress("신규 채널 필터링 및 관련성 분석 중...")
+        analysis_start = time.perf_counter()
+
+        keyword_variants = {kw: self._get_keyword_variants(kw) for kw in pending_keywords}
+        channel_keywords: Dict[str, List[str]] = defaultdict(list)
+        for kw in pending_keywords:
+            for cid in keyword_channel_ids[kw]:
+                channel_keywords[cid].append(kw)
+
+        keyword_new_channels: Dict[str, List[NewChannel]] = {kw: [] for kw in pending_keywords}
+        for cid, kws in channel_keywords.items():
+            item = channel_items.get(cid)
+            if item is None:
                 continue
 
-        # 6. 결과 정렬 (관련성 높은 순 → 최신순)
+            base_channel = self._parse_new_channel(item, cutoff_date)
+            if base_channel is None:
+                continue
+
+            for kw in kws:
+                new_channel = replace(base_channel)
+                self._apply_relevance(new_channel, keyword_variants[kw])
+                keyword_new_channels[kw].append(new_channel)
+
+        for kw in pending_keywords:
+            result = self._build_trend_result(
+                keyword=kw,
+                region=region,
+                months=months,
+                total_videos=keyword_video_counts[kw],
+                unique_channels=len(keyword_channel_ids[kw]),
+                new_channels=keyword_new_channels[kw]
+            )
+            if keyword_video_counts[kw]:
+                self._save_cache(self._get_cache_key(kw, region, months), self._result_to_dict(result))
+            results[kw] = result
+
+        timings["analysis"] = time.perf_counter() - analysis_start
+        timings["total"] = time.perf_counter() - total_start
+
+        # 스윕 전체 소요 시간 (키워드별 결과에 공통 기록)
+        sweep_timings = {k: round(v, 3) for k, v in timings.items()}
+        for kw in pending_keywords:
+            results[kw].stage_timings = dict(sweep_timings)
+
+        update_progress(
+            f"{len(pending_keywords)}개 키워드 분석 완료 - "
+            + ", ".join(f"{k} {v:.2f}s" for k, v in sweep_timings.items())
+        )
+
+        return {kw: results[kw] for kw in keywords}
+
+    def _parse_new_channel(self, ch: dict, cutoff_date: datetime) -> Optional[NewChannel]:
+        """
+        channels().list 아이템을 NewChannel로 변환 (기준일 이전 생성 채널은 None)
+
+        관련성 점수는 채우지 않으며, 성과 지표만 계산합니다.
+        """
+        try:
+            # 채널 생성일 파싱
+            created_at_str = ch['snippet']['publishedAt']
+            created_at = parser.parse(created_at_str).replace(tzinfo=None)
+
+            # 신규 채널 필터링 (기준일 이후 생성)
+            if created_at <= cutoff_date:
+                return None
+
+            stats = ch.get('statistics', {})
+
+            # 비공개 통계 처리
+            subscribers = int(stats.get('subscriberCount', 0))
+            video_count = int(stats.get('videoCount', 0))
+            view_count = int(stats.get('viewCount', 0))
+
+            new_channel = NewChannel(
+                channel_id=ch['id'],
+                title=ch['snippet']['title'],
+                description=ch['snippet'].get('description', ''),
+                created_at=created_at.strftime('%Y-%m-%d'),
+                created_at_dt=created_at,
+                subscribers=subscribers,
+                video_count=video_count,
+                view_count=view_count,
+                thumbnail_url=ch['snippet']['thumbnails']['default']['url'],
+                channel_url=f"https://youtube.com/channel/{ch['id']}"
+            )
+
+            new_channel.calculate_metrics()
+            return new_channel
+
+        except Exception as e:
+            print(f"[ChannelTrend] 채널 처리 오류: {e}")
+            return None
+
+    def _apply_relevance(self, channel: NewChannel, keyword_variants: List[str]):
+        """채널에 키워드 관련성 점수 기록"""
+        relevance_score, is_relevant, reason = self._calculate_keyword_relevance(
+            channel.title, channel.description, keyword_variants
+        )
+        channel.relevance_score = relevance_score
+        channel.keyword_relevant = is_relevant
+        channel.relevance_reason = reason
+
+    def _build_trend_result(
+        self,
+        keyword: str,
+        region: str,
+        months: int,
+        total_videos: int,
+        unique_channels: int,
+        new_channels: List[NewChannel]
+    ) -> TrendAnalysisResult:
+        """신규 채널 목록을 정렬하고 월별 추이/요약 통계를 계산해 결과 생성"""
+        # 결과 정렬 (관련성 높은 순 → 최신순)
         # 관련성 점수가 높은 채널이 먼저, 같으면 최신순
         new_channels.sort(key=lambda x: (-x.relevance_score, -x.created_at_dt.timestamp()))
 
         # 월별 트렌드 정렬
+        monthly_counter = Counter(c.created_at_dt.strftime('%Y-%m') for c in new_channels)
         monthly_trend = dict(sorted(monthly_counter.items()))
 
-        # 관련성 통계 로깅
-        relevant_count = len([c for c in new_channels if c.keyword_relevant])
-        update_progress(f"신규 채널 {len(new_channels)}개 발견 (키워드 관련: {relevant_count}개)")
-
-        # 7. 결과 생성
         result = TrendAnalysisResult(
             keyword=keyword,
             region=region,
             period_months=months,
             analysis_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
-            total_videos_searched=len(all_videos),
-            unique_channels_found=len(channel_ids),
+            total_videos_searched=total_videos,
+            unique_channels_found=unique_channels,
             new_channels_count=len(new_channels),
             new_channels=new_channels,
             monthly_trend=monthly_trend
         )
 
         result.calculate_summary()
-
-        # 캐싱
-        self._save_cache(cache_key, self._result_to_dict(result))
-
         return result
 
     def _result_to_dict(self, result: TrendAnalysisResult) -> dict:
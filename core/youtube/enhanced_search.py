@@ -242,31 +242,39 @@ class EnhancedYouTubeSearcher:
         """채널 정보 일괄 조회 (캐시 활용)"""
 
         result = {}
-        ids_to_fetch = []
+        db_lookup_ids = []
 
         # 메모리 캐시 확인
         for cid in channel_ids:
             if cid in self._channel_cache:
                 result[cid] = self._channel_cache[cid]
             else:
-                # DB 캐시 확인
-                cached = self.cache.get("channels", {"channel_id": cid})
-                if cached:
-                    channel = ChannelInfo(
-                        channel_id=cached.get("channel_id", cid),
-                        channel_name=cached.get("title", ""),
-                        channel_url=f"https://www.youtube.com/channel/{cid}",
-                        subscriber_count=cached.get("subscriber_count", 0),
-                        total_video_count=cached.get("video_count", 0),
-                        created_at=cached.get("published_at", ""),
-                        description=cached.get("description", ""),
-                        thumbnail_url=cached.get("thumbnail_url", ""),
-                        total_view_count=cached.get("view_count", 0)
-                    )
-                    result[cid] = channel
-                    self._channel_cache[cid] = channel
-                else:
-                    ids_to_fetch.append(cid)
+                db_lookup_ids.append(cid)
+
+        # DB 캐시 일괄 확인
+        hits, misses = self.cache.get_many(
+            "channels", [{"channel_id": cid} for cid in db_lookup_ids]
+        )
+        for params, cached in hits:
+            cid = params["channel_id"]
+            if not cached:
+                misses.append(params)
+                continue
+            channel = ChannelInfo(
+                channel_id=cached.get("channel_id", cid),
+                channel_name=cached.get("title", ""),
+                channel_url=f"https://www.youtube.com/channel/{cid}",
+                subscriber_count=cached.get("subscriber_count", 0),
+                total_video_count=cached.get("video_count", 0),
+                created_at=cached.get("published_at", ""),
+                description=cached.get("description", ""),
+                thumbnail_url=cached.get("thumbnail_url", ""),
+                total_view_count=cached.get("view_count", 0)
+            )
+            result[cid] = channel
+            self._channel_cache[cid] = channel
+
+        ids_to_fetch = [params["channel_id"] for params in misses]
 
         # API 호출
         if ids_to_fetch:
@@ -282,6 +290,7 @@ class EnhancedYouTubeSearcher:
 
                     self.cache.log_api_call("channels")
 
+                    to_cache = []
                     for item in response.get("items", []):
                         snippet = item.get("snippet", {})
                         stats = item.get("statistics", {})
@@ -301,8 +310,7 @@ class EnhancedYouTubeSearcher:
                         result[channel.channel_id] = channel
                         self._channel_cache[channel.channel_id] = channel
 
-                        # DB 캐시 저장
-                        self.cache.set("channels", {"channel_id": channel.channel_id}, {
+                        to_cache.append(({"channel_id": channel.channel_id}, {
                             "channel_id": channel.channel_id,
                             "title": channel.channel_name,
                             "subscriber_count": channel.subscriber_count,
@@ -311,7 +319,10 @@ class EnhancedYouTubeSearcher:
                             "published_at": channel.created_at,
                             "description": channel.description,
                             "thumbnail_url": channel.thumbnail_url
-                        })
+                        }))
+
+                    # DB 캐시 저장 (배치당 한 트랜잭션)
+                    self.cache.set_many("channels", to_cache)
 
             except HttpError as e:
                 print(f"[YouTube API] 채널 조회 오류: {e}")
@@ -139,16 +139,19 @@ class YouTubeSearcher:
         Returns:
             영상 상세 정보 딕셔너리 리스트
         """
+        # 1. 전체 video_id 캐시 일괄 확인
+        hits, misses = self.cache.get_many(
+            "videos", [{"video_id": vid} for vid in video_ids]
+        )
         results = []
-        uncached_ids = []
-
-        # 1. 각 video_id별 캐시 확인
-        for vid in video_ids:
-            cached = self.cache.get("videos", {"video_id": vid})
-            if cached:
-                results.append(cached)
-            else:
-                uncached_ids.append(vid)
+        for params, cached in hits:
+            # 빈 값으로 저장된 항목은 미스로 보고 다시 조회
+            if not cached:
+                misses.append(params)
+                continue
+            results.append(cached)
+        missed = {params["video_id"] for params in misses}
+        uncached_ids = [vid for vid in video_ids if vid in missed]
 
         # 2. 캐시 미스된 것만 API 호출
         if uncached_ids:
@@ -168,12 +171,14 @@ class YouTubeSearcher:
                 except Exception as e:
                     raise Exception(f"영상 정보 조회 실패: {str(e)}")
 
+                to_cache = []
                 for item in response.get("items", []):
                     video_data = self._parse_video(item)
                     results.append(video_data)
+                    to_cache.append(({"video_id": item["id"]}, video_data))
 
-                    # 개별 캐싱
-                    self.cache.set("videos", {"video_id": item["id"]}, video_data)
+                # 개별 캐싱 (배치당 한 트랜잭션)
+                self.cache.set_many("videos", to_cache)
 
         return results
 
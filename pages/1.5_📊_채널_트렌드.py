@@ -1967,23 +1967,21 @@ def render_keyword_analysis_tab():
                 # 키워드당 영상 수 할당
                 videos_per_keyword = max(20, max_videos // len(all_keywords))
 
-                for i, kw in enumerate(all_keywords):
-                    progress_bar.progress(int(20 + (i / len(all_keywords)) * 60))
-                    progress_text.text(f"분석 중: {kw} ({i+1}/{len(all_keywords)})")
-
-                    try:
-                        partial_result = analyzer.analyze_channel_trend(
-                            keyword=kw,
-                            region=region,
-                            months=months,
-                            max_videos=videos_per_keyword,
-                            use_cache=use_cache,
-                            progress_callback=None  # 개별 진행 콜백 비활성화
-                        )
-                        all_results.append(partial_result)
-                    except Exception as e:
-                        print(f"[TrendAnalysis] 키워드 '{kw}' 분석 오류: {e}")
-                        continue
+                # 일괄 분석: 키워드 간 중복 채널은 한 번만 조회
+                progress_bar.progress(20)
+                try:
+                    sweep_results = analyzer.analyze_keywords(
+                        all_keywords,
+                        region=region,
+                        months=months,
+                        max_videos=videos_per_keyword,
+                        use_cache=use_cache,
+                        progress_callback=update_progress
+                    )
+                    all_results = list(sweep_results.values())
+                except Exception as e:
+                    print(f"[TrendAnalysis] 확장 키워드 일괄 분석 오류: {e}")
+                progress_bar.progress(80)
 
                 # 결과 통합
                 if all_results:
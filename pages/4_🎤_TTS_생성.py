@@ -401,8 +401,17 @@ def render_chatterbox_generation_options():
                     help="긴 텍스트를 70자 단위로 분할하여 안정적으로 생성합니다."
                 )
                 st.session_state["chatter_smart_chunking"] = use_smart_chunking
+
+                use_incremental = st.checkbox(
+                    "✏️ 수정된 문장만 재생성",
+                    value=st.session_state.get("chatter_incremental", False),
+                    key="chatter_incremental_checkbox",
+                    help="직전 생성본과 문장 단위로 비교해 바뀐 문장만 다시 합성하고 나머지는 재사용합니다."
+                )
+                st.session_state["chatter_incremental"] = use_incremental
             else:
                 use_smart_chunking = False
+                use_incremental = False
 
         with col_f:
             if use_sequential:
@@ -440,6 +449,7 @@ def render_chatterbox_generation_options():
         "pause_ms": pause_ms,
         "use_sequential": use_sequential,
         "use_smart_chunking": use_smart_chunking,
+        "use_incremental": use_incremental,
         "timeout_per_scene": timeout_per_scene,
         "parallel_enabled": not use_sequential,
         "max_concurrent": max_concurrent
@@ -807,60 +817,54 @@ def generate_chunk_with_retry(
     return {"success": False, "error": "최대 재시도 횟수 초과"}
 
 
-def merge_audio_chunks(audio_data_list: list, pause_ms: int = 200) -> bytes:
+def merge_audio_chunks(audio_data_list: list, pause_ms: int = 200, return_offsets: bool = False):
     """
-    오디오 청크들을 하나로 병합
+    오디오 청크들을 하나로 병합 (전체 길이만큼 한 번에 기록, 청크 수에 선형)
 
     Args:
         audio_data_list: 오디오 데이터 바이트 리스트
         pause_ms: 청크 간 휴식 시간 (ms)
+        return_offsets: True면 (WAV 바이트, 청크별 시작 위치 ms 목록) 반환
 
     Returns:
-        병합된 WAV 바이트
+        병합된 WAV 바이트 (return_offsets=True면 튜플)
     """
+    def first_chunk():
+        for audio_data in audio_data_list:
+            if audio_data:
+                return (audio_data, [0]) if return_offsets else audio_data
+        return (b"", []) if return_offsets else b""
+
     try:
         from pydub import AudioSegment
+        from utils.audio_concat import concat_to_wav
 
-        combined = AudioSegment.empty()
-        silence = AudioSegment.silent(duration=pause_ms) if pause_ms > 0 else None
-
+        segments = []
         for idx, audio_data in enumerate(audio_data_list):
             if not audio_data:
                 continue
 
             # BytesIO로 변환하여 로드
-            audio_io = io.BytesIO(audio_data)
             try:
-                audio = AudioSegment.from_file(audio_io, format="wav")
-
-                if idx > 0 and silence:
-                    combined += silence
-
-                combined += audio
+                segments.append(AudioSegment.from_file(io.BytesIO(audio_data), format="wav"))
             except Exception as e:
                 print(f"[Merge] 청크 {idx + 1} 로드 실패: {e}")
                 continue
 
-        # 결과를 BytesIO로 출력
+        # 결과를 BytesIO로 바로 기록
         output_io = io.BytesIO()
-        combined.export(output_io, format="wav")
-        output_io.seek(0)
+        offsets_ms = concat_to_wav(segments, output_io, gaps_ms=max(0, pause_ms))
+        merged = output_io.getvalue()
 
-        return output_io.read()
+        return (merged, offsets_ms) if return_offsets else merged
 
     except ImportError:
         # pydub이 없으면 첫 번째 청크만 반환
-        for audio_data in audio_data_list:
-            if audio_data:
-                return audio_data
-        return b""
+        return first_chunk()
     except Exception as e:
         print(f"[Merge] 병합 오류: {e}")
         # 오류 시 첫 번째 청크만 반환
-        for audio_data in audio_data_list:
-            if audio_data:
-                return audio_data
-        return b""
+        return first_chunk()
 
 
 def generate_chatterbox_tts_robust(
@@ -969,13 +973,17 @@ def generate_chatterbox_tts_robust(
     if len(valid_audio_data) == 1:
         # 단일 청크면 병합 불필요
         merged_audio = valid_audio_data[0]
+        chunk_offsets_ms = [0]
     else:
-        merged_audio = merge_audio_chunks(valid_audio_data, pause_ms=pause_ms)
+        merged_audio, chunk_offsets_ms = merge_audio_chunks(
+            valid_audio_data, pause_ms=pause_ms, return_offsets=True
+        )
 
     return {
         "success": True,
         "audio_data": merged_audio,
         "duration": stats["total_duration"],
+        "chunk_offsets_ms": chunk_offsets_ms,
         "chunks_info": chunks_info,
         "stats": stats,
         "mode": mode,
@@ -2839,7 +2847,58 @@ def _handle_chatterbox_scenes_generation(scenes, voice_path, params, gen_options
         if s.get("text", "").strip()
     ]
 
-    if use_sequential:
+    if gen_options.get("use_incremental"):
+        # ============================================================
+        # ✏️ 증분 재생성 모드 (바뀐 문장만 합성)
+        # ============================================================
+        from utils.tts_cache import get_tts_cache
+        from utils.tts_incremental import (
+            IncrementalSceneSynthesizer,
+            chatterbox_sentence_synthesizer,
+            get_takes_dir,
+        )
+
+        try:
+            from utils.project_manager import get_current_project
+            project_dir = get_current_project()
+        except Exception:
+            project_dir = None
+        takes_dir = get_takes_dir(project_dir) if project_dir else Path(output_dir) / "tts_takes"
+
+        params_key = get_tts_cache().make_key("", scene_params)
+        synthesizer = IncrementalSceneSynthesizer(
+            takes_dir,
+            chatterbox_sentence_synthesizer(scene_params, timeout=timeout_per_scene)
+        )
+        status_text.info(f"✏️ 증분 재생성 ({total_scenes}개 씬) - {voice_info}")
+
+        for idx, scene in enumerate(scene_list):
+            scene_id = scene["scene_id"]
+            scene_text = scene["text"]
+            plan = synthesizer.plan(scene_id, scene_text, params_key)
+            status_text.text(f"✏️ 씬 {scene_id}: {plan['synthesize']}/{plan['sentences']}개 문장 합성")
+
+            result = synthesizer.synthesize_scene(scene_id, scene_text, params_key)
+            generated_files.append({
+                "scene_id": scene_id,
+                "text": scene_text,
+                "text_preview": scene_text[:50] + "..." if len(scene_text) > 50 else scene_text,
+                "char_count": len(scene_text),
+                "audio_data": result.get("audio_data"),
+                "duration": result.get("duration", 0),
+                "sentences": result.get("sentences", []),
+                "chunks_count": len(result.get("sentences", [])) or 1,
+                "status": "success" if result.get("success") else "failed",
+                "success": bool(result.get("success")),
+                "error": result.get("error")
+            })
+            print(f"[TTS] 씬 {scene_id} 증분: 재사용 {result.get('reused_count', 0)}개, "
+                  f"합성 {result.get('synthesized_count', 0)}개")
+
+            progress_bar.progress(min((idx + 1) / total_scenes * (0.8 if norm_options.get("enabled") else 1.0), 1.0))
+            time_display.text(f"⏱️ 경과: {time.time() - total_start:.0f}초")
+
+    elif use_sequential:
         # ============================================================
         # 🚀 병렬 생성 모드 (동시 3개 처리 - 40% 속도 향상!)
         # ============================================================
@@ -3002,6 +3061,22 @@ def _handle_chatterbox_scenes_generation(scenes, voice_path, params, gen_options
                 f.write(file_info["audio_data"])
             file_info["path"] = audio_path
 
+    # 증분 모드: 문장 타이밍으로 씬별/전체 SRT 저장 (정규화 후 길이 기준)
+    if gen_options.get("use_incremental"):
+        from utils.tts_incremental import scenes_to_srt
+
+        saved_scenes = [f for f in generated_files if f.get("path") and f.get("sentences")]
+        for file_info in saved_scenes:
+            srt_path = os.path.splitext(file_info["path"])[0] + ".srt"
+            with open(srt_path, "w", encoding="utf-8") as f:
+                f.write(scenes_to_srt([file_info]))
+            file_info["srt_path"] = srt_path
+
+        if saved_scenes:
+            with open(os.path.join(scene_output_dir, "scenes.srt"), "w", encoding="utf-8") as f:
+                f.write(scenes_to_srt(saved_scenes))
+            print(f"[TTS] 문장 타이밍 SRT 저장: {len(saved_scenes)}개 씬")
+
     progress_bar.progress(1.0)
     status_text.empty()
 
@@ -745,7 +745,7 @@ if INFOGRAPHIC_AVAILABLE and tab_infographic is not None:
                             status_text.text(message)
 
                         # 레코더로 녹화
-                        from utils.infographic_video_recorder import get_video_recorder
+                        from utils.infographic_video_recorder import get_video_recorder, RECORDER_POOL_WORKERS
 
                         with get_video_recorder(output_dir=output_dir, quality=video_quality) as recorder:
                             # 전체/선택 모두 동일한 메서드 사용
@@ -761,7 +761,8 @@ if INFOGRAPHIC_AVAILABLE and tab_infographic is not None:
                                 animation_fps=animation_fps,
                                 preserve_layout=True,
                                 fade_effect=not is_animation_mode,  # 애니메이션 모드에서는 페이드 off
-                                progress_callback=video_progress
+                                progress_callback=video_progress,
+                                workers=RECORDER_POOL_WORKERS
                             )
 
                         progress_bar.progress(1.0)
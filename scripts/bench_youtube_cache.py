@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+YouTube 캐시 코덱 벤치마크
+
+레거시 JSON 텍스트 저장과 압축 코덱의 DB 용량 / get·set 지연 시간 비교
+
+실행: python scripts/bench_youtube_cache.py [--videos 2000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.youtube.cache import (
+    YouTubeCache,
+    CODEC_JSON_TEXT,
+    CODEC_JSON_ZLIB,
+    CODEC_JSON_ZSTD,
+    HAS_ZSTD,
+)
+
+
+def make_video(i: int) -> dict:
+    """검색 결과와 비슷한 크기의 가짜 영상 데이터"""
+    words = ["창업", "부업", "재테크", "세금", "절세", "브이로그", "리뷰", "투자"]
+    description = " ".join(random.choice(words) for _ in range(120))
+    return {
+        "video_id": f"vid{i:08d}",
+        "title": f"{random.choice(words)} 완벽 정리 {i}편",
+        "description": description[:500],
+        "channel_id": f"UC{i % 300:020d}",
+        "channel_title": f"채널 {i % 300}",
+        "published_at": "2025-01-01T00:00:00Z",
+        "thumbnail_url": f"https://i.ytimg.com/vi/vid{i:08d}/hqdefault.jpg",
+        "view_count": random.randint(0, 10_000_000),
+        "like_count": random.randint(0, 100_000),
+        "comment_count": random.randint(0, 10_000),
+        "duration_seconds": random.randint(60, 3600),
+        "video_url": f"https://www.youtube.com/watch?v=vid{i:08d}",
+    }
+
+
+def run(codec: int, videos: list) -> dict:
+    """코덱 하나로 set/get 시간과 DB 용량 측정"""
+    cache_dir = Path(tempfile.mkdtemp(prefix="yt_cache_bench_"))
+    cache = YouTubeCache(cache_dir, memory_cache_size=0, max_db_size_mb=0, codec=codec)
+
+    items = [({"video_id": v["video_id"]}, v) for v in videos]
+
+    start = time.perf_counter()
+    for i in range(0, len(items), 50):
+        cache.set_many("videos", items[i:i + 50])
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(items), 50):
+        cache.get_many("videos", [params for params, _ in items[i:i + 50]])
+    get_time = time.perf_counter() - start
+
+    cache._get_conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    size = cache.db_path.stat().st_size
+    cache.close()
+
+    return {
+        "set_ms": set_time * 1000 / len(items),
+        "get_ms": get_time * 1000 / len(items),
+        "size_kb": size / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    videos = [make_video(i) for i in range(args.videos)]
+
+    codecs = [("json (legacy)", CODEC_JSON_TEXT), ("zlib", CODEC_JSON_ZLIB)]
+    if HAS_ZSTD:
+        codecs.append(("zstd", CODEC_JSON_ZSTD))
+
+    print(f"영상 {args.videos}개 기준")
+    print(f"{'codec':<15}{'DB 용량(KB)':>14}{'set(ms/건)':>14}{'get(ms/건)':>14}")
+    for name, codec in codecs:
+        r = run(codec, videos)
+        print(f"{name:<15}{r['size_kb']:>14.1f}{r['set_ms']:>14.4f}{r['get_ms']:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+오디오 배치 엔진 테스트
+
+- 결과는 입력 순서대로
+- 작업 함수 예외는 그대로 전파 (순차 재실행 없음, 워커 traceback 포함)
+- 피클 불가 작업 함수는 순차 처리로 폴백
+
+실행: python test_audio_batch.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.audio_batch import run_audio_batch
+
+
+def _square_job(job):
+    log_path, value = job
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(f"{value}\n")
+    if value < 0:
+        raise ValueError(f"음수 입력: {value}")
+    return value * value
+
+
+def test_results_in_input_order():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = str(Path(tmp) / "calls.log")
+        results = run_audio_batch(_square_job, [(log_path, v) for v in range(8)], workers=3)
+        assert results == [v * v for v in range(8)]
+    print("   입력 순서 결과 확인")
+
+
+def test_job_error_propagates_without_rerun():
+    """작업 안의 예외는 폴백으로 삼키지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "calls.log"
+        jobs = [(str(log_path), v) for v in [1, 2, -3, 4]]
+        try:
+            run_audio_batch(_square_job, jobs, workers=2)
+        except ValueError as e:
+            assert "음수 입력: -3" in str(e)
+            assert "_square_job" in str(e.__cause__)
+        else:
+            raise AssertionError("예외가 전파되지 않음")
+
+        # 순차 재실행이 없으면 각 작업은 최대 1회
+        calls = log_path.read_text(encoding="utf-8").split()
+        assert len(calls) == len(set(calls)) <= len(jobs)
+    print("   작업 예외 전파 확인")
+
+
+def test_unpicklable_func_falls_back():
+    """피클 불가 함수 → 순차 처리"""
+    offset = 10
+    results = run_audio_batch(lambda v: v + offset, [1, 2, 3], workers=2)
+    assert results == [11, 12, 13]
+    print("   순차 폴백 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("오디오 배치 엔진 테스트")
+    print("=" * 60)
+    test_results_in_input_order()
+    test_job_error_propagates_without_rerun()
+    test_unpicklable_func_falls_back()
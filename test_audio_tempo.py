@@ -0,0 +1,196 @@
+"""
+인메모리 템포 엔진 A/B 테스트 / 마이크로 벤치마크
+
+NumPy WSOLA 엔진이 FFmpeg atempo 출력과 같은 길이·피치·스펙트럼을 만드는지 확인
+- 저장된 FFmpeg 기준값 (test_audio_tempo_reference.json)과 비교 → FFmpeg 없어도 실행
+- FFmpeg가 있으면 실시간 A/B 비교도 (없으면 skip으로 표시)
+
+실행: python test_audio_tempo.py
+기준값 갱신 (FFmpeg 필요): python test_audio_tempo.py --update-reference
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+try:
+    import pytest
+except ImportError:  # 스크립트로 직접 실행
+    pytest = None
+
+from utils.audio_tempo import (
+    OUTPUT_SAMPLE_RATE,
+    apply_tempo,
+    float_to_audiosegment,
+    wsola_time_stretch,
+)
+
+SR = OUTPUT_SAMPLE_RATE
+RATES = (0.85, 0.95, 1.1, 1.2, 1.5)
+REFERENCE_PATH = Path(__file__).parent / "test_audio_tempo_reference.json"
+N_FFT = 1024
+
+
+class _Skipped(Exception):
+    """pytest 없이 실행할 때 건너뛴 테스트"""
+
+
+def _skip(reason: str):
+    if pytest is not None and "PYTEST_CURRENT_TEST" in os.environ:
+        pytest.skip(reason)
+    raise _Skipped(reason)
+
+
+def _make_voice_like(seconds: float = 4.0) -> np.ndarray:
+    """기본음 + 배음 + 음절 단위 진폭 변조 (음성 비슷한 신호)"""
+    t = np.arange(int(SR * seconds)) / SR
+    f0 = 180 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SR
+    tone = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    return (0.2 * tone * envelope).astype(np.float32)
+
+
+def _dominant_freq(samples: np.ndarray) -> float:
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return float(np.fft.rfftfreq(len(samples), 1 / SR)[np.argmax(spectrum)])
+
+
+def _avg_log_spectrum(x: np.ndarray) -> np.ndarray:
+    frames = len(x) // N_FFT
+    x = x[:frames * N_FFT].reshape(frames, N_FFT) * np.hanning(N_FFT)
+    return np.log10(np.abs(np.fft.rfft(x, axis=1)).mean(axis=0) + 1e-6)
+
+
+def _features(audio) -> dict:
+    """A/B 비교용 특징값 (길이, RMS, 평균 로그 스펙트럼)"""
+    x = np.array(audio.get_array_of_samples(), dtype=np.float32) / 32768
+    return {
+        "length": len(x),
+        "rms": float(np.sqrt(np.mean(x ** 2))),
+        "spectrum": _avg_log_spectrum(x),
+    }
+
+
+def _assert_close_to(ours: dict, ref: dict, rate: float):
+    """길이 ≤0.2%, 스펙트럼 유사도 >0.998, RMS 차 <0.7dB"""
+    length_diff = abs(ours["length"] - ref["length"]) / ref["length"]
+    similarity = float(np.corrcoef(ours["spectrum"], ref["spectrum"])[0, 1])
+    rms_diff_db = 20 * np.log10(ours["rms"] / ref["rms"])
+
+    print(f"   rate={rate}: 길이 차 {length_diff * 100:.2f}%, 스펙트럼 유사도 {similarity:.4f}, "
+          f"RMS 차 {rms_diff_db:+.2f}dB")
+
+    # 측정값 (길이 ≤0.15%, 유사도 ≥0.999, RMS ≤0.6dB)에 약간의 여유만 둠
+    assert length_diff < 0.002
+    assert similarity > 0.998
+    assert abs(rms_diff_db) < 0.7
+
+
+def test_duration_and_pitch_preserved():
+    """길이는 1/rate, 피치(기본 주파수)는 유지"""
+    t = np.arange(SR * 3) / SR
+    sine = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    for rate in RATES:
+        out = wsola_time_stretch(sine, rate, SR)
+        assert abs(len(out) - len(sine) / rate) <= 1, f"rate={rate} 길이 불일치"
+        assert abs(_dominant_freq(out) - 220) < 2, f"rate={rate} 피치 변화"
+        assert np.abs(out).max() <= 0.31, f"rate={rate} 진폭 증가"
+
+    print("   길이/피치 유지 확인")
+
+
+def test_apply_tempo_volume():
+    """apply_tempo의 게인은 volume=..dB와 동일"""
+    audio = float_to_audiosegment(_make_voice_like(1.0))
+    louder = apply_tempo(audio, 1.0, volume_db=6.0, engine="numpy")
+
+    assert abs(louder.dBFS - audio.dBFS - 6.0) < 0.1
+    assert louder.frame_rate == SR and louder.channels == 1 and louder.sample_width == 2
+
+    print("   게인 확인")
+
+
+def test_ab_against_stored_reference():
+    """NumPy 엔진 vs 저장된 FFmpeg atempo 출력 특징값 (FFmpeg 없이 CI에서 실행)"""
+    reference = json.loads(REFERENCE_PATH.read_text(encoding="utf-8"))
+    audio = float_to_audiosegment(_make_voice_like())
+
+    for rate in RATES:
+        ref = dict(reference[str(rate)])
+        ref["spectrum"] = np.array(ref["spectrum"])
+        _assert_close_to(_features(apply_tempo(audio, rate, engine="numpy")), ref, rate)
+
+
+def test_ab_against_ffmpeg_atempo():
+    """NumPy 엔진 vs FFmpeg atempo (파이프) 실시간 비교"""
+    if not shutil.which("ffmpeg"):
+        _skip("FFmpeg 없음 - 실시간 A/B 비교 건너뜀")
+
+    audio = float_to_audiosegment(_make_voice_like())
+
+    for rate in RATES:
+        ours = _features(apply_tempo(audio, rate, engine="numpy"))
+        ref = _features(apply_tempo(audio, rate, engine="ffmpeg"))
+        _assert_close_to(ours, ref, rate)
+
+
+def update_reference():
+    """FFmpeg atempo 출력 특징값을 기준 파일로 저장"""
+    if not shutil.which("ffmpeg"):
+        raise SystemExit("FFmpeg가 필요합니다")
+
+    audio = float_to_audiosegment(_make_voice_like())
+    reference = {}
+    for rate in RATES:
+        features = _features(apply_tempo(audio, rate, engine="ffmpeg"))
+        reference[str(rate)] = {
+            "length": features["length"],
+            "rms": round(features["rms"], 6),
+            "spectrum": [round(float(v), 4) for v in features["spectrum"]],
+        }
+    REFERENCE_PATH.write_text(json.dumps(reference) + "\n", encoding="utf-8")
+    print(f"   기준값 저장: {REFERENCE_PATH.name}")
+
+
+def benchmark(seconds: float = 30.0, repeat: int = 3):
+    """씬 1개 분량(30초) 기준 처리 시간 비교"""
+    audio = float_to_audiosegment(_make_voice_like(seconds))
+    engines = ["numpy"] + (["ffmpeg"] if shutil.which("ffmpeg") else [])
+
+    for engine in engines:
+        start = time.time()
+        for _ in range(repeat):
+            apply_tempo(audio, 1.1, engine=engine)
+        elapsed = (time.time() - start) / repeat
+        print(f"   {engine}: {elapsed * 1000:.1f}ms ({seconds / elapsed:.0f}배속)")
+
+
+if __name__ == "__main__":
+    if "--update-reference" in sys.argv:
+        update_reference()
+        sys.exit(0)
+
+    print("=" * 60)
+    print("템포 엔진 테스트")
+    print("=" * 60)
+    test_duration_and_pitch_preserved()
+    test_apply_tempo_volume()
+    test_ab_against_stored_reference()
+    try:
+        test_ab_against_ffmpeg_atempo()
+    except _Skipped as e:
+        print(f"   {e}")
+
+    print("\n" + "=" * 60)
+    print("마이크로 벤치마크")
+    print("=" * 60)
+    benchmark()
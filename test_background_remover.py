@@ -0,0 +1,71 @@
+"""
+배경 제거 캐시 키 테스트
+
+- URL 소스는 URL로 키를 만들어 캐시 적중 시 다시 내려받지 않음
+- 로컬 파일은 내용 해시 (같은 내용이면 경로가 달라도 같은 캐시)
+
+실행: python test_background_remover.py
+"""
+import os
+import sys
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from utils.background_remover import BackgroundRemover
+
+URL = "https://example.com/character.png"
+
+
+def _png_bytes() -> bytes:
+    image = Image.new("RGB", (32, 32), (255, 255, 255))
+    image.paste((200, 30, 30), (8, 8, 24, 24))
+    buffer = BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_url_cache_hit_without_download():
+    with tempfile.TemporaryDirectory() as tmp:
+        remover = BackgroundRemover(cache_dir=str(Path(tmp) / "nobg"))
+        remover._rembg_available = False
+
+        downloads = []
+        png = _png_bytes()
+        remover._load_bytes = lambda source: downloads.append(source) or png
+
+        first = remover.get_transparent_path(URL)
+        assert first != URL and Path(first).exists()
+        assert downloads == [URL]
+
+        # 캐시 적중 → 네트워크 요청 없음
+        assert remover.get_transparent_path(URL) == first
+        assert downloads == [URL]
+    print("   URL 캐시 적중 시 다운로드 생략 확인")
+
+
+def test_local_files_keyed_by_content():
+    with tempfile.TemporaryDirectory() as tmp:
+        remover = BackgroundRemover(cache_dir=str(Path(tmp) / "nobg"))
+        remover._rembg_available = False
+
+        a = Path(tmp) / "a.png"
+        b = Path(tmp) / "b.png"
+        a.write_bytes(_png_bytes())
+        b.write_bytes(_png_bytes())
+
+        assert remover.get_transparent_path(str(a)) == remover.get_transparent_path(str(b))
+    print("   로컬 파일 내용 해시 키 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("배경 제거 캐시 테스트")
+    print("=" * 60)
+    test_url_cache_hit_without_download()
+    test_local_files_keyed_by_content()
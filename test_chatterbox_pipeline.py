@@ -0,0 +1,140 @@
+"""
+Chatterbox 배치 파이프라인 테스트
+
+로컬 가짜 서버(배치 합성: 씬당 0.1초, 다운로드: 0.1초)로 확인:
+- 씬을 청크 단위로 제출하고, 다운로드가 다음 청크 합성과 겹치는지
+- 첫 결과가 모든 합성이 끝나기 전에 나오는지 (완료 순서로 반환)
+- 동기 래퍼가 입력 순서대로 결과를 돌려주는지
+
+실행: python test_chatterbox_pipeline.py
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.chatterbox_async import generate_batch_via_server, iter_batch_results_sync
+
+SYNTH_SEC = 0.1
+DOWNLOAD_SEC = 0.1
+
+
+class _FakeBatchServer(BaseHTTPRequestHandler):
+    """/generate/batch (순차 합성) + /outputs/<n>.wav 다운로드"""
+    protocol_version = "HTTP/1.1"
+    events = []
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self, kind, start, end):
+        with self.lock:
+            _FakeBatchServer.events.append((kind, start, end))
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        start = time.time()
+        results = []
+        for item in body["items"]:
+            time.sleep(SYNTH_SEC)
+            if item["text"] == "실패":
+                results.append({"success": False, "error": "합성 오류"})
+            else:
+                results.append({"success": True, "audio_url": f"/outputs/{item['text']}.wav", "duration": 1.5})
+        self._record("batch", start, time.time())
+        self._send(200, json.dumps({"results": results}).encode(), "application/json")
+
+    def do_GET(self):
+        start = time.time()
+        time.sleep(DOWNLOAD_SEC)
+        self._record("download", start, time.time())
+        self._send(200, self.path.encode(), "audio/wav")
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeBatchServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_pipelined_batch():
+    """다운로드가 다음 청크 합성과 겹치고, 첫 결과가 일찍 나옴"""
+    server, base_url = _start_server()
+    _FakeBatchServer.events = []
+    scenes = [{"scene_id": i + 1, "text": f"s{i + 1}"} for i in range(8)]
+
+    try:
+        start = time.time()
+        first_at = None
+        results = []
+        for result in iter_batch_results_sync(
+            scenes, {}, chunk_size=2, use_cache=False, base_url=base_url
+        ):
+            first_at = first_at or time.time() - start
+            results.append(result)
+        total = time.time() - start
+    finally:
+        server.shutdown()
+
+    assert sorted(r["index"] for r in results) == list(range(8))
+    assert all(r["success"] and r["audio_data"] == f"/outputs/s{r['scene_id']}.wav".encode() for r in results)
+
+    batches = [e for e in _FakeBatchServer.events if e[0] == "batch"]
+    downloads = [e for e in _FakeBatchServer.events if e[0] == "download"]
+    assert len(batches) == 4 and len(downloads) == 8
+
+    # 첫 청크 다운로드가 마지막 청크 합성보다 먼저 시작
+    assert min(d[1] for d in downloads) < batches[-1][1]
+    # 첫 결과는 전체 합성 시간(0.8초)보다 훨씬 이전
+    assert first_at < SYNTH_SEC * 8 * 0.6
+    # 순차(합성 0.8 + 다운로드 0.8)보다 빠름
+    assert total < (SYNTH_SEC + DOWNLOAD_SEC) * 8 * 0.8
+
+    print(f"   첫 결과 {first_at:.2f}초, 전체 {total:.2f}초 "
+          f"(순차 예상 {(SYNTH_SEC + DOWNLOAD_SEC) * 8:.1f}초)")
+
+
+def test_generate_batch_via_server_order():
+    """동기 래퍼는 입력 순서 + 실패 씬 표시"""
+    import utils.chatterbox_async as chatterbox_async
+
+    server, base_url = _start_server()
+    original = chatterbox_async.CHATTERBOX_URL
+    chatterbox_async.CHATTERBOX_URL = base_url
+    progress = []
+
+    try:
+        scenes = [{"scene_id": 10, "text": "a"}, {"scene_id": 11, "text": "실패"}, {"scene_id": 12, "text": "b"}]
+        results = generate_batch_via_server(
+            scenes, {}, progress_callback=lambda c, t, m: progress.append(c), chunk_size=2
+        )
+    finally:
+        chatterbox_async.CHATTERBOX_URL = original
+        server.shutdown()
+
+    assert [r["scene_id"] for r in results] == [10, 11, 12]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["error"] == "합성 오류"
+    assert progress == [1, 2, 3]
+    print("   입력 순서 / 실패 씬 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Chatterbox 배치 파이프라인 테스트")
+    print("=" * 60)
+    test_pipelined_batch()
+    test_generate_batch_via_server_order()
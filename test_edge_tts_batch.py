@@ -0,0 +1,120 @@
+"""
+Edge TTS 씬 배치 생성 테스트
+
+네트워크 없이 edge_tts.Communicate를 가짜 스트림으로 바꿔서 확인:
+- Semaphore 한도 안에서 씬이 동시에 합성되는지
+- 씬 오디오가 순서대로 이어붙여지고 전역 SRT 타이밍이 씬 시작 위치만큼 밀리는지
+(MP3 인코딩/디코딩에 FFmpeg가 필요 - 없으면 병합 검증은 건너뜀)
+
+실행: python test_edge_tts_batch.py
+"""
+import asyncio
+import io
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pydub.generators import Sine
+
+import core.tts.edge_tts_client as edge_module
+from core.tts.edge_tts_client import EdgeTTSClient
+
+
+def test_merge_scene_cues():
+    """씬별 큐 → 전역 타임라인 (씬 끝에서 자름)"""
+    merged = EdgeTTSClient._merge_scene_cues(
+        [
+            [{"start_ms": 0, "end_ms": 900, "text": "첫 문장"}],
+            [{"start_ms": 100, "end_ms": 700, "text": "둘째"}, {"start_ms": 700, "end_ms": 1500, "text": "셋째"}],
+        ],
+        offsets_ms=[0, 1500],
+        durations_ms=[1000, 1200]
+    )
+
+    assert [(c["start_ms"], c["end_ms"], c["text"]) for c in merged] == [
+        (0, 900, "첫 문장"), (1600, 2200, "둘째"), (2200, 2700, "셋째")
+    ]
+    print("   전역 자막 병합 확인")
+
+
+class _FakeCommunicate:
+    """글자당 100ms 오디오 + 문장 경계 1개를 스트리밍하는 가짜 Communicate"""
+    active = 0
+    peak = 0
+
+    def __init__(self, text, voice=None, **kwargs):
+        self.text = text
+
+    async def stream(self):
+        _FakeCommunicate.active += 1
+        _FakeCommunicate.peak = max(_FakeCommunicate.peak, _FakeCommunicate.active)
+        try:
+            duration_ms = 100 * len(self.text)
+            mp3 = io.BytesIO()
+            Sine(300).to_audio_segment(duration=duration_ms).set_frame_rate(24000).export(mp3, format="mp3")
+            await asyncio.sleep(0.05)
+
+            yield {"type": "SentenceBoundary", "offset": 50 * 10000,
+                   "duration": (duration_ms - 100) * 10000, "text": self.text}
+            data = mp3.getvalue()
+            for i in range(0, len(data), 4096):
+                yield {"type": "audio", "data": data[i:i + 4096]}
+                await asyncio.sleep(0)
+        finally:
+            _FakeCommunicate.active -= 1
+
+
+def test_batch_concurrency_and_offsets():
+    """동시 합성 한도 + 씬 오프셋이 반영된 SRT"""
+    if not shutil.which("ffmpeg"):
+        print("   FFmpeg 없음 - 배치 병합 검증 건너뜀")
+        return
+
+    scenes = ["가나다라마", "바사아", "", "자차카타파하", "가나"]
+    original = edge_module.edge_tts.Communicate
+    edge_module.edge_tts.Communicate = _FakeCommunicate
+    _FakeCommunicate.peak = 0
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            client = EdgeTTSClient()
+            result = client.generate_scenes_batch_sync(
+                scenes, voice="ko-KR-SunHiNeural", output_path=str(Path(tmp) / "out.mp3"),
+                scene_gap_ms=300, max_concurrent=2
+            )
+
+            assert _FakeCommunicate.peak == 2
+            assert result["failed_scenes"] == []
+
+            offsets = result["scene_offsets_ms"]
+            durations = result["scene_durations_ms"]
+            assert durations[2] == 0
+            for i in range(1, len(scenes)):
+                assert abs(offsets[i] - (offsets[i - 1] + durations[i - 1] + 300)) <= 1
+
+            audio = edge_module._decode_mp3(Path(result["audio_path"]).read_bytes())
+            assert abs(len(audio) - (offsets[-1] + durations[-1])) < 100
+
+            srt = client._parse_srt(Path(result["srt_path"]))
+            assert [s["text"] for s in srt] == [s for s in scenes if s]
+            spoken = [i for i, s in enumerate(scenes) if s]
+            for seg, i in zip(srt, spoken):
+                assert abs(seg["start_ms"] - (offsets[i] + 50)) <= 1
+                assert seg["end_ms"] <= offsets[i] + durations[i]
+    finally:
+        edge_module.edge_tts.Communicate = original
+
+    print(f"   동시 합성 최대 {_FakeCommunicate.peak}개, 씬 시작 {offsets}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Edge TTS 배치 테스트")
+    print("=" * 60)
+    test_merge_scene_cues()
+    test_batch_concurrency_and_offsets()
@@ -0,0 +1,120 @@
+"""
+이미지 결과 캐시 / 배치 중복 제거 테스트
+
+- 키: 공백만 다른 프롬프트는 동일, seed/크기/모델이 바뀌면 다름
+- 배치 안의 같은 프롬프트는 한 번만 생성하고 복사
+- seed가 같은 재실행은 API 호출 없이 디스크에서
+- 생략한 요청은 APIManager 사용량에 cache_hit/cost_saved로 기록
+- 적중률 분모는 이미지 요청 (캐시 적중 + 실제 생성), 다른 API 호출은 제외
+
+실행: python test_image_cache.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import core.api.api_manager as api_module
+import utils.image_cache as image_cache
+from core.api.api_manager import APIManager
+from core.api.usage_store import UsageStore
+from core.image.image_generator import ImageConfig, ImageGenerator, ImageResult
+from utils.image_cache import ImageResultCache
+
+MODEL = "black-forest-labs/FLUX.2-dev"
+
+
+def test_key_normalization():
+    """공백 정규화 + 요청 파라미터 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ImageResultCache(Path(tmp))
+        base = cache.make_key("a cat  on\ta mat", "together", MODEL, 1024, 768, steps=20, seed=7)
+
+        assert base == cache.make_key(" a cat on a mat ", "Together.ai FLUX", MODEL, 1024, 768, steps=20, seed=7)
+        assert base != cache.make_key("a cat on a mat", "together", MODEL, 1024, 768, steps=20, seed=8)
+        assert base != cache.make_key("a cat on a mat", "together", MODEL, 768, 1024, steps=20, seed=7)
+        assert base != cache.make_key("a cat on a mat", "openai", MODEL, 1024, 768, steps=20, seed=7)
+
+        cache.put(base, b"png-bytes", model=MODEL)
+        assert cache.get(base) == b"png-bytes"
+    print("   키 정규화 확인")
+
+
+def test_batch_dedup_and_seeded_reuse():
+    """배치 중복 제거 + seed 재실행은 캐시 + 사용량 기록"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = APIManager.__new__(APIManager)
+        manager.usage_store = UsageStore(Path(tmp) / "api_usage.db")
+
+        original_manager = api_module._api_manager
+        original_cache = image_cache._image_cache_instance
+        api_module._api_manager = manager
+        image_cache._image_cache_instance = ImageResultCache(Path(tmp) / "images")
+
+        calls = []
+
+        def fake_together(prompt, output_path, config):
+            calls.append(prompt)
+            Path(output_path).write_bytes(f"image:{prompt}".encode())
+            return ImageResult(success=True, image_path=output_path, prompt=prompt,
+                               model=config.model, provider="together")
+
+        try:
+            config = ImageConfig(provider="together", model=MODEL, seed=42)
+            generator = ImageGenerator(config)
+            generator._generate_together = fake_together
+
+            prompts = ["a cat", "a  cat", "a dog", "a cat "]
+            first = generator.generate_batch(prompts, str(Path(tmp) / "run1"), config)
+
+            assert sorted(calls) == ["a cat", "a dog"]
+            assert all(r.success for r in first)
+            assert Path(first[1].image_path).read_bytes() == b"image:a cat"
+            assert first[3].metadata == {"deduplicated_from": 0}
+
+            # 같은 seed로 재실행 → API 호출 없음
+            calls.clear()
+            second = generator.generate_batch(prompts, str(Path(tmp) / "run2"), config)
+            assert calls == []
+            assert Path(second[2].image_path).read_bytes() == b"image:a dog"
+            assert second[0].metadata == {"cache_hit": True}
+
+            # seed 없으면 캐시를 쓰지 않음 (중복 제거만)
+            unseeded = ImageConfig(provider="together", model=MODEL)
+            generator.generate_batch(prompts, str(Path(tmp) / "run3"), unseeded)
+            assert sorted(calls) == ["a cat", "a dog"]
+
+            # 이미지와 무관한 API 호출은 적중률 분모에 들어가지 않음
+            for _ in range(20):
+                manager.record_usage("anthropic", "claude-sonnet", "text_generation", tokens_input=10)
+
+            summary = manager.get_usage_summary()
+            units = sum(r.units_used for r in manager.get_recent_usage() if r.cache_hit)
+        finally:
+            api_module._api_manager = original_manager
+            image_cache._image_cache_instance = original_cache
+
+    # 1회차 중복 2 + 2회차 (캐시 2 + 중복 2) + 3회차 중복 2 = 8
+    assert summary["cache_hits"] == 5  # 기록 건수 (중복 복사는 한 건에 여러 장)
+    assert units == 8
+    assert abs(summary["cost_saved"] - 8 * 0.0154) < 1e-9
+    assert summary["total_cost"] == 0
+
+    # 이미지 요청 기록 = 실제 생성 4 (1회차 2 + 3회차 2) + 적중 5
+    image_usage = summary["by_function"]["image_generation"]
+    assert image_usage["requests"] == 9
+    assert abs(summary["cache_hit_rate"] - 5 / 9) < 1e-9
+    assert image_usage["cache_hit_rate"] == summary["cache_hit_rate"]
+    assert summary["by_function"]["text_generation"]["cache_hit_rate"] == 0.0
+    print(f"   생성 생략 8장, 절감 ${summary['cost_saved']:.4f}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("이미지 캐시 테스트")
+    print("=" * 60)
+    test_key_normalization()
+    test_batch_dedup_and_seeded_reuse()
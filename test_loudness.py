@@ -0,0 +1,96 @@
+"""
+BS.1770 라우드니스 측정기 테스트
+
+EBU Tech 3341 방식의 기준 신호(997Hz 사인)로 통합 라우드니스와 게이팅 확인
+긴 버퍼도 측정 중 추가 메모리가 구간 크기로 고정되는지 확인
+
+실행: python test_loudness.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from utils.loudness import measure_loudness, integrated_loudness
+
+
+def _sine(db: float, seconds: float, sample_rate: int = 48000) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return 10 ** (db / 20) * np.sin(2 * np.pi * 997 * t)
+
+
+def test_reference_levels():
+    """스테레오 997Hz -23dBFS → -23 LUFS, 모노 0dBFS → -3.01 LUFS"""
+    tone = _sine(-23, 20)
+    assert abs(integrated_loudness(np.stack([tone, tone], axis=1), 48000) + 23.0) < 0.1
+    assert abs(integrated_loudness(_sine(0, 5), 48000) + 3.01) < 0.1
+
+    # TTS 샘플레이트에서도 ±0.1 LU 이내
+    assert abs(integrated_loudness(_sine(-20, 5, 24000), 24000) + 23.01) < 0.1
+
+    print("   기준 레벨 확인")
+
+
+def test_gating_ignores_silence():
+    """무음 구간은 절대 게이트로 제외 (RMS 방식과 달리 음량이 내려가지 않음)"""
+    tone = _sine(-20, 5, 24000)
+    padded = np.concatenate([tone, np.zeros(24000 * 5)])
+
+    # 경계에 걸친 블록 몇 개만 영향 (5초 무음을 RMS로 평균하면 -3dB)
+    assert abs(integrated_loudness(padded, 24000) - integrated_loudness(tone, 24000)) < 0.2
+    assert integrated_loudness(np.zeros(24000), 24000) == float("-inf")
+
+    print("   게이팅 확인")
+
+
+def test_short_term_and_momentary():
+    result = measure_loudness(_sine(-20, 10, 24000), 24000, momentary=True, short_term=True)
+
+    assert len(result["momentary"]) == 97    # (10 - 0.4) / 0.1 + 1
+    assert len(result["short_term"]) == 71   # (10 - 3) / 0.1 + 1
+    assert np.allclose(result["short_term"], result["integrated"], atol=0.05)
+
+    print("   숏텀/모멘터리 확인")
+
+
+def test_long_buffer_memory_bounded():
+    """10분 24kHz 나레이션 측정 시 추가 메모리가 입력 크기와 무관하게 고정"""
+    samples = (np.random.RandomState(0).randn(24000 * 600) * 3000).astype(np.int16)
+    reference = integrated_loudness(samples[:24000 * 30].astype(np.float64) / 32768, 24000)
+
+    tracemalloc.start()
+    try:
+        lufs = integrated_loudness(samples, 24000)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # 입력 29MB (int16) - 전체 float64/복소 FFT였다면 수백 MB
+    assert peak < 32 * 1024 * 1024, f"peak {peak / 1e6:.0f}MB"
+    assert abs(lufs - reference) < 0.05
+
+    print(f"   10분 버퍼 측정 최대 추가 메모리 {peak / 1e6:.1f}MB")
+
+
+def benchmark(seconds: float = 60.0):
+    samples = np.random.RandomState(0).randn(int(24000 * seconds)) * 0.1
+    start = time.time()
+    integrated_loudness(samples, 24000)
+    elapsed = time.time() - start
+    print(f"   {seconds:.0f}초 오디오 측정: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("라우드니스 측정기 테스트")
+    print("=" * 60)
+    test_reference_levels()
+    test_gating_ignores_silence()
+    test_short_term_and_momentary()
+    test_long_buffer_memory_bounded()
+    benchmark()
@@ -0,0 +1,246 @@
+"""
+프로젝트 인덱스 테스트
+
+- 목록: 처음 한 번만 config.json 파싱, 이후 rerun은 프로젝트별 stat만
+- 폴더 추가/삭제, 외부에서 바꾼 config.json은 다음 목록에 반영
+- 깨진 config.json은 항목을 지우지 않음 → 고치면 (재시작 후에도) 다시 목록에
+- 진행 상황: 단계 결과 폴더가 바뀌지 않으면 check_step_completed 생략
+- 벤치마크: 프로젝트 300개 목록 + 진행 상황 (기존 방식 vs 인덱스)
+
+실행: python test_project_index.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import utils.data_loader as data_loader
+from utils.project_index import ProjectIndex
+
+
+def _make_project(projects_dir: Path, index: int, images: int = 0) -> Path:
+    project_id = f"20260101_{index:06d}_project{index}"
+    project_path = projects_dir / project_id
+    for folder in ["research", "scripts", "audio", "prompts", "images/content", "export"]:
+        (project_path / folder).mkdir(parents=True, exist_ok=True)
+    config = {
+        "id": project_id,
+        "name": f"project{index}",
+        "language": "ko",
+        "created_at": f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}",
+        "current_step": 1,
+        "status": "in_progress",
+    }
+    (project_path / "config.json").write_text(json.dumps(config), encoding="utf-8")
+    (project_path / "scripts" / "draft_ko.txt").write_text("대본", encoding="utf-8")
+    for i in range(images):
+        (project_path / "images" / "content" / f"{i:03d}.png").write_bytes(b"png")
+    return project_path
+
+
+def _bump_mtime(path: Path):
+    """mtime 해상도가 낮은 파일 시스템 대비"""
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+
+def test_list_projects_reuses_index():
+    """재파싱 없이 목록 반환 + 추가/삭제/외부 수정 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        projects_dir = Path(tmp) / "projects"
+        index_path = Path(tmp) / "project_index.json"
+        for i in range(5):
+            _make_project(projects_dir, i)
+
+        index = ProjectIndex(projects_dir, index_path)
+        projects = index.list_projects()
+        assert [p["name"] for p in projects] == [f"project{i}" for i in range(4, -1, -1)]
+
+        # 새 인스턴스 (앱 재시작)도 매니페스트에서 바로
+        reopened = ProjectIndex(projects_dir, index_path)
+        reopened._read_config = lambda project_id: (_ for _ in ()).throw(AssertionError("재파싱"))
+        assert reopened.list_projects() == projects
+
+        # 폴더 추가 → 새 항목만 파싱
+        parsed = []
+        original_read = ProjectIndex._read_config
+        reopened._read_config = lambda project_id: parsed.append(project_id) or original_read(reopened, project_id)
+        new_path = _make_project(projects_dir, 9)
+        _bump_mtime(projects_dir)
+        assert reopened.list_projects()[0]["name"] == "project9"
+        assert parsed == [new_path.name]
+
+        # 외부에서 config 수정 + 다른 폴더 삭제
+        config_path = new_path / "config.json"
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config["current_step"] = 4
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        _bump_mtime(config_path)
+        removed = sorted(projects_dir.iterdir())[0]
+        for path in sorted(removed.rglob("*"), reverse=True):
+            path.unlink() if path.is_file() else path.rmdir()
+        removed.rmdir()
+        _bump_mtime(projects_dir)
+
+        projects = reopened.list_projects()
+        assert len(projects) == 5
+        assert projects[0]["current_step"] == 4
+        assert removed.name not in [p["id"] for p in projects]
+
+        # 앱에서 저장한 변경은 update로 바로 반영
+        config["name"] = "renamed"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        reopened.update(new_path.name, config)
+        assert reopened.list_projects()[0]["name"] == "renamed"
+    print("   목록 인덱스 확인")
+
+
+def test_external_config_edit_without_dir_change():
+    """폴더 추가/삭제 없이 config.json만 외부에서 수정 → 다음 목록과 재시작 후에도 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        projects_dir = Path(tmp) / "projects"
+        index_path = Path(tmp) / "project_index.json"
+        project_path = _make_project(projects_dir, 1)
+        _make_project(projects_dir, 2)
+
+        index = ProjectIndex(projects_dir, index_path)
+        index.list_projects()
+        dir_mtime = os.stat(projects_dir).st_mtime
+
+        config_path = project_path / "config.json"
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config["name"] = "외부 수정"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        _bump_mtime(config_path)
+        assert os.stat(projects_dir).st_mtime == dir_mtime
+
+        names = {p["id"]: p["name"] for p in index.list_projects()}
+        assert names[project_path.name] == "외부 수정"
+
+        reopened = ProjectIndex(projects_dir, index_path)
+        names = {p["id"]: p["name"] for p in reopened.list_projects()}
+        assert names[project_path.name] == "외부 수정"
+    print("   외부 config 수정 반영 확인")
+
+
+def test_broken_config_recovers_after_fix():
+    """config.json 파싱 실패 → 마지막 정상 config 유지, 고친 뒤 다시 파싱"""
+    with tempfile.TemporaryDirectory() as tmp:
+        projects_dir = Path(tmp) / "projects"
+        index_path = Path(tmp) / "project_index.json"
+        project_path = _make_project(projects_dir, 1)
+        config_path = project_path / "config.json"
+        good = config_path.read_text(encoding="utf-8")
+
+        index = ProjectIndex(projects_dir, index_path)
+        assert [p["name"] for p in index.list_projects()] == ["project1"]
+
+        # 수동 편집 오타 / 다른 세션이 쓰는 도중
+        config_path.write_text(good[:20], encoding="utf-8")
+        _bump_mtime(config_path)
+        assert [p["name"] for p in index.list_projects()] == ["project1"]
+        reopened = ProjectIndex(projects_dir, index_path)
+        assert [p["name"] for p in reopened.list_projects()] == ["project1"]
+
+        config = json.loads(good)
+        config["name"] = "고침"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        _bump_mtime(config_path)
+        assert [p["name"] for p in reopened.list_projects()] == ["고침"]
+        assert [p["name"] for p in ProjectIndex(projects_dir, index_path).list_projects()] == ["고침"]
+
+        # 처음부터 깨진 새 프로젝트 → 목록에서 빠졌다가 고치면 나타남
+        new_path = _make_project(projects_dir, 2)
+        new_config = (new_path / "config.json").read_text(encoding="utf-8")
+        (new_path / "config.json").write_text("{", encoding="utf-8")
+        _bump_mtime(projects_dir)
+        assert [p["name"] for p in reopened.list_projects()] == ["고침"]
+
+        (new_path / "config.json").write_text(new_config, encoding="utf-8")
+        _bump_mtime(new_path / "config.json")
+        reopened = ProjectIndex(projects_dir, index_path)
+        assert [p["name"] for p in reopened.list_projects()] == ["project2", "고침"]
+    print("   깨진 config 복구 확인")
+
+
+def test_progress_cached_until_folder_changes():
+    """단계 결과 폴더가 그대로면 저장된 진행 상황"""
+    with tempfile.TemporaryDirectory() as tmp:
+        projects_dir = Path(tmp) / "projects"
+        project_path = _make_project(projects_dir, 1)
+        index = ProjectIndex(projects_dir, Path(tmp) / "project_index.json")
+        index.list_projects()
+
+        assert index.progress(project_path)["completed_steps"] == [3]
+
+        calls = []
+        original = data_loader.check_step_completed
+        data_loader.check_step_completed = lambda path, step: calls.append(step) or original(path, step)
+        try:
+            assert index.progress(project_path)["current_step"] == 4
+            assert calls == []
+
+            (project_path / "audio" / "voice_001.mp3").write_bytes(b"mp3")
+            _bump_mtime(project_path / "audio")
+            progress = index.progress(project_path)
+            assert progress["completed_steps"] == [3, 4]
+            assert progress["current_step"] == 5
+            assert calls == list(range(1, 8))
+        finally:
+            data_loader.check_step_completed = original
+    print("   진행 상황 캐시 확인")
+
+
+def benchmark(projects: int = 300, images: int = 40):
+    """사이드바 1회 (목록 + 프로젝트별 진행 상황): 기존 방식 vs 인덱스"""
+    with tempfile.TemporaryDirectory() as tmp:
+        projects_dir = Path(tmp) / "projects"
+        paths = [_make_project(projects_dir, i, images) for i in range(projects)]
+
+        def legacy():
+            configs = []
+            for project_dir in projects_dir.iterdir():
+                with open(project_dir / "config.json", "r", encoding="utf-8") as f:
+                    configs.append(json.load(f))
+            for path in paths:
+                [step for step in range(1, 8) if data_loader.check_step_completed(path, step)]
+            return configs
+
+        start = time.time()
+        legacy()
+        legacy_time = time.time() - start
+
+        index = ProjectIndex(projects_dir, Path(tmp) / "project_index.json")
+        index.list_projects()
+        for path in paths:
+            index.progress(path)
+
+        start = time.time()
+        index.list_projects()
+        for path in paths:
+            index.progress(path)
+        index_time = time.time() - start
+
+    print(f"   기존 방식: {legacy_time * 1000:.0f}ms")
+    print(f"   인덱스: {index_time * 1000:.1f}ms  ({legacy_time / index_time:.0f}배)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("프로젝트 인덱스 테스트")
+    print("=" * 60)
+    test_list_projects_reuses_index()
+    test_external_config_edit_without_dir_change()
+    test_broken_config_recovers_after_fix()
+    test_progress_cached_until_folder_changes()
+
+    print()
+    print("=" * 60)
+    print("벤치마크")
+    print("=" * 60)
+    benchmark()
@@ -0,0 +1,137 @@
+"""
+이미지 API Rate limiter 테스트
+
+- burst=1 토큰 버킷은 요청 간격을 60/rpm초로 정확히 유지 (무료 요금제)
+- 동시 요청 수 제한 + 유료 모델 배치는 병렬 실행
+- 429 응답이면 백오프 후 재시도
+
+실행: python test_rate_limiter.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import utils.rate_limiter as rate_limiter
+from utils.rate_limiter import (
+    TokenBucketLimiter,
+    get_rate_limit_config,
+    is_rate_limit_error,
+    map_rate_limited,
+)
+
+
+def test_config_lookup():
+    """제공자 표시 이름/모델 패턴으로 설정 조회"""
+    assert get_rate_limit_config("together", "black-forest-labs/FLUX.1-schnell-Free")["rpm"] == 10
+    assert get_rate_limit_config("Together.ai FLUX", "black-forest-labs/FLUX.2-dev")["concurrency"] > 1
+    assert get_rate_limit_config("Google ImageFX", "IMAGEN_4")["concurrency"] == 1
+    assert is_rate_limit_error("API error 429: Too Many Requests")
+    assert not is_rate_limit_error("API error 500")
+    print("   설정 조회 확인")
+
+
+def test_free_tier_spacing():
+    """burst=1이면 요청 시작 간격이 60/rpm초"""
+    limiter = TokenBucketLimiter(rpm=600, concurrency=4, burst=1)  # 0.1초 간격
+    starts = []
+
+    def call(_):
+        starts.append(time.monotonic())
+        return "ok"
+
+    list(map_rate_limited(call, range(6), limiter, is_throttled=lambda r: False))
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.09 for gap in gaps), gaps
+    assert starts[-1] - starts[0] < 0.1 * 5 + 0.15
+    print(f"   간격 {min(gaps):.3f}~{max(gaps):.3f}초")
+
+
+def test_paid_tier_parallel_and_backoff():
+    """동시 요청 한도 안에서 병렬, 429면 재시도"""
+    limiter = TokenBucketLimiter(rpm=6000, concurrency=3)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    attempts = {}
+
+    def call(index):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            attempts[index] = attempts.get(index, 0) + 1
+            first_try = attempts[index] == 1
+        time.sleep(0.1)
+        with lock:
+            active -= 1
+        # 2번 항목은 첫 시도에 429
+        return "429 rate limit" if index == 2 and first_try else f"img{index}"
+
+    start = time.time()
+    results = dict(map_rate_limited(call, range(6), limiter, is_throttled=is_rate_limit_error))
+    elapsed = time.time() - start
+
+    assert peak == 3
+    assert results == {i: f"img{i}" for i in range(6)}
+    assert attempts[2] == 2 and limiter.throttled == 1
+    assert elapsed < 0.6 * 0.8  # 순차 0.7초 대비
+    print(f"   동시 {peak}개, 429 재시도 후 성공, {elapsed:.2f}초")
+
+
+def test_image_generator_batch_parallel():
+    """ImageGenerator.generate_batch가 한도 안에서 병렬 실행 + 순서 유지"""
+    from core.image.image_generator import ImageConfig, ImageGenerator, ImageResult
+
+    config = ImageConfig(provider="together", model="test/paid-model")
+    rate_limiter._limiters[("together", "test/paid-model")] = TokenBucketLimiter(rpm=6000, concurrency=4)
+
+    generator = ImageGenerator(config)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_generate(prompt, output_path=None, cfg=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.1)
+        with lock:
+            active -= 1
+        return ImageResult(success=True, image_path=output_path, prompt=prompt)
+
+    generator.generate = fake_generate
+    progress = []
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.time()
+            results = generator.generate_batch(
+                [f"p{i}" for i in range(8)], tmp, config,
+                on_progress=lambda c, t, r: progress.append(c)
+            )
+            elapsed = time.time() - start
+    finally:
+        rate_limiter._limiters.pop(("together", "test/paid-model"), None)
+
+    assert [r.prompt for r in results] == [f"p{i}" for i in range(8)]
+    assert results[0].image_path.endswith("image_001.png")
+    assert progress == list(range(1, 9))
+    assert peak == 4 and elapsed < 0.8
+    print(f"   배치 8장 동시 {peak}개, {elapsed:.2f}초 (기존: 장당 6초 대기)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Rate limiter 테스트")
+    print("=" * 60)
+    test_config_lookup()
+    test_free_tier_spacing()
+    test_paid_tier_parallel_and_backoff()
+    test_image_generator_batch_parallel()
@@ -0,0 +1,184 @@
+"""
+씬 합성기 배경 제거 회귀 테스트 / 마이크로 벤치마크
+
+NumPy 크로마키 구현이 기존 순수 Python 구현과 같은 알파 마스크를 만드는지 확인
+- 캐릭터 캐시: 같은 경로의 파일을 교체하면 새 이미지로 합성
+- 파이프라인(프로세스 풀) 합성 결과 = 순차 합성 결과
+
+실행: python test_scene_compositor.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageDraw
+
+from core.image.scene_compositor import SceneCompositor
+
+
+def _make_character_image(size: int = 256, bg=(0, 200, 0)) -> Image.Image:
+    """단색 배경 위에 그라데이션 캐릭터가 있는 테스트 이미지"""
+    image = Image.new("RGBA", (size, size), bg + (255,))
+    draw = ImageDraw.Draw(image)
+
+    # 배경색에서 점점 멀어지는 색으로 경계 구간(반투명 램프)을 만든다
+    for i in range(size // 4):
+        color = (i * 4 % 256, 200 - i, i * 2 % 256, 255)
+        draw.ellipse([i, i + size // 8, size - i, size - i], outline=color)
+
+    draw.rectangle([size // 3, size // 3, size * 2 // 3, size * 2 // 3], fill=(240, 180, 150, 200))
+    return image
+
+
+def _compositor() -> SceneCompositor:
+    # 출력 폴더/AI 분석기 초기화 없이 배경 제거만 사용
+    return SceneCompositor.__new__(SceneCompositor)
+
+
+def test_alpha_mask_matches_pure_python():
+    """NumPy 구현과 순수 Python 구현의 결과 비교"""
+    compositor = _compositor()
+    image = _make_character_image()
+    bg_color = image.getpixel((5, 5))[:3]
+
+    for tolerance in (20, 40, 60):
+        expected = compositor._remove_solid_background_pure(image, bg_color, tolerance)
+        actual = compositor._remove_solid_background(image, tolerance=tolerance)
+
+        assert actual.size == expected.size
+        assert actual.tobytes() == expected.tobytes(), f"tolerance={tolerance} 결과 불일치"
+
+    print("   알파 마스크 일치")
+
+
+def test_edge_blur_only_softens():
+    """edge_blur는 알파를 줄이기만 하고 늘리지 않음"""
+    compositor = _compositor()
+    image = _make_character_image()
+
+    sharp = compositor._remove_solid_background(image)
+    blurred = compositor._remove_solid_background(image, edge_blur=2)
+
+    sharp_alpha = sharp.getchannel("A").tobytes()
+    blurred_alpha = blurred.getchannel("A").tobytes()
+
+    assert all(b <= a for a, b in zip(sharp_alpha, blurred_alpha))
+    assert sharp_alpha != blurred_alpha
+    assert sharp.convert("RGB").tobytes() == blurred.convert("RGB").tobytes()
+
+    print("   edge_blur 확인")
+
+
+def _write_scene_inputs(tmp: Path):
+    """배경 3장 + 캐릭터 2명 + 씬 5개"""
+    backgrounds = {}
+    for scene_id in range(1, 6):
+        path = tmp / f"bg_{scene_id}.png"
+        Image.new("RGBA", (320, 180), (30 * scene_id, 90, 160, 255)).save(path)
+        backgrounds[scene_id] = {"image_path": str(path)}
+
+    characters = {}
+    for name, bg in [("민수", (0, 200, 0)), ("지영", (0, 0, 220))]:
+        path = tmp / f"{name}.png"
+        _make_character_image(128, bg).save(path)
+        characters[name] = {"image_path": str(path)}
+
+    scenes = [
+        {"scene_id": 1, "characters": ["민수"]},
+        {"scene_id": 2, "characters": ["민수", "지영"]},
+        {"scene_id": 3, "characters": []},
+        {"scene_id": 4, "characters": ["지영"]},
+        {"scene_id": 5, "characters": ["지영", "민수"]},
+    ]
+    return scenes, backgrounds, characters
+
+
+def test_character_cache_follows_file_changes():
+    """같은 경로에 다른 캐릭터 이미지를 저장하면 캐시 대신 새 파일 사용"""
+    with tempfile.TemporaryDirectory() as tmp:
+        compositor = SceneCompositor(tmp)
+        char_path = Path(tmp) / "character.png"
+
+        _make_character_image(128).save(char_path)
+        first = compositor._prepare_character(str(char_path), 180, "medium", True)
+        assert compositor._prepare_character(str(char_path), 180, "medium", True) is first
+
+        Image.new("RGBA", (64, 128), (250, 20, 20, 255)).save(char_path)
+        stat = os.stat(char_path)
+        os.utime(char_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        second = compositor._prepare_character(str(char_path), 180, "medium", True)
+        assert second.size != first.size
+    print("   캐릭터 캐시 파일 변경 반영 확인")
+
+
+def test_parallel_matches_sequential():
+    """파이프라인 합성 결과 = 순차 합성 결과 (픽셀 단위)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        scenes, backgrounds, characters = _write_scene_inputs(tmp)
+
+        sequential = SceneCompositor(str(tmp / "seq")).composite_all_scenes(
+            scenes, backgrounds, characters, parallel=False
+        )
+        # parallel 미지정 + 씬 수가 기준 이상 → 파이프라인 모드 자동 사용
+        compositor = SceneCompositor(str(tmp / "par"))
+        compositor.PARALLEL_MIN_SCENES = len(scenes)
+        pipelined = []
+        run_parallel = compositor._composite_jobs_parallel
+        compositor._composite_jobs_parallel = lambda *args, **kwargs: pipelined.append(1) or run_parallel(*args, **kwargs)
+        progress = []
+        parallel = compositor.composite_all_scenes(
+            scenes, backgrounds, characters, max_workers=2,
+            on_progress=lambda current, total, result: progress.append(result["scene_id"])
+        )
+
+        assert pipelined == [1]
+        assert sorted(progress) == [1, 2, 3, 4, 5]
+        assert [r["scene_id"] for r in parallel] == [1, 2, 3, 4, 5]
+        for seq, par in zip(sequential, parallel):
+            assert seq["success"] and par["success"]
+            assert seq["characters_used"] == par["characters_used"]
+            with Image.open(seq["image_path"]) as a, Image.open(par["image_path"]) as b:
+                assert a.size == b.size and a.tobytes() == b.tobytes()
+    print("   파이프라인 합성 = 순차 합성 확인")
+
+
+def benchmark(size: int = 1024, repeat: int = 3):
+    """1024x1024 캐릭터 기준 처리 시간 비교"""
+    compositor = _compositor()
+    image = _make_character_image(size)
+    bg_color = image.getpixel((5, 5))[:3]
+
+    start = time.time()
+    for _ in range(repeat):
+        compositor._remove_solid_background_pure(image, bg_color, 40)
+    pure = (time.time() - start) / repeat
+
+    start = time.time()
+    for _ in range(repeat):
+        compositor._remove_solid_background(image)
+    vectorized = (time.time() - start) / repeat
+
+    print(f"   {size}x{size}: 순수 Python {pure * 1000:.1f}ms, NumPy {vectorized * 1000:.1f}ms "
+          f"({pure / max(vectorized, 1e-9):.1f}배)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("배경 제거 회귀 테스트")
+    print("=" * 60)
+    test_alpha_mask_matches_pure_python()
+    test_edge_blur_only_softens()
+    test_character_cache_follows_file_changes()
+    test_parallel_matches_sequential()
+
+    print("\n" + "=" * 60)
+    print("마이크로 벤치마크")
+    print("=" * 60)
+    benchmark()
@@ -0,0 +1,110 @@
+"""
+적응형 동시성 (AIMD) 테스트
+
+- 제어기: 정상 완료 시 한도 증가, 오류/지연 급증 시 절반으로 감소
+- 서버 처리 슬롯이 2개인 가짜 Chatterbox 서버에서 한도가 슬롯 수 근처로 수렴
+
+실행: python test_tts_adaptive.py
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.tts_parallel_generator import AIMDConcurrencyController, ParallelTTSGenerator
+
+
+def test_controller_aimd():
+    """가산 증가 / 곱셈 감소 / 한 번의 혼잡에 한 번만 감소"""
+    ctrl = AIMDConcurrencyController(max_limit=8, initial_limit=2)
+
+    # 글자당 1ms로 정상 완료 → 한도 증가
+    for _ in range(12):
+        start = ctrl.acquire()
+        time.sleep(0.01)
+        ctrl.release(start, ok=True, units=10)
+    grown = ctrl.current_limit
+    assert grown > 2
+
+    # 동시에 시작된 요청 3개가 모두 실패 → 감소는 1회
+    starts = [ctrl.acquire() for _ in range(3)]
+    for start in starts:
+        ctrl.release(start, ok=False, units=10)
+    assert ctrl.current_limit == max(1, int(ctrl.limit)) < grown
+    assert ctrl.decreases == 1
+
+    # 캐시 적중 등 sample=False는 한도에 영향 없음
+    before = ctrl.limit
+    ctrl.release(ctrl.acquire(), ok=True, sample=False)
+    assert ctrl.limit == before and ctrl.in_flight == 0
+
+    print(f"   증가 → {grown}, 실패 후 → {ctrl.current_limit}")
+
+
+class _SlottedServer(BaseHTTPRequestHandler):
+    """동시 처리 슬롯이 제한된 가짜 서버 (슬롯 초과 요청은 대기 → 지연 증가)"""
+    slots = threading.Semaphore(2)
+    ms_per_char = 1.0
+    order = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _SlottedServer.order.append(len(body["text"]))
+        with _SlottedServer.slots:
+            time.sleep(len(body["text"]) * _SlottedServer.ms_per_char / 1000)
+        self._reply(json.dumps({"success": True, "audio_url": "/a.wav", "duration_seconds": 1.0}).encode())
+
+    def do_GET(self):
+        self._reply(b"RIFF" + b"\0" * 2000)
+
+    def _reply(self, payload):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def test_adaptive_generator_converges():
+    """슬롯 2개 서버 → 상한 8에서 시작해도 과도한 동시성으로 머물지 않음, 긴 텍스트 먼저"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlottedServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        scenes = [{"scene_id": i + 1, "text": "가" * (20 + (i * 7) % 40)} for i in range(40)]
+        generator = ParallelTTSGenerator(
+            api_url=f"http://127.0.0.1:{server.server_address[1]}",
+            max_workers=8, timeout=10, use_cache=False, adaptive=True
+        )
+        _SlottedServer.order = []
+        results = generator.generate_all(scenes, {})
+
+        assert all(r["success"] for r in results)
+        assert [r["scene_id"] for r in results] == list(range(1, 41))
+
+        # 첫 투입분은 가장 긴 텍스트들
+        assert min(_SlottedServer.order[:2]) >= 50
+
+        stats = generator.last_run_stats
+        assert stats["mode"] == "adaptive"
+        assert 1 <= stats["concurrency"] <= 4
+        assert stats["decreases"] >= 1
+        print(f"   최종 동시성 {stats['concurrency']} (최대 {stats['peak_concurrency']}), "
+              f"병렬 효율 {stats['efficiency']}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("적응형 동시성 테스트")
+    print("=" * 60)
+    test_controller_aimd()
+    test_adaptive_generator_converges()
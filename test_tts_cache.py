@@ -0,0 +1,142 @@
+"""
+TTS 결과 캐시 테스트
+
+- 키: 텍스트/음성 파일 내용/파라미터가 같으면 동일, 하나라도 바뀌면 다름
+- 용량 초과 시 오래 쓰지 않은 항목부터 삭제
+- 씬 일부만 수정 후 재생성하면 수정된 씬만 합성 (로컬 가짜 서버로 확인)
+
+실행: python test_tts_cache.py
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import utils.tts_cache as tts_cache
+from utils.tts_cache import TTSResultCache
+from utils.tts_parallel_generator import ParallelTTSGenerator
+
+
+SETTINGS = {"language": "ko", "voice_ref_path": None, "exaggeration": 0.5, "seed": 42}
+
+
+def test_key_sensitivity():
+    """텍스트/파라미터/음성 파일 내용이 키에 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TTSResultCache(Path(tmp) / "tts")
+        voice = Path(tmp) / "voice.wav"
+        voice.write_bytes(b"voice-a" * 100)
+
+        settings = {**SETTINGS, "voice_ref_path": str(voice)}
+        base = cache.make_key("안녕하세요", settings)
+
+        assert base == cache.make_key("안녕하세요", dict(settings))
+        assert base != cache.make_key("안녕하세요!", settings)
+        assert base != cache.make_key("안녕하세요", {**settings, "exaggeration": 0.6})
+        assert base != cache.make_key("안녕하세요", settings, engine="edge")
+
+        # 같은 경로라도 내용이 바뀌면 다른 키
+        voice.write_bytes(b"voice-b" * 120)
+        assert base != cache.make_key("안녕하세요", settings)
+
+    print("   키 구성 확인")
+
+
+def test_lru_eviction():
+    """용량 초과 시 최근 조회하지 않은 항목부터 삭제"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TTSResultCache(Path(tmp) / "tts", max_size_mb=0.05)  # ~52KB
+        audio = b"\0" * 15000
+
+        for name in ("a", "b", "c"):
+            cache.put(name, audio, 1.0)
+        assert cache.get("a") is not None  # a를 최근 사용으로
+
+        cache.put("d", audio, 1.0)  # b가 밀려남
+        assert cache.get("b") is None
+        assert all(cache.get(k) is not None for k in ("a", "c", "d"))
+
+        # 재시작 후에도 인덱스 복원
+        reopened = TTSResultCache(Path(tmp) / "tts", max_size_mb=0.05)
+        assert reopened.stats()["entries"] == 3
+
+    print("   LRU 삭제 확인")
+
+
+class _FakeChatterbox(BaseHTTPRequestHandler):
+    """/generate 호출 횟수를 세는 최소 Chatterbox 서버"""
+    generated = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _FakeChatterbox.generated.append(body["text"])
+        payload = json.dumps({
+            "success": True,
+            "audio_url": f"/audio/{len(_FakeChatterbox.generated)}",
+            "duration_seconds": 1.5
+        }).encode()
+        self._reply(payload, "application/json")
+
+    def do_GET(self):
+        self._reply(b"RIFF" + b"\0" * 4000, "audio/wav")
+
+    def _reply(self, payload, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def test_rerun_only_synthesizes_changed_scenes():
+    """20개 중 3개 수정 후 재생성 → 3개만 합성, 나머지는 cache_hit"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeChatterbox)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = tts_cache._tts_cache_instance
+        tts_cache._tts_cache_instance = TTSResultCache(Path(tmp) / "tts")
+        try:
+            scenes = [{"scene_id": i + 1, "text": f"씬 {i + 1} 내레이션입니다."} for i in range(20)]
+            generator = ParallelTTSGenerator(api_url=api_url, max_workers=4, timeout=10)
+
+            _FakeChatterbox.generated = []
+            first = generator.generate_all(scenes, SETTINGS)
+            assert len(_FakeChatterbox.generated) == 20
+            assert not any(r.get("cache_hit") for r in first)
+
+            for i in (2, 9, 15):
+                scenes[i] = {**scenes[i], "text": scenes[i]["text"] + " (수정)"}
+
+            _FakeChatterbox.generated = []
+            second = generator.generate_all(scenes, SETTINGS)
+
+            assert sorted(_FakeChatterbox.generated) == sorted(scenes[i]["text"] for i in (2, 9, 15))
+            assert all(r["success"] for r in second)
+            hits = [r for r in second if r.get("cache_hit")]
+            assert len(hits) == 17
+            assert all(r["generation_time"] == 0.0 and r["duration"] == 1.5 for r in hits)
+        finally:
+            tts_cache._tts_cache_instance = previous
+            server.shutdown()
+
+    print("   수정된 씬만 재합성 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TTS 결과 캐시 테스트")
+    print("=" * 60)
+    test_key_sensitivity()
+    test_lru_eviction()
+    test_rerun_only_synthesizes_changed_scenes()
@@ -0,0 +1,122 @@
+"""
+문장 단위 증분 재합성 테스트
+
+가짜 합성기(문장 길이에 비례하는 톤)로 확인:
+- 첫 생성은 모든 문장 합성, 한 문장 수정 시 그 문장만 재합성
+- 문장 삽입/삭제 시 나머지 테이크 재사용
+- 음성/파라미터 키가 바뀌면 전체 재합성
+- 문장 타이밍이 병합 오디오 길이와 일치 (SRT 일관성)
+
+실행: python test_tts_incremental.py
+"""
+import io
+import os
+import sys
+import tempfile
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from utils.tts_incremental import (
+    IncrementalSceneSynthesizer,
+    diff_sentences,
+    scenes_to_srt,
+    sentences_to_srt,
+)
+
+
+class _FakeSynth:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, sentence):
+        self.calls.append(sentence)
+        tone = Sine(200 + 10 * len(sentence)).to_audio_segment(duration=60 * len(sentence))
+        output = io.BytesIO()
+        tone.set_frame_rate(24000).set_channels(1).export(output, format="wav")
+        return output.getvalue(), len(tone) / 1000
+
+
+def test_diff_sentences():
+    old = ["가.", "나.", "다.", "라."]
+    assert diff_sentences(old, ["가.", "나!", "다.", "라."]) == [0, None, 2, 3]
+    assert diff_sentences(old, ["가.", "새.", "나.", "다.", "라."]) == [0, None, 1, 2, 3]
+    assert diff_sentences(old, ["나.", "라."]) == [1, 3]
+    print("   문장 diff 확인")
+
+
+def test_incremental_resynthesis():
+    synth = _FakeSynth()
+    text = "첫 문장입니다. 두번째 문장이에요! 세번째는 질문일까요? 마지막 문장."
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inc = IncrementalSceneSynthesizer(tmp, synth)
+
+        first = inc.synthesize_scene(1, text, "voice-a")
+        assert first["success"] and first["synthesized_count"] == 4 and len(synth.calls) == 4
+
+        # 오타 수정 1개 → 1문장만 합성
+        synth.calls = []
+        edited = text.replace("두번째 문장이에요!", "두 번째 문장이에요!")
+        assert inc.plan(1, edited, "voice-a") == {"sentences": 4, "reused": 3, "synthesize": 1}
+        second = inc.synthesize_scene(1, edited, "voice-a")
+        assert synth.calls == ["두 번째 문장이에요!"]
+        assert [s["reused"] for s in second["sentences"]] == [True, False, True, True]
+
+        # 타이밍: 연속 + 마지막 끝 = 전체 길이
+        audio = AudioSegment.from_file(io.BytesIO(second["audio_data"]), format="wav")
+        spans = [(s["start_ms"], s["end_ms"]) for s in second["sentences"]]
+        assert spans[0][0] == 0 and spans[-1][1] == len(audio)
+        assert all(spans[i][1] == spans[i + 1][0] for i in range(len(spans) - 1))
+        assert abs(second["duration"] - len(audio) / 1000) < 0.01
+
+        # 문장 삽입 → 새 문장만
+        synth.calls = []
+        inc.synthesize_scene(1, edited + " 추가 문장.", "voice-a")
+        assert synth.calls == ["추가 문장."]
+
+        # 음성 변경 → 전체
+        synth.calls = []
+        inc.synthesize_scene(1, edited, "voice-b")
+        assert len(synth.calls) == 4
+
+        # 저장된 테이크는 현재 문장 수만큼만 유지
+        assert len([f for f in os.listdir(os.path.join(tmp, "scene_001")) if f.endswith(".wav")]) == 4
+
+        srt = sentences_to_srt(second["sentences"], offset_ms=1000)
+        assert srt.splitlines()[1].startswith("00:00:01,000 --> ")
+
+    print("   수정 문장만 재합성 / 타이밍 일관성 확인")
+
+
+def test_scenes_to_srt_offsets_and_scaling():
+    """씬 시작 위치만큼 밀고, 정규화로 바뀐 씬 길이에 맞춰 비례 조정"""
+    scenes = [
+        {"duration": 2.0, "sentences": [
+            {"text": "첫 문장.", "start_ms": 0, "end_ms": 1000},
+            {"text": "둘째 문장.", "start_ms": 1000, "end_ms": 2000},
+        ]},
+        # 2000ms로 이어붙인 씬이 템포 보정 후 1600ms
+        {"duration": 1.6, "sentences": [
+            {"text": "셋째 문장.", "start_ms": 0, "end_ms": 500},
+            {"text": "넷째 문장.", "start_ms": 500, "end_ms": 2000},
+        ]},
+    ]
+    lines = scenes_to_srt(scenes).splitlines()
+    assert lines[0] == "1" and lines[1] == "00:00:00,000 --> 00:00:01,000"
+    assert lines[8] == "3" and lines[9] == "00:00:02,000 --> 00:00:02,400"
+    assert lines[12] == "4" and lines[13] == "00:00:02,400 --> 00:00:03,600"
+    assert lines[14] == "넷째 문장."
+    print("   씬 SRT 오프셋/길이 보정 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("증분 재합성 테스트")
+    print("=" * 60)
+    test_diff_sentences()
+    test_incremental_resynthesis()
+    test_scenes_to_srt_offsets_and_scaling()
@@ -0,0 +1,248 @@
+"""
+API 사용 기록 저장소 테스트
+
+- 기존 api_usage.json은 최초 1회만 가져오기
+- record_usage는 파일 전체를 다시 쓰지 않고 큐에 넣고 바로 반환
+- 롤업 기반 요약 = 전체 기록을 직접 집계한 결과 (기간 경계 부분 일자 포함)
+- 기간 이전 삭제 후에도 롤업이 남은 기록과 일치
+- 온전한 날짜 요약은 메모리 롤업만 사용 (쓰기 대기/DB 조회 없음)
+- 벤치마크: 100만 건 기록에서 전체 순회 vs 롤업 요약
+
+실행: python test_usage_store.py
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.api.api_manager import APIManager
+from core.api.usage_store import UsageStore
+
+
+def _make_manager(tmp: str, legacy_json: Path = None) -> APIManager:
+    manager = APIManager.__new__(APIManager)
+    manager.usage_store = UsageStore(Path(tmp) / "api_usage.db", legacy_json=legacy_json)
+    return manager
+
+
+def _synthetic_records(count: int, start: datetime, seed: int = 1):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        ts = start + timedelta(minutes=rng.randint(0, 60 * 24 * 10))
+        records.append({
+            "provider": rng.choice(["together", "anthropic", "google"]),
+            "model_id": "m",
+            "function": rng.choice(["image_generation", "text_generation"]),
+            "timestamp": ts.isoformat(),
+            "tokens_input": rng.randint(0, 500),
+            "tokens_output": rng.randint(0, 500),
+            "units_used": 1,
+            "cost_estimate": round(rng.random() / 100, 6),
+            "duration_seconds": rng.random(),
+            "success": rng.random() > 0.1,
+            "error_message": "",
+            "project_name": "",
+            "step_name": "",
+            "cache_hit": False,
+            "cost_saved": 0.0,
+        })
+    return records
+
+
+def _reference_summary(records, start=None, end=None, provider=None):
+    """예전 방식 (전체 기록 직접 집계)"""
+    picked = [
+        r for r in records
+        if (start is None or datetime.fromisoformat(r["timestamp"]) >= start)
+        and (end is None or datetime.fromisoformat(r["timestamp"]) <= end)
+        and (provider is None or r["provider"] == provider)
+    ]
+    by_date = {}
+    for r in picked:
+        by_date[r["timestamp"][:10]] = by_date.get(r["timestamp"][:10], 0) + 1
+    return {
+        "total_requests": len(picked),
+        "failed_requests": sum(1 for r in picked if not r["success"]),
+        "total_cost": sum(r["cost_estimate"] for r in picked),
+        "total_tokens_input": sum(r["tokens_input"] for r in picked),
+        "by_date": by_date,
+    }
+
+
+def _assert_matches(summary, reference):
+    assert summary["total_requests"] == reference["total_requests"]
+    assert summary["failed_requests"] == reference["failed_requests"]
+    assert summary["total_tokens_input"] == reference["total_tokens_input"]
+    assert abs(summary["total_cost"] - reference["total_cost"]) < 1e-6
+    assert {d: v["requests"] for d, v in summary["by_date"].items()} == reference["by_date"]
+
+
+def test_legacy_import_once():
+    """api_usage.json은 한 번만 가져옴"""
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "api_usage.json"
+        records = _synthetic_records(5, datetime(2025, 12, 1))
+        for r in records:
+            del r["cache_hit"], r["cost_saved"]  # 예전 형식
+        legacy.write_text(json.dumps(records), encoding="utf-8")
+
+        manager = _make_manager(tmp, legacy)
+        assert manager.get_usage_summary()["total_requests"] == 5
+
+        reopened = _make_manager(tmp, legacy)
+        assert reopened.get_usage_summary()["total_requests"] == 5
+        assert len(reopened.get_recent_usage()) == 5
+    print("   레거시 JSON 1회 가져오기 확인")
+
+
+def test_summary_matches_full_scan():
+    """롤업 요약 = 전체 집계 (경계 부분 일자 포함)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp)
+        base = datetime(2026, 3, 1)
+        records = _synthetic_records(3000, base)
+        for r in records:
+            manager.usage_store.append(r)
+
+        _assert_matches(manager.get_usage_summary(), _reference_summary(records))
+
+        cases = [
+            (base + timedelta(days=2, hours=13, minutes=7), None, None),
+            (base + timedelta(days=3), base + timedelta(days=6, hours=5), None),
+            (base + timedelta(days=4, hours=1), base + timedelta(days=4, hours=20), "google"),
+            (None, base + timedelta(days=1, hours=12), "together"),
+        ]
+        for start, end, provider in cases:
+            _assert_matches(
+                manager.get_usage_summary(start_date=start, end_date=end, provider=provider),
+                _reference_summary(records, start, end, provider)
+            )
+
+        # 이전 기록 삭제 후 경계 일자 롤업 재계산
+        cutoff = base + timedelta(days=5, hours=8)
+        manager.clear_usage_history(before_date=cutoff)
+        remaining = [r for r in records if datetime.fromisoformat(r["timestamp"]) >= cutoff]
+        _assert_matches(manager.get_usage_summary(), _reference_summary(remaining))
+
+        errors = manager.get_error_logs(limit=10)
+        assert errors and all(not r.success for r in errors)
+        manager.usage_store.flush()
+    print("   롤업 요약 / 기간 경계 / 삭제 확인")
+
+
+def test_record_usage_is_cheap():
+    """record_usage는 큐에만 넣고 반환 (파일 재작성 없음)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp)
+        start = time.time()
+        for i in range(2000):
+            manager.record_usage("anthropic", "claude-sonnet", "text_generation",
+                                 tokens_input=100, tokens_output=50)
+        elapsed = time.time() - start
+
+        summary = manager.get_usage_summary(start_date=datetime.now() - timedelta(hours=1))
+        assert summary["total_requests"] == 2000
+        assert summary["total_tokens_output"] == 100000
+        manager.usage_store.flush()
+    print(f"   record_usage 2000회 {elapsed * 1000:.0f}ms")
+
+
+def test_full_day_summary_uses_memory_rollup():
+    """온전한 날짜 요약은 flush 없이 메모리 롤업에서"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp)
+        records = _synthetic_records(500, datetime(2026, 5, 1))
+        for r in records:
+            manager.usage_store.append(r)
+
+        flush = manager.usage_store.flush
+        manager.usage_store.flush = lambda: (_ for _ in ()).throw(AssertionError("flush 호출"))
+        try:
+            _assert_matches(manager.get_usage_summary(), _reference_summary(records))
+            start = datetime(2026, 5, 3)
+            _assert_matches(
+                manager.get_usage_summary(start_date=start, provider="anthropic"),
+                _reference_summary(records, start, None, "anthropic")
+            )
+        finally:
+            # 임시 폴더 삭제 전에 백그라운드 쓰기 마무리
+            manager.usage_store.flush = flush
+            manager.usage_store.flush()
+    print("   메모리 롤업 요약 확인")
+
+
+def benchmark(count: int = 1_000_000, days: int = 365):
+    """기록 수에 따른 요약 시간 (전체 순회 vs 일별 롤업)"""
+    rng = random.Random(7)
+    base = datetime(2025, 1, 1)
+    providers = ["together", "anthropic", "google", "openai"]
+    functions = ["image_generation", "text_generation", "tts"]
+    records = [
+        {
+            "provider": rng.choice(providers),
+            "model_id": "m",
+            "function": rng.choice(functions),
+            "timestamp": (base + timedelta(seconds=rng.randint(0, days * 86400 - 1))).isoformat(),
+            "tokens_input": 100,
+            "tokens_output": 50,
+            "units_used": 1,
+            "cost_estimate": 0.001,
+            "duration_seconds": 0.5,
+            "success": True,
+            "error_message": "",
+            "project_name": "",
+            "step_name": "",
+            "cache_hit": False,
+            "cost_saved": 0.0,
+        }
+        for _ in range(count)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp)
+        store = manager.usage_store
+        start = time.time()
+        for i in range(0, count, 50_000):
+            store._write_batch(store._get_conn(), records[i:i + 50_000])
+        store._load_daily()
+        print(f"   {count:,}건 적재 {time.time() - start:.1f}s")
+
+        start = time.time()
+        _reference_summary(records)
+        scan = time.time() - start
+
+        start = time.time()
+        manager.get_usage_summary()
+        rollup = time.time() - start
+
+        start = time.time()
+        manager.get_usage_summary(start_date=base + timedelta(days=300, hours=9))
+        ranged = time.time() - start
+
+    print(f"   전체 순회: {scan * 1000:.0f}ms")
+    print(f"   롤업 요약 (전체 기간): {rollup * 1000:.1f}ms  ({scan / rollup:.0f}배)")
+    print(f"   롤업 요약 (최근 65일, 시작일 부분 조회 포함): {ranged * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("API 사용 기록 저장소 테스트")
+    print("=" * 60)
+    test_legacy_import_once()
+    test_summary_matches_full_scan()
+    test_record_usage_is_cheap()
+    test_full_day_summary_uses_memory_rollup()
+
+    print()
+    print("=" * 60)
+    print("벤치마크")
+    print("=" * 60)
+    benchmark()
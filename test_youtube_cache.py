@@ -0,0 +1,131 @@
+"""
+YouTube 캐시 코덱 테스트
+
+- zstd로 저장된 행을 zstandard 없는 환경에서 열면 예외 대신 캐시 미스 (행 삭제)
+- 손상된 압축 행도 미스로 처리, 나머지 행은 정상 조회
+- 용량 검사: 매 저장마다가 아니라 N회/추정 증가량 기준, 한도는 계속 지켜짐
+- get_video_details: 빈 값으로 저장된 캐시 항목은 미스로 보고 다시 조회
+
+실행: python test_youtube_cache.py
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import core.youtube.cache as cache_module
+from core.youtube.cache import CODEC_JSON_ZLIB, CODEC_JSON_ZSTD, YouTubeCache
+from core.youtube.search import YouTubeSearcher
+
+
+def _insert_raw(cache: YouTubeCache, cache_type: str, params: dict, data: bytes, codec: int):
+    """다른 환경에서 쓴 행 흉내 (인코딩 없이 직접 저장)"""
+    key = cache._generate_cache_key(cache_type, params)
+    conn = cache._get_conn()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (cache_key, cache_type, data, codec, expires_at, last_accessed) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, cache_type, data, codec, datetime.now() + timedelta(hours=1), datetime.now())
+        )
+    return key
+
+
+def test_undecodable_rows_are_misses():
+    original = (cache_module.HAS_ZSTD, cache_module.zstandard)
+    cache_module.HAS_ZSTD, cache_module.zstandard = False, None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = YouTubeCache(cache_dir=Path(tmp), memory_cache_size=0, codec=CODEC_JSON_ZLIB)
+
+            cache.set("videos", {"video_id": "ok"}, {"title": "정상"})
+            zstd_key = _insert_raw(cache, "videos", {"video_id": "zstd"}, b"\x28\xb5\x2f\xfd\x00", CODEC_JSON_ZSTD)
+            _insert_raw(cache, "videos", {"video_id": "broken"}, b"not-zlib", CODEC_JSON_ZLIB)
+
+            assert cache.get("videos", {"video_id": "zstd"}) is None
+            assert cache.get("videos", {"video_id": "ok"}) == {"title": "정상"}
+
+            hits, misses = cache.get_many(
+                "videos", [{"video_id": "ok"}, {"video_id": "broken"}, {"video_id": "zstd"}]
+            )
+            assert hits == [({"video_id": "ok"}, {"title": "정상"})]
+            assert misses == [{"video_id": "broken"}, {"video_id": "zstd"}]
+
+            # 읽을 수 없는 행은 삭제 → 다음 저장 시 현재 코덱으로 다시 씀
+            remaining = cache._get_conn().execute(
+                "SELECT COUNT(*) FROM cache WHERE cache_key = ?", (zstd_key,)
+            ).fetchone()[0]
+            assert remaining == 0
+    finally:
+        cache_module.HAS_ZSTD, cache_module.zstandard = original
+    print("   디코딩 실패 행 → 캐시 미스 확인")
+
+
+def test_size_limit_checked_periodically():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = YouTubeCache(cache_dir=Path(tmp), memory_cache_size=0)
+        checks = []
+        enforce = cache.enforce_size_limit
+        cache.enforce_size_limit = lambda: checks.append(1) or enforce()
+
+        for i in range(500):
+            cache.set("videos", {"video_id": f"v{i}"}, {"title": f"영상 {i}"})
+        # 첫 저장 + SIZE_CHECK_EVERY_WRITES마다
+        assert len(checks) == 1 + 500 // YouTubeCache.SIZE_CHECK_EVERY_WRITES
+
+    with tempfile.TemporaryDirectory() as tmp:
+        limit_mb = 0.25
+        cache = YouTubeCache(cache_dir=Path(tmp), memory_cache_size=0, max_db_size_mb=limit_mb)
+        for i in range(400):
+            cache.set("videos", {"video_id": f"v{i}"}, {"blob": os.urandom(1500).hex()})
+        # 검사 사이 증가분 (한도의 2%) + 페이지 여유 안에서 한도 유지
+        assert cache.get_db_size_bytes() <= limit_mb * 1024 * 1024 * 1.1
+    print("   용량 검사 주기 / 한도 유지 확인")
+
+
+class _FakeVideosAPI:
+    """youtube.videos().list(...).execute() 흉내 - 요청한 ID 기록"""
+
+    def __init__(self):
+        self.requested = []
+
+    def videos(self):
+        return self
+
+    def list(self, part, id):
+        self.requested.append(id.split(","))
+        self._ids = id.split(",")
+        return self
+
+    def execute(self):
+        return {"items": [{"id": vid} for vid in self._ids]}
+
+
+def test_video_details_refetches_falsy_hits():
+    with tempfile.TemporaryDirectory() as tmp:
+        searcher = YouTubeSearcher.__new__(YouTubeSearcher)
+        searcher.cache = YouTubeCache(cache_dir=Path(tmp), memory_cache_size=0)
+        searcher.youtube = _FakeVideosAPI()
+        searcher._parse_video = lambda item: {"video_id": item["id"], "title": f"영상 {item['id']}"}
+
+        searcher.cache.set("videos", {"video_id": "a"}, {"video_id": "a", "title": "캐시"})
+        searcher.cache.set("videos", {"video_id": "b"}, {})
+
+        results = searcher.get_video_details(["a", "b", "c"])
+        assert searcher.youtube.requested == [["b", "c"]]
+        assert [v["video_id"] for v in results] == ["a", "b", "c"]
+        assert searcher.cache.get("videos", {"video_id": "b"}) == {"video_id": "b", "title": "영상 b"}
+    print("   빈 캐시 항목 재조회 확인")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("YouTube 캐시 테스트")
+    print("=" * 60)
+    test_undecodable_rows_are_misses()
+    test_size_limit_checked_periodically()
+    test_video_details_refetches_falsy_hits()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+오디오 배치 처리 엔진 - 씬 단위 작업을 프로세스 풀로 분산
+
+- 작업 함수는 모듈 최상위 함수여야 함 (Windows spawn 호환)
+- 오디오는 WAV/PCM 바이트로만 주고받음 (AudioSegment 객체를 피클하지 않음)
+- 진행률 콜백은 부모 프로세스에서만 호출 (Streamlit 안전)
+- 풀 생성/피클 실패 시 남은 작업만 순차 처리로 자동 폴백
+- 작업 함수 안에서 난 예외는 폴백 없이 그대로 전파 (워커 traceback 포함)
+"""
+
+import os
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence
+
+# 기본 워커 수 (UI 스레드용 코어 1개 남김)
+DEFAULT_AUDIO_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+
+class _RemoteTraceback(Exception):
+    """워커 프로세스 traceback (전파하는 예외의 __cause__로 표시)"""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+class _JobFailed:
+    """워커에서 작업 함수가 던진 예외 (풀 인프라 오류와 구분하기 위해 결과로 반환)"""
+
+    def __init__(self, error: BaseException, tb: str):
+        self.error = error
+        self.tb = tb
+
+
+def _call_job(func: Callable[[Any], Any], job: Any) -> Any:
+    """워커 진입점 - 작업 함수 예외를 결과로 감쌈"""
+    try:
+        return func(job)
+    except Exception as e:
+        return _JobFailed(e, traceback.format_exc())
+
+
+def run_audio_batch(
+    func: Callable[[Any], Any],
+    jobs: Sequence[Any],
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    label: str = "처리"
+) -> List[Any]:
+    """
+    작업 목록을 프로세스 풀에서 실행하고 입력 순서대로 결과 반환
+
+    Args:
+        func: 모듈 최상위 작업 함수 (job 1개 → 결과 1개)
+        jobs: 작업 인자 목록 (피클 가능한 값만)
+        workers: 프로세스 수 (None이면 DEFAULT_AUDIO_WORKERS, 1이면 순차 처리)
+        progress_callback: (current, total, message)
+        label: 진행률 메시지 접두어
+
+    Returns:
+        jobs와 같은 순서의 결과 리스트
+
+    작업 함수가 던진 예외는 그대로 전파됩니다 (남은 작업은 취소).
+    풀 생성/피클 실패/워커 비정상 종료만 인프라 문제로 보고 끝나지 않은 작업을 순차 처리합니다.
+    """
+    total = len(jobs)
+    workers = min(workers or DEFAULT_AUDIO_WORKERS, total)
+    results: List[Any] = [None] * total
+    finished = [False] * total
+
+    def report(done: int):
+        if progress_callback:
+            try:
+                progress_callback(done, total, f"{label} {done}/{total}")
+            except Exception:
+                pass
+
+    if workers > 1:
+        failure: Optional[_JobFailed] = None
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_call_job, func, job): i for i, job in enumerate(jobs)}
+                for future in as_completed(futures):
+                    result = future.result()
+                    if isinstance(result, _JobFailed):
+                        failure = result
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    index = futures[future]
+                    results[index] = result
+                    finished[index] = True
+                    report(sum(finished))
+
+        except (BrokenProcessPool, OSError, pickle.PicklingError, AttributeError, TypeError) as e:
+            # 피클 불가/프로세스 생성 실패/워커 종료 → 남은 작업만 순차 처리
+            print(f"[AudioBatch] 프로세스 풀 사용 불가, 순차 처리: {e}")
+
+        if failure is not None:
+            raise failure.error from _RemoteTraceback(failure.tb)
+
+    for i, job in enumerate(jobs):
+        if finished[i]:
+            continue
+        results[i] = func(job)
+        finished[i] = True
+        report(sum(finished))
+    return results
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+오디오 이어붙이기 유틸리티 - 선형 시간 병합
+
+기존 문제:
+  combined = AudioSegment.empty(); combined += audio + silence
+  → pydub는 + 마다 전체 버퍼를 재할당/복사 → 씬 수에 대해 O(n²)
+
+해결책:
+  - concat_audio: 전체 길이를 먼저 계산해 PCM 버퍼를 한 번만 할당하고 각 조각을 복사
+  - concat_to_wav: 버퍼 없이 WAV writer로 조각을 순서대로 바로 기록
+  두 함수 모두 각 조각의 시작 위치(ms)를 함께 돌려주므로 SRT 타이밍에 바로 사용 가능
+"""
+
+import io
+import wave
+from typing import BinaryIO, List, Sequence, Tuple, Union
+
+from pydub import AudioSegment
+
+GapSpec = Union[int, Sequence[int]]
+
+
+def _load(piece: Union[AudioSegment, bytes]) -> AudioSegment:
+    if isinstance(piece, AudioSegment):
+        return piece
+    return AudioSegment.from_file(io.BytesIO(piece), format="wav")
+
+
+def _gap_list(gaps_ms: GapSpec, count: int) -> List[int]:
+    """조각 사이 무음 길이 목록 (len = count - 1)"""
+    if isinstance(gaps_ms, (int, float)):
+        return [int(gaps_ms)] * max(0, count - 1)
+    gaps = [int(g) for g in gaps_ms]
+    if len(gaps) != max(0, count - 1):
+        raise ValueError(f"gaps_ms length {len(gaps)} != pieces - 1 ({count - 1})")
+    return gaps
+
+
+def _common_format(segments: Sequence[AudioSegment]) -> Tuple[int, int, int]:
+    """pydub의 + 와 같은 규칙: 가장 높은 샘플레이트/채널/샘플 폭으로 맞춤"""
+    return (
+        max(s.frame_rate for s in segments),
+        max(s.channels for s in segments),
+        max(s.sample_width for s in segments),
+    )
+
+
+def _conform(segment: AudioSegment, frame_rate: int, channels: int, sample_width: int) -> AudioSegment:
+    if segment.frame_rate != frame_rate:
+        segment = segment.set_frame_rate(frame_rate)
+    if segment.channels != channels:
+        segment = segment.set_channels(channels)
+    if segment.sample_width != sample_width:
+        segment = segment.set_sample_width(sample_width)
+    return segment
+
+
+def _prepare(pieces, gaps_ms):
+    segments = [_load(p) for p in pieces]
+    if not segments:
+        return [], [], (24000, 1, 2)
+    fmt = _common_format(segments)
+    segments = [_conform(s, *fmt) for s in segments]
+    return segments, _gap_list(gaps_ms, len(segments)), fmt
+
+
+def _gap_frames(gap_ms: int, frame_rate: int) -> int:
+    return int(round(gap_ms * frame_rate / 1000))
+
+
+def concat_audio(
+    pieces: Sequence[Union[AudioSegment, bytes]],
+    gaps_ms: GapSpec = 0
+) -> Tuple[AudioSegment, List[int]]:
+    """
+    오디오 조각들을 무음 간격과 함께 이어붙이기 (버퍼 1회 할당)
+
+    Args:
+        pieces: AudioSegment 또는 WAV 바이트 목록
+        gaps_ms: 조각 사이 무음 (ms). 정수면 모든 간격 동일, 목록이면 len(pieces) - 1개
+
+    Returns:
+        (병합된 AudioSegment, 각 조각의 시작 위치 ms 목록)
+    """
+    segments, gaps, (frame_rate, channels, sample_width) = _prepare(pieces, gaps_ms)
+    if not segments:
+        return AudioSegment.empty(), []
+
+    frame_size = channels * sample_width
+    gap_frames = [_gap_frames(g, frame_rate) for g in gaps]
+    total_frames = sum(int(s.frame_count()) for s in segments) + sum(gap_frames)
+
+    # 무음(0) 으로 채워진 버퍼에 조각만 복사
+    buffer = bytearray(total_frames * frame_size)
+    view = memoryview(buffer)
+    offsets_ms = []
+    position = 0
+
+    for i, segment in enumerate(segments):
+        if i > 0:
+            position += gap_frames[i - 1] * frame_size
+        offsets_ms.append(int(round(position / frame_size * 1000 / frame_rate)))
+
+        data = segment.raw_data
+        view[position:position + len(data)] = data
+        position += len(data)
+
+    combined = AudioSegment(
+        data=bytes(buffer),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels
+    )
+    return combined, offsets_ms
+
+
+def concat_to_wav(
+    pieces: Sequence[Union[AudioSegment, bytes]],
+    output: Union[str, BinaryIO],
+    gaps_ms: GapSpec = 0
+) -> List[int]:
+    """
+    오디오 조각들을 WAV 파일/스트림에 순서대로 바로 기록 (병합 버퍼 없음)
+
+    Args:
+        pieces: AudioSegment 또는 WAV 바이트 목록
+        output: 출력 경로 또는 바이너리 스트림
+        gaps_ms: 조각 사이 무음 (ms)
+
+    Returns:
+        각 조각의 시작 위치 ms 목록
+    """
+    segments, gaps, (frame_rate, channels, sample_width) = _prepare(pieces, gaps_ms)
+
+    frame_size = channels * sample_width
+    offsets_ms = []
+    frames_written = 0
+
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(frame_rate)
+
+        for i, segment in enumerate(segments):
+            if i > 0 and gaps[i - 1] > 0:
+                silence_frames = _gap_frames(gaps[i - 1], frame_rate)
+                writer.writeframesraw(bytes(silence_frames * frame_size))
+                frames_written += silence_frames
+
+            offsets_ms.append(int(round(frames_written * 1000 / frame_rate)))
+            writer.writeframesraw(segment.raw_data)
+            frames_written += len(segment.raw_data) // frame_size
+
+    return offsets_ms
+
+
+def insert_silences(
+    audio: AudioSegment,
+    insertions: Sequence[Tuple[int, int]]
+) -> AudioSegment:
+    """
+    지정 위치들에 무음 삽입 (한 번의 병합으로 처리)
+
+    Args:
+        audio: 원본 오디오
+        insertions: [(삽입 위치 ms, 무음 길이 ms), ...] - 위치는 원본 기준
+
+    Returns:
+        무음이 삽입된 오디오
+    """
+    if not insertions:
+        return audio
+
+    ordered = sorted(insertions, key=lambda x: x[0])
+    pieces = []
+    gaps = []
+    cursor = 0
+
+    for point, silence_ms in ordered:
+        point = max(cursor, min(int(point), len(audio)))
+        pieces.append(audio[cursor:point])
+        gaps.append(silence_ms)
+        cursor = point
+
+    pieces.append(audio[cursor:])
+    combined, _ = concat_audio(pieces, gaps)
+    return combined
@@ -12,7 +12,6 @@
 import os
 import tempfile
 import subprocess
-import json
 from typing import Optional, Tuple, List, Callable
 from pathlib import Path
 
@@ -88,16 +87,19 @@ def normalize_loudness_rms(
 def normalize_loudness_lufs(
     audio_path: str,
     target_lufs: float = -16.0,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    true_peak_db: float = -1.5
 ) -> str:
     """
     LUFS 기반 음량 정규화 (방송 표준)
-    FFmpeg loudnorm 필터 사용
+    ITU-R BS.1770 측정기(utils.loudness)로 통합 라우드니스를 재고 선형 게인 적용
+    (FFmpeg loudnorm linear 모드와 같은 방식, 프로세스 호출 없음)
 
     Args:
         audio_path: 입력 파일 경로
         target_lufs: 목표 LUFS (-16이 스트리밍 표준)
         output_path: 출력 파일 경로 (없으면 자동 생성)
+        true_peak_db: 피크 상한 (dBFS). 게인이 이를 넘기면 게인을 줄임
 
     Returns:
         정규화된 파일 경로
@@ -107,53 +109,27 @@ def normalize_loudness_lufs(
             delete=False, suffix=".wav"
         ).name
 
-    if not _check_ffmpeg():
-        # FFmpeg 없으면 pydub RMS 폴백
+    if not _check_pydub():
         return _normalize_lufs_fallback(audio_path, output_path)
 
+    from pydub import AudioSegment
+    from utils.loudness import audiosegment_lufs
+
     try:
-        # 2-pass loudnorm (더 정확함)
-        # Pass 1: 분석
-        analyze_cmd = [
-            "ffmpeg", "-y", "-i", audio_path,
-            "-af", f"loudnorm=I={target_lufs}:print_format=json",
-            "-f", "null", "-"
-        ]
+        audio = AudioSegment.from_file(audio_path)
+        measured = audiosegment_lufs(audio)
 
-        result = subprocess.run(
-            analyze_cmd,
-            capture_output=True,
-            text=True
-        )
+        if measured != float('-inf'):
+            gain = target_lufs - measured
+
+            # 피크 보호 (loudnorm TP 설정과 동일한 역할)
+            if audio.max_dBFS != float('-inf'):
+                gain = min(gain, true_peak_db - audio.max_dBFS)
 
-        # JSON 결과 파싱 (stderr에 출력됨)
-        output = result.stderr
-        json_start = output.rfind('{')
-        json_end = output.rfind('}') + 1
-
-        if json_start >= 0 and json_end > json_start:
-            loudnorm_stats = json.loads(output[json_start:json_end])
-
-            # Pass 2: 정규화 적용
-            measured_i = loudnorm_stats.get("input_i", "-24")
-            measured_tp = loudnorm_stats.get("input_tp", "-2")
-            measured_lra = loudnorm_stats.get("input_lra", "7")
-            measured_thresh = loudnorm_stats.get("input_thresh", "-34")
-
-            normalize_cmd = [
-                "ffmpeg", "-y", "-i", audio_path,
-                "-af", (
-                    f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11:"
-                    f"measured_I={measured_i}:measured_TP={measured_tp}:"
-                    f"measured_LRA={measured_lra}:measured_thresh={measured_thresh}:"
-                    "linear=true"
-                ),
-                "-ar", "24000",
-                output_path
-            ]
-
-            subprocess.run(normalize_cmd, check=True, capture_output=True)
-            return output_path
+            audio = audio.apply_gain(gain)
+
+        audio.set_frame_rate(24000).export(output_path, format="wav")
+        return output_path
 
     except Exception as e:
         print(f"[Normalize] LUFS 정규화 실패, RMS 폴백: {e}")
@@ -719,19 +695,151 @@ def analyze_audio(audio_data: bytes, text: str = "") -> dict:
 # 완벽 정규화 (±5% 편차 목표)
 # ============================================================
 
+def _perfect_analyze_scene(job: tuple) -> Optional[dict]:
+    """
+    [프로세스 풀 작업] 씬 1개 분석 - 발화 속도/음량 측정
+
+    Args:
+        job: (scene_id, text, audio_data)
+
+    Returns:
+        분석 통계 dict (오디오 객체 미포함), 실패 시 None
+    """
+    from pydub import AudioSegment
+    import io
+
+    scene_id, text, audio_data = job
+
+    try:
+        audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
+        duration = len(audio) / 1000
+        char_count = len(text.replace(" ", "").replace("\n", ""))
+        rate = char_count / duration if duration > 0 else 0
+        dbfs = audio.dBFS if audio.dBFS != float('-inf') else -100
+
+        print(f"  씬 {scene_id}: {rate:.2f} 글자/초, {dbfs:.1f} dBFS, {duration:.1f}초")
+
+        return {
+            "scene_id": scene_id,
+            "duration": duration,
+            "char_count": char_count,
+            "rate": rate,
+            "dbfs": dbfs,
+        }
+
+    except Exception as e:
+        print(f"  씬 {scene_id}: 분석 실패 - {e}")
+        return None
+
+
+def _perfect_transform_scene(job: tuple) -> dict:
+    """
+    [프로세스 풀 작업] 씬 1개 정규화 - 속도 → 무음 표준화 → 음량 → 피크 리미팅
+
+    Args:
+        job: (stats, audio_data, target_rate, max_speed_adjustment, target_dbfs)
+
+    Returns:
+        {"audio_data", "final_duration", "final_rate", "final_dbfs",
+         "speed_adjusted", "volume_adjusted"} 또는 {"error"}
+    """
+    from pydub import AudioSegment
+    from pydub.effects import normalize
+    from utils.audio_tempo import apply_tempo
+    import io
+
+    stats, audio_data, target_rate, max_speed_adjustment, target_dbfs = job
+    scene_id = stats["scene_id"]
+    current_rate = stats["rate"]
+
+    lines = [f"\n  [씬 {scene_id}]"]
+    speed_adjusted = False
+    volume_adjusted = False
+
+    try:
+        audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
+
+        # 3-1: 속도 정규화
+        if current_rate > 0 and target_rate > 0:
+            speed_ratio = current_rate / target_rate
+
+            # 조정 필요 여부 (3% 이상 차이)
+            if abs(speed_ratio - 1.0) > 0.03:
+                # 조정 범위 제한
+                speed_ratio = max(1 - max_speed_adjustment, min(1 + max_speed_adjustment, speed_ratio))
+
+                lines.append(f"    속도 조정: {speed_ratio:.3f}x ({current_rate:.2f} → {target_rate:.2f} 글자/초)")
+
+                # atempo 범위 확인 (0.5 ~ 2.0)
+                atempo = max(0.5, min(2.0, speed_ratio))
+
+                try:
+                    audio = apply_tempo(audio, atempo)
+                    speed_adjusted = True
+                except Exception as e:
+                    lines.append(f"    ⚠️ 속도 조정 실패: {e}")
+            else:
+                lines.append(f"    속도 조정 불필요 (차이 3% 미만)")
+
+        # 3-2: 무음 표준화
+        audio = standardize_silence(
+            _audio_to_bytes(audio),
+            leading_ms=80,
+            trailing_ms=80
+        )
+        audio = AudioSegment.from_file(io.BytesIO(audio), format="wav")
+        lines.append(f"    무음 표준화: 앞뒤 80ms")
+
+        # 3-3: 음량 정규화
+        current_dbfs = audio.dBFS
+        if current_dbfs != float('-inf'):
+            change = target_dbfs - current_dbfs
+            change = max(-12, min(12, change))  # 최대 ±12dB
+
+            if abs(change) > 0.5:
+                audio = audio.apply_gain(change)
+                volume_adjusted = True
+                lines.append(f"    음량 조정: {current_dbfs:.1f} → {audio.dBFS:.1f} dBFS ({change:+.1f}dB)")
+            else:
+                lines.append(f"    음량 조정 불필요 (차이 0.5dB 미만)")
+
+        # 3-4: 피크 리미팅
+        audio = normalize(audio, headroom=1.0)
+
+        final_duration = len(audio) / 1000
+        final_rate = stats["char_count"] / final_duration if final_duration > 0 else 0
+
+        lines.append(f"    최종: {final_duration:.2f}초, {final_rate:.2f} 글자/초, {audio.dBFS:.1f} dBFS")
+        print("\n".join(lines))
+
+        return {
+            "audio_data": _audio_to_bytes(audio),
+            "final_duration": final_duration,
+            "final_rate": final_rate,
+            "final_dbfs": audio.dBFS,
+            "speed_adjusted": speed_adjusted,
+            "volume_adjusted": volume_adjusted,
+        }
+
+    except Exception as e:
+        print("\n".join(lines + [f"    ❌ 정규화 실패: {e}"]))
+        return {"error": str(e)}
+
+
 def normalize_scenes_perfect(
     scene_results: List[dict],
     target_rate: Optional[float] = None,
     target_lufs: float = -16.0,
     max_speed_adjustment: float = 0.15,
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    workers: Optional[int] = None
 ) -> List[dict]:
     """
     씬별 완벽 정규화 - 발화 속도 ±5% 이내, 음량 ±2dB 이내 목표
 
-    1. 모든 씬의 발화 속도 분석
+    1. 모든 씬의 발화 속도 분석 (프로세스 풀)
     2. 중간값 기준으로 속도 정규화
-    3. LUFS 기반 음량 정규화
+    3. LUFS 기반 음량 정규화 (씬별 변환도 프로세스 풀)
     4. 무음 표준화
     5. 결과 검증
 
@@ -741,6 +849,7 @@ def normalize_scenes_perfect(
         target_lufs: 목표 음량 (-16 LUFS 권장)
         max_speed_adjustment: 최대 속도 조정 비율 (0.15 = ±15%)
         progress_callback: 진행 콜백
+        workers: 프로세스 수 (None이면 코어 수 - 1, 1이면 순차 처리)
 
     Returns:
         정규화된 결과 리스트
@@ -749,10 +858,8 @@ def normalize_scenes_perfect(
         print("[Normalize] pydub 미설치 - 정규화 스킵")
         return scene_results
 
-    from pydub import AudioSegment
-    from pydub.effects import normalize
-    import io
     import numpy as np
+    from utils.audio_batch import run_audio_batch
 
     print("=" * 60)
     print("[Normalize] 완벽 정규화 시작")
@@ -770,35 +877,16 @@ def normalize_scenes_perfect(
 
     print(f"\n[Step 1] 씬 분석 ({len(valid_scenes)}개)")
 
-    # 1단계: 모든 씬 분석
-    scene_stats = []
-    for scene in valid_scenes:
-        scene_id = scene.get("scene_id", 0)
-        text = scene.get("text", "")
-        audio_data = scene.get("audio_data")
-
-        try:
-            audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
-            duration = len(audio) / 1000
-            char_count = len(text.replace(" ", "").replace("\n", ""))
-            rate = char_count / duration if duration > 0 else 0
-            dbfs = audio.dBFS if audio.dBFS != float('-inf') else -100
-
-            scene_stats.append({
-                "scene_id": scene_id,
-                "duration": duration,
-                "char_count": char_count,
-                "rate": rate,
-                "dbfs": dbfs,
-                "text": text,
-                "audio_data": audio_data,
-                "audio": audio
-            })
-
-            print(f"  씬 {scene_id}: {rate:.2f} 글자/초, {dbfs:.1f} dBFS, {duration:.1f}초")
-
-        except Exception as e:
-            print(f"  씬 {scene_id}: 분석 실패 - {e}")
+    # 1단계: 모든 씬 분석 (전체 코어)
+    analyzed = run_audio_batch(
+        _perfect_analyze_scene,
+        [(s.get("scene_id", 0), s.get("text", ""), s.get("audio_data")) for s in valid_scenes],
+        workers=workers,
+        label="씬 분석"
+    )
+    scene_stats = [
+        (stats, scene) for stats, scene in zip(analyzed, valid_scenes) if stats is not None
+    ]
 
     if not scene_stats:
         print("[Normalize] 분석된 씬 없음")
@@ -807,132 +895,52 @@ def normalize_scenes_perfect(
     # 2단계: 목표값 계산
     print(f"\n[Step 2] 목표값 계산")
 
-    rates = [s["rate"] for s in scene_stats if s["rate"] > 0]
-    dbfs_values = [s["dbfs"] for s in scene_stats if s["dbfs"] > -100]
+    rates = [stats["rate"] for stats, _ in scene_stats if stats["rate"] > 0]
 
     if target_rate is None and rates:
         target_rate = float(np.median(rates))
 
-    rate_std = float(np.std(rates)) if rates else 0
     rate_range = (max(rates) - min(rates)) if rates else 0
     rate_deviation = (rate_range / target_rate * 100) if target_rate else 0
 
-    print(f"  발화속도 범위: {min(rates):.2f} ~ {max(rates):.2f} 글자/초")
+    if rates:
+        print(f"  발화속도 범위: {min(rates):.2f} ~ {max(rates):.2f} 글자/초")
     print(f"  발화속도 편차: ±{rate_deviation/2:.1f}% (목표: ±5%)")
-    print(f"  목표 발화속도: {target_rate:.2f} 글자/초")
+    print(f"  목표 발화속도: {target_rate or 0:.2f} 글자/초")
     print(f"  목표 음량: {target_lufs} LUFS (≈ -20 dBFS)")
 
-    # 3단계: 각 씬 정규화
+    # 3단계: 각 씬 정규화 (전체 코어)
     print(f"\n[Step 3] 씬별 정규화")
 
     target_dbfs = -20.0  # -16 LUFS ≈ -20 dBFS
-    normalized_count = 0
-
-    for idx, stats in enumerate(scene_stats):
-        scene_id = stats["scene_id"]
-
-        if progress_callback:
-            progress_callback(idx, len(scene_stats), f"씬 {scene_id} 정규화 중...")
-
-        print(f"\n  [씬 {scene_id}]")
 
-        audio = stats["audio"]
-        text = stats["text"]
-        current_rate = stats["rate"]
-        original_duration = stats["duration"]
-
-        speed_adjusted = False
-        volume_adjusted = False
-
-        # 3-1: 속도 정규화
-        if current_rate > 0 and target_rate > 0:
-            speed_ratio = current_rate / target_rate
-
-            # 조정 필요 여부 (3% 이상 차이)
-            if abs(speed_ratio - 1.0) > 0.03:
-                # 조정 범위 제한
-                speed_ratio = max(1 - max_speed_adjustment, min(1 + max_speed_adjustment, speed_ratio))
+    transformed = run_audio_batch(
+        _perfect_transform_scene,
+        [
+            (stats, scene.get("audio_data"), target_rate or 0, max_speed_adjustment, target_dbfs)
+            for stats, scene in scene_stats
+        ],
+        workers=workers,
+        progress_callback=progress_callback,
+        label="씬 정규화"
+    )
 
-                print(f"    속도 조정: {speed_ratio:.3f}x ({current_rate:.2f} → {target_rate:.2f} 글자/초)")
-
-                # atempo 범위 확인 (0.5 ~ 2.0)
-                atempo = max(0.5, min(2.0, speed_ratio))
-
-                # 임시 파일로 FFmpeg 처리
-                try:
-                    temp_input = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-                    temp_output = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-
-                    audio.export(temp_input, format="wav")
-
-                    cmd = [
-                        "ffmpeg", "-y", "-i", temp_input,
-                        "-af", f"atempo={atempo}",
-                        "-ar", "24000",
-                        temp_output
-                    ]
-
-                    subprocess.run(cmd, check=True, capture_output=True)
-                    audio = AudioSegment.from_file(temp_output)
-                    speed_adjusted = True
-
-                    # 임시 파일 정리
-                    for f in [temp_input, temp_output]:
-                        try:
-                            os.unlink(f)
-                        except:
-                            pass
-
-                except Exception as e:
-                    print(f"    ⚠️ 속도 조정 실패: {e}")
-            else:
-                print(f"    속도 조정 불필요 (차이 3% 미만)")
-
-        # 3-2: 무음 표준화
-        audio = standardize_silence(
-            _audio_to_bytes(audio),
-            leading_ms=80,
-            trailing_ms=80
-        )
-        audio = AudioSegment.from_file(io.BytesIO(audio), format="wav")
-        print(f"    무음 표준화: 앞뒤 80ms")
-
-        # 3-3: 음량 정규화
-        current_dbfs = audio.dBFS
-        if current_dbfs != float('-inf'):
-            change = target_dbfs - current_dbfs
-            change = max(-12, min(12, change))  # 최대 ±12dB
-
-            if abs(change) > 0.5:
-                audio = audio.apply_gain(change)
-                volume_adjusted = True
-                print(f"    음량 조정: {current_dbfs:.1f} → {audio.dBFS:.1f} dBFS ({change:+.1f}dB)")
-            else:
-                print(f"    음량 조정 불필요 (차이 0.5dB 미만)")
-
-        # 3-4: 피크 리미팅
-        audio = normalize(audio, headroom=1.0)
-
-        # 결과 저장
-        final_duration = len(audio) / 1000
-        final_rate = stats["char_count"] / final_duration if final_duration > 0 else 0
-
-        print(f"    최종: {final_duration:.2f}초, {final_rate:.2f} 글자/초, {audio.dBFS:.1f} dBFS")
+    normalized_count = 0
+    for (stats, scene), result in zip(scene_stats, transformed):
+        if "error" in result:
+            continue
 
         # 원본 결과에 정규화 정보 추가
-        for scene in scene_results:
-            if scene.get("scene_id") == scene_id:
-                scene["audio_data"] = _audio_to_bytes(audio)
-                scene["original_duration"] = original_duration
-                scene["final_duration"] = final_duration
-                scene["original_rate"] = current_rate
-                scene["final_rate"] = final_rate
-                scene["final_dbfs"] = audio.dBFS
-                scene["speed_adjusted"] = speed_adjusted
-                scene["volume_adjusted"] = volume_adjusted
-                scene["normalized"] = True
-                normalized_count += 1
-                break
+        scene["audio_data"] = result["audio_data"]
+        scene["original_duration"] = stats["duration"]
+        scene["final_duration"] = result["final_duration"]
+        scene["original_rate"] = stats["rate"]
+        scene["final_rate"] = result["final_rate"]
+        scene["final_dbfs"] = result["final_dbfs"]
+        scene["speed_adjusted"] = result["speed_adjusted"]
+        scene["volume_adjusted"] = result["volume_adjusted"]
+        scene["normalized"] = True
+        normalized_count += 1
 
     if progress_callback:
         progress_callback(len(scene_stats), len(scene_stats), "정규화 완료!")
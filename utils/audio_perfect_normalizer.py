@@ -11,10 +11,11 @@ import os
 import io
 import subprocess
 import tempfile
-import json
 from typing import List, Dict, Tuple, Optional
 from pydub import AudioSegment
 
+from utils.loudness import wav_bytes_lufs
+
 
 class PerfectAudioNormalizer:
     """
@@ -218,39 +219,16 @@ class PerfectAudioNormalizer:
         return results
 
     def _measure_lufs(self, audio_data: bytes) -> float:
-        """LUFS 측정 (FFmpeg loudnorm)"""
+        """LUFS 측정 (ITU-R BS.1770, 인프로세스)"""
 
         if not audio_data:
             return -100.0
 
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(audio_data)
-                tmp_path = tmp.name
-
-            # FFmpeg loudnorm 분석
-            cmd = [
-                "ffmpeg", "-i", tmp_path,
-                "-af", "loudnorm=print_format=json",
-                "-f", "null", "-"
-            ]
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30
-            )
-
-            os.unlink(tmp_path)
-
-            # JSON 파싱
-            output = result.stderr
-            json_start = output.rfind("{")
-            json_end = output.rfind("}") + 1
-
-            if json_start >= 0 and json_end > json_start:
-                loudness_info = json.loads(output[json_start:json_end])
-                return float(loudness_info.get("input_i", -100))
-
-            return -100.0
+            lufs = wav_bytes_lufs(audio_data)
+            if lufs is None or lufs == float("-inf"):
+                return -100.0
+            return lufs
 
         except Exception as e:
             print(f"  ⚠️ LUFS 측정 실패: {e}")
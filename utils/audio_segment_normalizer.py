@@ -9,12 +9,13 @@
 import os
 import io
 import subprocess
-import tempfile
 import warnings
 from typing import List, Dict, Tuple, Optional
 from pydub import AudioSegment
 from pydub.silence import split_on_silence
 
+from utils.audio_tempo import apply_tempo
+
 warnings.filterwarnings("ignore")
 
 
@@ -250,52 +251,13 @@ class SegmentSpeedNormalizer:
         return audio
 
     def _apply_atempo(self, audio: AudioSegment, atempo: float) -> AudioSegment:
-        """FFmpeg atempo 적용"""
+        """atempo 적용 (인메모리 WSOLA 엔진, 0.5~2.0 밖의 값도 한 번에 처리)"""
 
-        if not self.ffmpeg_available or abs(atempo - 1.0) < 0.01:
+        if abs(atempo - 1.0) < 0.01:
             return audio
 
         try:
-            temp_in = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-            temp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-
-            audio.export(temp_in, format="wav")
-
-            # atempo 체이닝 (범위 제한: 0.5~2.0)
-            atempo_filters = []
-            remaining = atempo
-
-            while remaining > 2.0:
-                atempo_filters.append("atempo=2.0")
-                remaining /= 2.0
-            while remaining < 0.5:
-                atempo_filters.append("atempo=0.5")
-                remaining /= 0.5
-
-            atempo_filters.append(f"atempo={remaining:.4f}")
-            filter_str = ",".join(atempo_filters)
-
-            cmd = [
-                "ffmpeg", "-y", "-i", temp_in,
-                "-af", filter_str,
-                "-ar", "24000", "-ac", "1",
-                temp_out
-            ]
-
-            subprocess.run(cmd, capture_output=True, timeout=30)
-
-            if os.path.exists(temp_out):
-                result = AudioSegment.from_file(temp_out)
-            else:
-                result = audio
-
-            for f in [temp_in, temp_out]:
-                try:
-                    os.remove(f)
-                except:
-                    pass
-
-            return result
+            return apply_tempo(audio, atempo)
 
         except Exception as e:
             print(f"  ⚠️ atempo 적용 실패: {e}")
@@ -16,12 +16,13 @@
 import os
 import io
 import subprocess
-import tempfile
 import warnings
 from typing import List, Dict, Tuple, Optional
 from pydub import AudioSegment
 import numpy as np
 
+from utils.audio_tempo import apply_tempo
+
 warnings.filterwarnings("ignore")
 
 
@@ -173,38 +174,10 @@ class SpeedAccelerationCorrector:
         return self._merge_with_crossfade(corrected_segments)
 
     def _apply_atempo(self, audio: AudioSegment, atempo: float) -> AudioSegment:
-        """FFmpeg atempo 적용"""
-
-        if not self.ffmpeg_available:
-            return audio
+        """atempo 적용 (인메모리 WSOLA 엔진)"""
 
         try:
-            temp_in = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-            temp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-
-            audio.export(temp_in, format="wav")
-
-            cmd = [
-                "ffmpeg", "-y", "-i", temp_in,
-                "-af", f"atempo={atempo}",
-                "-ar", "24000", "-ac", "1",
-                temp_out
-            ]
-
-            subprocess.run(cmd, capture_output=True, timeout=30)
-
-            if os.path.exists(temp_out) and os.path.getsize(temp_out) > 0:
-                result = AudioSegment.from_file(temp_out)
-            else:
-                result = audio
-
-            for f in [temp_in, temp_out]:
-                try:
-                    os.remove(f)
-                except:
-                    pass
-
-            return result
+            return apply_tempo(audio, atempo)
 
         except Exception as e:
             print(f"    ⚠️ atempo 실패: {e}")
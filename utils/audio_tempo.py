@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+인메모리 오디오 템포/게인 엔진
+
+기존 문제:
+  구간마다 WAV 임시파일 저장 → ffmpeg 프로세스 실행 → 결과 WAV 다시 읽기
+  = 영상 1개당 수백 회의 프로세스 생성 + 디스크 왕복
+
+해결책:
+  - "numpy": WSOLA(파형 유사도 기반 중첩-가산) 타임 스트레치를 NumPy 버퍼에서 직접 수행
+             (FFmpeg atempo와 같은 계열 알고리즘, 피치 유지)
+  - "ffmpeg": 임시파일 없이 raw PCM을 stdin/stdout 파이프로 주고받음
+
+출력 형식은 기존 FFmpeg 경로와 동일 (24kHz / mono / 16bit PCM)
+"""
+
+import subprocess
+from typing import Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+# 기본 엔진 ("numpy" | "ffmpeg")
+DEFAULT_TEMPO_ENGINE = "numpy"
+
+# 기존 FFmpeg 경로 출력 형식 (-ar 24000 -ac 1 pcm_s16le)
+OUTPUT_SAMPLE_RATE = 24000
+
+# WSOLA 파라미터 (FFmpeg atempo 기본 윈도우와 비슷한 크기)
+WSOLA_FRAME_MS = 40
+WSOLA_SEARCH_MS = 10
+
+
+def audiosegment_to_float(audio: AudioSegment, sample_rate: int = OUTPUT_SAMPLE_RATE) -> np.ndarray:
+    """AudioSegment → float32 mono 버퍼 (-1.0 ~ 1.0)"""
+    if audio.channels != 1:
+        audio = audio.set_channels(1)
+    if audio.frame_rate != sample_rate:
+        audio = audio.set_frame_rate(sample_rate)
+
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
+    return samples / float(1 << (8 * audio.sample_width - 1))
+
+
+def float_to_audiosegment(samples: np.ndarray, sample_rate: int = OUTPUT_SAMPLE_RATE) -> AudioSegment:
+    """float32 mono 버퍼 → 16bit AudioSegment"""
+    pcm = np.clip(np.round(samples * 32768.0), -32768, 32767).astype("<i2")
+    return AudioSegment(
+        data=pcm.tobytes(),
+        sample_width=2,
+        frame_rate=sample_rate,
+        channels=1
+    )
+
+
+def wsola_time_stretch(
+    samples: np.ndarray,
+    rate: float,
+    sample_rate: int = OUTPUT_SAMPLE_RATE,
+    frame_ms: float = WSOLA_FRAME_MS,
+    search_ms: float = WSOLA_SEARCH_MS
+) -> np.ndarray:
+    """
+    WSOLA 타임 스트레치 (피치 유지)
+
+    rate > 1이면 빨라지고(짧아짐), rate < 1이면 느려짐.
+    출력 프레임마다 입력의 명목 위치 주변 ±search_ms에서 직전 프레임의 자연스러운
+    연장선과 가장 비슷한 구간을 골라 Hann 윈도우로 중첩-가산합니다.
+
+    Args:
+        samples: float32 mono 버퍼
+        rate: 템포 배율 (atempo 값과 동일한 의미)
+
+    Returns:
+        길이 ≈ len(samples) / rate 인 float32 버퍼
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    if rate <= 0:
+        raise ValueError(f"rate must be positive: {rate}")
+    if abs(rate - 1.0) < 1e-3 or len(samples) == 0:
+        return samples.copy()
+
+    win = max(4, int(sample_rate * frame_ms / 1000) // 2 * 2)
+    hop = win // 2
+    tol = max(1, int(sample_rate * search_ms / 1000))
+
+    n_out = int(round(len(samples) / rate))
+    n_frames = n_out // hop + 2
+
+    # 앞쪽은 탐색 여유만큼, 뒤쪽은 마지막 프레임 + 탐색 범위까지 0으로 채움
+    last_nominal = int((n_frames - 1) * hop * rate)
+    pad_right = max(0, last_nominal + win + 2 * tol + hop - len(samples))
+    padded = np.concatenate([
+        np.zeros(tol, dtype=np.float32),
+        samples,
+        np.zeros(pad_right, dtype=np.float32),
+    ])
+
+    # periodic Hann - 50% 중첩 시 합이 1
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(win) / win)).astype(np.float32)
+
+    out = np.zeros(n_frames * hop + win, dtype=np.float32)
+    norm = np.zeros_like(out)
+
+    prev = tol
+    for k in range(n_frames):
+        nominal = int(k * hop * rate) + tol
+
+        if k == 0:
+            pos = nominal
+        else:
+            natural = prev + hop
+            template = padded[natural:natural + win]
+            lo = nominal - tol
+            region = padded[lo:lo + win + 2 * tol]
+            corr = np.correlate(region, template, mode="valid")
+            pos = lo + int(np.argmax(corr))
+
+        start = k * hop
+        out[start:start + win] += padded[pos:pos + win] * window
+        norm[start:start + win] += window
+        prev = pos
+
+    out /= np.maximum(norm, 1e-3)
+    return out[:n_out]
+
+
+def _apply_tempo_ffmpeg_pipe(
+    samples: np.ndarray,
+    atempo: float,
+    volume_db: float,
+    sample_rate: int
+) -> Optional[np.ndarray]:
+    """FFmpeg에 raw PCM을 파이프로 전달 (임시파일 없음). 실패 시 None"""
+    filters = []
+
+    # atempo 체이닝 (필터 1개당 0.5~2.0)
+    remaining = atempo
+    while remaining > 2.0:
+        filters.append("atempo=2.0")
+        remaining /= 2.0
+    while remaining < 0.5:
+        filters.append("atempo=0.5")
+        remaining /= 0.5
+    if abs(remaining - 1.0) >= 1e-3:
+        filters.append(f"atempo={remaining:.4f}")
+
+    if abs(volume_db) >= 0.01:
+        filters.append(f"volume={volume_db}dB")
+
+    pcm = np.clip(np.round(samples * 32768.0), -32768, 32767).astype("<i2")
+
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0",
+        "-af", ",".join(filters) or "anull",
+        "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "pipe:1",
+    ]
+
+    try:
+        result = subprocess.run(cmd, input=pcm.tobytes(), capture_output=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    if result.returncode != 0 or not result.stdout:
+        return None
+
+    return np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def apply_tempo(
+    audio: AudioSegment,
+    atempo: float,
+    volume_db: float = 0.0,
+    engine: Optional[str] = None,
+    sample_rate: int = OUTPUT_SAMPLE_RATE
+) -> AudioSegment:
+    """
+    템포 + 게인 적용 (FFmpeg "atempo=..,volume=..dB" 대체)
+
+    Args:
+        audio: 입력 오디오
+        atempo: 템포 배율 (1.0 = 변화 없음)
+        volume_db: 게인 (dB)
+        engine: "numpy" (인메모리 WSOLA) | "ffmpeg" (PCM 파이프), 기본 DEFAULT_TEMPO_ENGINE
+        sample_rate: 출력 샘플레이트
+
+    Returns:
+        24kHz mono 16bit AudioSegment
+    """
+    engine = engine or DEFAULT_TEMPO_ENGINE
+    samples = audiosegment_to_float(audio, sample_rate)
+
+    processed = None
+    if engine == "ffmpeg":
+        processed = _apply_tempo_ffmpeg_pipe(samples, atempo, volume_db, sample_rate)
+
+    if processed is None:
+        processed = wsola_time_stretch(samples, atempo, sample_rate)
+        if abs(volume_db) >= 0.01:
+            processed = processed * np.float32(10 ** (volume_db / 20))
+
+    return float_to_audiosegment(processed, sample_rate)
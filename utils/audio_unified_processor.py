@@ -23,13 +23,16 @@
 import os
 import io
 import subprocess
-import tempfile
 import numpy as np
 import warnings
 from typing import List, Dict, Tuple, Optional
 from pydub import AudioSegment
 from pydub.silence import detect_nonsilent
 
+from utils.audio_tempo import apply_tempo
+from utils.loudness import audiosegment_lufs
+from utils.audio_batch import run_audio_batch
+
 warnings.filterwarnings("ignore")
 
 
@@ -203,12 +206,9 @@ class UnifiedAudioProcessor:
         return output.read(), new_duration
 
     def _measure_lufs(self, audio: AudioSegment) -> float:
-        """LUFS 측정 (간이 버전)"""
+        """LUFS 측정 (ITU-R BS.1770 게이팅 통합 라우드니스)"""
         try:
-            samples = np.array(audio.get_array_of_samples()).astype(np.float32)
-            samples = samples / (2**15)
-            rms = np.sqrt(np.mean(samples**2))
-            lufs = 20 * np.log10(rms + 1e-10) - 3
+            lufs = audiosegment_lufs(audio)
             return max(-60, min(0, lufs))
         except:
             return -23.0
@@ -325,10 +325,6 @@ class UnifiedAudioProcessor:
         - 그 후 구간별 atempo만 적용
         """
 
-        if not self.ffmpeg_available:
-            print("  ⚠️ FFmpeg 없음, 음량만 조정")
-            return audio + volume_db
-
         # ⭐ 버그 수정: 먼저 전체 오디오에 음량 균일 적용
         if abs(volume_db) >= 0.5:
             print(f"  🔊 전체 음량 균일 조정: {volume_db:+.1f}dB")
@@ -364,66 +360,21 @@ class UnifiedAudioProcessor:
         atempo: float,
         volume_db: float = 0
     ) -> AudioSegment:
-        """단일 FFmpeg 호출 (고품질)"""
+        """단일 패스 템포/음량 적용 (인메모리 엔진, 임시파일/프로세스 없음)"""
 
-        try:
-            temp_in = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-            temp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-
-            audio.export(temp_in, format="wav")
-
-            # 필터 체인 구성
-            filters = []
-
-            if abs(atempo - 1.0) >= 0.02:
-                # atempo 범위 제한 (0.5 ~ 2.0)
-                safe_atempo = max(0.5, min(2.0, atempo))
-                filters.append(f"atempo={safe_atempo}")
-
-            if abs(volume_db) >= 0.5:
-                filters.append(f"volume={volume_db}dB")
-
-            if not filters:
-                # 정리
-                for f in [temp_in, temp_out]:
-                    try:
-                        os.remove(f)
-                    except:
-                        pass
-                return audio
-
-            filter_str = ",".join(filters)
-
-            # 고품질 FFmpeg 설정
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", temp_in,
-                "-af", filter_str,
-                "-ar", "24000",
-                "-ac", "1",
-                "-acodec", "pcm_s16le",  # 무손실 PCM
-                "-f", "wav",
-                temp_out
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, timeout=60)
-
-            if os.path.exists(temp_out) and os.path.getsize(temp_out) > 0:
-                processed = AudioSegment.from_file(temp_out)
-            else:
-                processed = audio
+        # atempo 범위 제한 (0.5 ~ 2.0)
+        safe_atempo = max(0.5, min(2.0, atempo)) if abs(atempo - 1.0) >= 0.02 else 1.0
+        if abs(volume_db) < 0.5:
+            volume_db = 0
 
-            # 임시 파일 정리
-            for f in [temp_in, temp_out]:
-                try:
-                    os.remove(f)
-                except:
-                    pass
+        if safe_atempo == 1.0 and volume_db == 0:
+            return audio
 
-            return processed
+        try:
+            return apply_tempo(audio, safe_atempo, volume_db=volume_db)
 
         except Exception as e:
-            print(f"    ⚠️ FFmpeg 오류: {e}")
+            print(f"    ⚠️ 템포 처리 오류: {e}")
             return audio + volume_db if volume_db != 0 else audio
 
     def _merge_with_crossfade(
@@ -466,11 +417,43 @@ class UnifiedAudioProcessor:
 # 전체 씬 처리 함수
 # ============================================================
 
+_PROCESSOR_CACHE: Dict[Tuple[float, str], "UnifiedAudioProcessor"] = {}
+
+
+def _get_worker_processor(target_speed: float, accel_profile: str) -> UnifiedAudioProcessor:
+    """워커 프로세스별 처리기 재사용 (초기화 시 FFmpeg 확인을 반복하지 않음)"""
+    key = (target_speed, accel_profile)
+    if key not in _PROCESSOR_CACHE:
+        _PROCESSOR_CACHE[key] = UnifiedAudioProcessor(
+            target_speed=target_speed,
+            accel_profile=accel_profile,
+            num_segments=8  # 8구간 (정밀)
+        )
+    return _PROCESSOR_CACHE[key]
+
+
+def _unified_scene_job(job: tuple) -> Tuple[bytes, float]:
+    """
+    [프로세스 풀 작업] 씬 1개 단일 패스 처리
+
+    Args:
+        job: (target_speed, accel_profile, audio_data, text, scene_id)
+    """
+    target_speed, accel_profile, audio_data, text, scene_id = job
+    processor = _get_worker_processor(target_speed, accel_profile)
+    try:
+        return processor.process_scene_bytes(audio_data, text, scene_id)
+    except Exception as e:
+        print(f"  씬 {scene_id}: ⚠️ 처리 실패 - {e}")
+        return audio_data, 0.0
+
+
 def process_all_unified(
     scenes: List[Dict],
     target_speed: float = 8.5,
     accel_profile: str = "adaptive",
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    workers: Optional[int] = None
 ) -> List[Dict]:
     """
     모든 씬 통합 처리 (단일 패스)
@@ -478,23 +461,19 @@ def process_all_unified(
     기존: PerfectNorm → SpeedCorrector → SegmentNorm (6~8회 FFmpeg)
     새로운: UnifiedProcessor (구간당 1회 FFmpeg)
 
+    씬 처리와 최종 속도 조정은 프로세스 풀에서 병렬 실행됩니다.
+
     Args:
         scenes: 씬 리스트 [{scene_id, text, audio_data, ...}, ...]
         target_speed: 목표 발화속도 (글자/초)
         accel_profile: 가속 보정 프로파일 (adaptive/strong/moderate)
         progress_callback: 진행 콜백 (current, total, message)
+        workers: 프로세스 수 (None이면 코어 수 - 1, 1이면 순차 처리)
 
     Returns:
         처리된 씬 리스트
     """
 
-    processor = UnifiedAudioProcessor(
-        target_speed=target_speed,
-        accel_profile=accel_profile,
-        num_segments=8  # 8구간 (정밀)
-    )
-
-    results = []
     total = len(scenes)
     valid_scenes = [s for s in scenes if s.get("audio_data") and s.get("success")]
 
@@ -508,26 +487,29 @@ def process_all_unified(
     print(f"  ⭐ 적응형 가속 보정 → 정확한 속도 균일화")
     print(f"{'='*60}")
 
-    for idx, scene in enumerate(scenes):
-        if progress_callback:
-            try:
-                progress_callback(idx, total, f"통합 처리: 씬 {scene.get('scene_id', idx+1)}")
-            except:
-                pass
+    jobs = [
+        (target_speed, accel_profile, scene.get("audio_data"), scene.get("text", ""),
+         scene.get("scene_id", idx + 1))
+        for idx, scene in enumerate(scenes)
+        if scene.get("audio_data") and scene.get("success")
+    ]
+
+    processed = iter(run_audio_batch(
+        _unified_scene_job,
+        jobs,
+        workers=workers,
+        progress_callback=progress_callback,
+        label="통합 처리"
+    ))
 
+    results = []
+    for scene in scenes:
         # 오디오가 없거나 실패한 씬은 그대로 유지
         if not scene.get("audio_data") or not scene.get("success"):
             results.append(scene)
             continue
 
-        audio_data = scene.get("audio_data")
-        text = scene.get("text", "")
-        scene_id = scene.get("scene_id", idx + 1)
-
-        # 단일 패스 처리
-        processed_audio, new_duration = processor.process_scene_bytes(
-            audio_data, text, scene_id
-        )
+        processed_audio, new_duration = next(processed)
 
         results.append({
             **scene,
@@ -538,7 +520,7 @@ def process_all_unified(
         })
 
     # 최종 속도 미세 조정
-    results = _final_speed_adjustment(results, target_speed, progress_callback)
+    results = _final_speed_adjustment(results, target_speed, progress_callback, workers=workers)
 
     print(f"\n{'='*60}")
     print(f"[UnifiedProcessor] 단일 패스 처리 완료!")
@@ -553,134 +535,118 @@ def process_all_unified(
     return results
 
 
-def _final_speed_adjustment(
-    scenes: List[Dict],
-    target_speed: float,
-    progress_callback: Optional[callable] = None
-) -> List[Dict]:
+def _final_adjust_scene_job(job: tuple) -> Tuple[Optional[bytes], Optional[float], Optional[float]]:
     """
-    최종 속도 개별 조정 (v1.1 - 버그 수정)
+    [프로세스 풀 작업] 씬 1개 최종 속도 조정
 
-    ⭐ 핵심 수정:
-    - 기존: 전체 평균 계산 → 동일 계수로 모든 씬 조정
-    - 수정: 각 씬별로 개별 조정 계수 계산 → 각각 적용
+    Args:
+        job: (audio_data, text, scene_id, target_speed)
+
+    Returns:
+        (조정된 오디오 또는 None, 새 duration 또는 None, 최종 속도 또는 None)
+        오디오가 None이면 조정 없음
     """
+    audio_data, text, scene_id, target_speed = job
 
-    print(f"\n[FinalAdjust v1.1] 씬별 개별 속도 조정")
-    print(f"  목표: {target_speed:.2f} 글자/초")
+    try:
+        audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
+        duration = len(audio) / 1000
+        char_count = len(text.replace(" ", "").replace("\n", ""))
 
-    adjusted_results = []
-    total = len(scenes)
-    adjustments_made = 0
+        if duration <= 0 or char_count <= 0:
+            return None, None, None
 
-    for idx, scene in enumerate(scenes):
-        audio_data = scene.get("audio_data")
-        text = scene.get("text", "")
-        scene_id = scene.get("scene_id", idx + 1)
+        current_speed = char_count / duration
+        speed_diff_pct = abs(current_speed - target_speed) / target_speed * 100
 
-        if not audio_data or not scene.get("success"):
-            adjusted_results.append(scene)
-            continue
+        # ⭐ 2% 이상 차이나면 개별 조정
+        if speed_diff_pct < 2.0:
+            print(f"  씬 {scene_id}: {current_speed:.2f} 글자/초 ✅")
+            return None, None, current_speed
 
-        if progress_callback:
-            try:
-                progress_callback(idx, total, f"최종 조정: 씬 {scene_id}")
-            except:
-                pass
+        # ⭐ 씬별 개별 조정 계수 계산
+        adjustment = target_speed / current_speed
+        adjustment = max(0.85, min(1.20, adjustment))
 
-        try:
-            audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
-            duration = len(audio) / 1000
-            char_count = len(text.replace(" ", "").replace("\n", ""))
+        # atempo 적용 (인메모리 엔진)
+        result_audio = apply_tempo(audio, adjustment)
 
-            if duration <= 0 or char_count <= 0:
-                adjusted_results.append(scene)
-                continue
+        if len(result_audio) == 0:
+            return None, None, current_speed
 
-            current_speed = char_count / duration
-            speed_diff_pct = abs(current_speed - target_speed) / target_speed * 100
+        output = io.BytesIO()
+        result_audio.export(output, format="wav", parameters=["-ar", "24000", "-ac", "1"])
+        output.seek(0)
+        new_duration = len(result_audio) / 1000
 
-            # ⭐ 2% 이상 차이나면 개별 조정
-            if speed_diff_pct < 2.0:
-                print(f"  씬 {scene_id}: {current_speed:.2f} 글자/초 ✅")
-                adjusted_results.append(scene)
-                continue
+        # 결과 확인
+        new_speed = char_count / new_duration if new_duration > 0 else 0
+        print(f"  씬 {scene_id}: {current_speed:.2f} → {target_speed:.2f} (x{adjustment:.3f})"
+              f" → 결과: {new_speed:.2f} 글자/초")
 
-            # ⭐ 씬별 개별 조정 계수 계산
-            adjustment = target_speed / current_speed
-            adjustment = max(0.85, min(1.20, adjustment))
+        return output.read(), new_duration, new_speed
 
-            print(f"  씬 {scene_id}: {current_speed:.2f} → {target_speed:.2f} (x{adjustment:.3f})")
+    except Exception as e:
+        print(f"  씬 {scene_id}: ⚠️ 실패 - {e}")
+        return None, None, None
 
-            # atempo 적용
-            temp_in = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-            temp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
 
-            audio.export(temp_in, format="wav")
+def _final_speed_adjustment(
+    scenes: List[Dict],
+    target_speed: float,
+    progress_callback: Optional[callable] = None,
+    workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    최종 속도 개별 조정 (v1.1 - 버그 수정)
 
-            cmd = [
-                "ffmpeg", "-y", "-i", temp_in,
-                "-af", f"atempo={adjustment}",
-                "-ar", "24000", "-ac", "1",
-                "-acodec", "pcm_s16le",
-                temp_out
-            ]
+    ⭐ 핵심 수정:
+    - 기존: 전체 평균 계산 → 동일 계수로 모든 씬 조정
+    - 수정: 각 씬별로 개별 조정 계수 계산 → 각각 적용
+    """
 
-            subprocess.run(cmd, capture_output=True, timeout=30)
+    print(f"\n[FinalAdjust v1.1] 씬별 개별 속도 조정")
+    print(f"  목표: {target_speed:.2f} 글자/초")
 
-            if os.path.exists(temp_out) and os.path.getsize(temp_out) > 0:
-                result_audio = AudioSegment.from_file(temp_out)
-                output = io.BytesIO()
-                result_audio.export(output, format="wav", parameters=["-ar", "24000", "-ac", "1"])
-                output.seek(0)
-                new_audio_data = output.read()
-                new_duration = len(result_audio) / 1000
+    targets = [
+        (idx, scene) for idx, scene in enumerate(scenes)
+        if scene.get("audio_data") and scene.get("success")
+    ]
+
+    outcomes = run_audio_batch(
+        _final_adjust_scene_job,
+        [
+            (scene["audio_data"], scene.get("text", ""), scene.get("scene_id", idx + 1), target_speed)
+            for idx, scene in targets
+        ],
+        workers=workers,
+        progress_callback=progress_callback,
+        label="최종 조정"
+    )
 
-                # 결과 확인
-                new_speed = char_count / new_duration if new_duration > 0 else 0
-                print(f"        → 결과: {new_speed:.2f} 글자/초")
+    adjusted_results = list(scenes)
+    adjustments_made = 0
+    final_speeds = []
 
-                adjustments_made += 1
-            else:
-                new_audio_data = audio_data
-                new_duration = duration
-
-            for f in [temp_in, temp_out]:
-                try:
-                    os.remove(f)
-                except:
-                    pass
-
-            adjusted_results.append({
-                **scene,
-                "audio_data": new_audio_data,
-                "duration": new_duration,
-                "final_adjusted": True
-            })
+    for (idx, scene), (new_audio_data, new_duration, final_speed) in zip(targets, outcomes):
+        if final_speed is not None:
+            final_speeds.append(final_speed)
 
-        except Exception as e:
-            print(f"  씬 {scene_id}: ⚠️ 실패 - {e}")
-            adjusted_results.append(scene)
+        if new_audio_data is None:
+            continue
+
+        adjusted_results[idx] = {
+            **scene,
+            "audio_data": new_audio_data,
+            "duration": new_duration,
+            "final_adjusted": True
+        }
+        adjustments_made += 1
 
     # 최종 결과 요약
     print(f"\n[FinalAdjust v1.1] 완료 ({adjustments_made}개 씬 조정됨)")
 
     # 최종 속도 확인
-    final_speeds = []
-    for scene in adjusted_results:
-        audio_data = scene.get("audio_data")
-        text = scene.get("text", "")
-
-        if audio_data and scene.get("success"):
-            try:
-                audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
-                duration = len(audio) / 1000
-                char_count = len(text.replace(" ", "").replace("\n", ""))
-                if duration > 0 and char_count > 0:
-                    final_speeds.append(char_count / duration)
-            except:
-                pass
-
     if final_speeds:
         avg = np.mean(final_speeds)
         min_s = min(final_speeds)
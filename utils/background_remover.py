@@ -8,12 +8,19 @@
 - alpha_matting으로 경계 품질 개선
 - 캐릭터 내부 구멍 자동 보정
 - 마스크 확장 옵션
+
+캐시 정책 (v3):
+- 캐시 키 = 이미지 내용 해시 + 모델 + 옵션 (같은 경로의 파일이 바뀌면 다시 처리)
+- rembg 세션은 모델별로 하나만 만들어 재사용
 """
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image
 from io import BytesIO
-from typing import Optional, Union, Literal
+from typing import Optional, Union, Literal, Dict, Tuple
 import hashlib
 import base64
 
@@ -32,11 +39,19 @@ DEFAULT_MODEL = "isnet-general-use"
 class BackgroundRemover:
     """배경 제거 클래스"""
 
+    # 모델별 rembg 세션 (프로세스 내 공유)
+    _sessions: Dict[str, object] = {}
+    _sessions_lock = threading.Lock()
+
     def __init__(self, cache_dir: str = "data/cache/nobg"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._rembg_available = self._check_rembg()
 
+        # 로컬 파일 내용 해시 메모: 경로 -> (mtime_ns, size, hash)
+        self._hash_memo: Dict[str, Tuple[int, int, str]] = {}
+        self._hash_lock = threading.Lock()
+
     def _check_rembg(self) -> bool:
         """rembg 라이브러리 사용 가능 여부 확인"""
         try:
@@ -46,11 +61,76 @@ class BackgroundRemover:
             print("[BackgroundRemover] rembg 미설치. pip install rembg 실행 필요")
             return False
 
-    def _get_cache_path(self, image_source: str) -> Path:
+    def _get_cache_path(self, cache_key: str) -> Path:
         """캐시 파일 경로 생성"""
-        # URL/경로 해시로 고유 파일명 생성
-        source_hash = hashlib.md5(image_source.encode()).hexdigest()[:12]
-        return self.cache_dir / f"nobg_{source_hash}.png"
+        # 캐시 키(내용 해시 + 모델 + 옵션) 해시로 고유 파일명 생성
+        key_hash = hashlib.md5(cache_key.encode()).hexdigest()[:12]
+        return self.cache_dir / f"nobg_{key_hash}.png"
+
+    def _make_cache_key(
+        self,
+        content_hash: str,
+        model: str,
+        alpha_matting: bool,
+        fix_holes: bool,
+        expand_mask: int
+    ) -> str:
+        """내용 해시와 처리 옵션으로 캐시 키 생성"""
+        return f"{content_hash}_{model}_{alpha_matting}_{fix_holes}_{expand_mask}"
+
+    def _hash_source(self, source: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        이미지 소스의 내용 해시 계산
+
+        로컬 파일은 (mtime, size)가 같으면 이전 해시를 재사용하고 파일을 다시 읽지 않습니다.
+        URL은 내려받지 않고 URL 자체로 키를 만듭니다 (캐시 적중 시 네트워크 왕복 없음,
+        같은 URL의 내용이 바뀌었으면 force=True로 재처리).
+
+        Returns:
+            (내용 해시, 읽은 바이트 또는 None)
+        """
+        if not source.startswith('http') and not source.startswith('data:'):
+            path = Path(source)
+            try:
+                stat = path.stat()
+            except OSError:
+                return None, None
+
+            with self._hash_lock:
+                memo = self._hash_memo.get(source)
+            if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+                return memo[2], None
+
+            data = self._load_bytes(source)
+            if data is None:
+                return None, None
+            content_hash = hashlib.sha1(data).hexdigest()
+            with self._hash_lock:
+                self._hash_memo[source] = (stat.st_mtime_ns, stat.st_size, content_hash)
+            return content_hash, data
+
+        if source.startswith('http'):
+            return hashlib.sha1(f"url:{source}".encode("utf-8")).hexdigest(), None
+
+        data = self._load_bytes(source)
+        if data is None:
+            return None, None
+        return hashlib.sha1(data).hexdigest(), data
+
+    def _hash_image(self, image: Image.Image) -> str:
+        """PIL 이미지 픽셀 내용 해시"""
+        digest = hashlib.sha1(f"{image.mode}_{image.size}".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def _get_session(self, model: str):
+        """모델별 rembg 세션 반환 (최초 1회만 생성)"""
+        with self._sessions_lock:
+            if model not in self._sessions:
+                from rembg import new_session
+                self._sessions[model] = new_session(model)
+                print(f"[BackgroundRemover] 모델 세션 생성: {model}")
+            return self._sessions[model]
 
     def remove_background(
         self,
@@ -78,20 +158,34 @@ class BackgroundRemover:
 
         # 이미지 로드
         if isinstance(image_source, str):
-            # 캐시 확인 (모델과 옵션에 따라 다른 캐시)
-            cache_key = f"{image_source}_{model}_{alpha_matting}_{fix_holes}_{expand_mask}"
+            # 캐시 확인 (이미지 내용 + 모델 + 옵션에 따라 다른 캐시)
+            content_hash, data = self._hash_source(image_source)
+            if content_hash is None:
+                print(f"[BackgroundRemover] 이미지 로드 실패: {image_source[:60]}")
+                return None
+
+            cache_key = self._make_cache_key(content_hash, model, alpha_matting, fix_holes, expand_mask)
             cache_path = self._get_cache_path(cache_key)
             if not force and cache_path.exists():
                 print(f"[BackgroundRemover] 캐시 사용: {cache_path}")
                 return str(cache_path)
 
-            # URL 또는 파일 경로에서 로드
-            image = self._load_image(image_source)
+            # URL 또는 파일 경로에서 로드 (해시 계산 때 읽은 바이트 재사용)
+            if data is not None:
+                image = Image.open(BytesIO(data))
+            else:
+                image = self._load_image(image_source)
             if image is None:
                 return None
         else:
             image = image_source
-            cache_path = self._get_cache_path(str(id(image)))
+            cache_key = self._make_cache_key(
+                self._hash_image(image), model, alpha_matting, fix_holes, expand_mask
+            )
+            cache_path = self._get_cache_path(cache_key)
+            if not force and cache_path.exists():
+                print(f"[BackgroundRemover] 캐시 사용: {cache_path}")
+                return str(cache_path)
 
         # 이미 투명 배경인지 확인
         if self._has_transparency(image):
@@ -120,22 +214,21 @@ class BackgroundRemover:
 
         return None
 
-    def _load_image(self, source: str) -> Optional[Image.Image]:
-        """이미지 로드"""
+    def _load_bytes(self, source: str) -> Optional[bytes]:
+        """이미지 원본 바이트 로드 (URL, Data URI, 파일 경로)"""
         try:
             if source.startswith('http'):
                 import requests
                 response = requests.get(source, timeout=10)
-                return Image.open(BytesIO(response.content))
+                return response.content
             elif source.startswith('data:'):
                 # Data URI 처리
                 header, data = source.split(',', 1)
-                image_data = base64.b64decode(data)
-                return Image.open(BytesIO(image_data))
+                return base64.b64decode(data)
             else:
                 path = Path(source)
                 if path.exists():
-                    return Image.open(path)
+                    return path.read_bytes()
                 else:
                     print(f"[BackgroundRemover] 파일 없음: {source}")
                     return None
@@ -143,6 +236,17 @@ class BackgroundRemover:
             print(f"[BackgroundRemover] 이미지 로드 실패: {e}")
             return None
 
+    def _load_image(self, source: str) -> Optional[Image.Image]:
+        """이미지 로드"""
+        data = self._load_bytes(source)
+        if data is None:
+            return None
+        try:
+            return Image.open(BytesIO(data))
+        except Exception as e:
+            print(f"[BackgroundRemover] 이미지 로드 실패: {e}")
+            return None
+
     def _has_transparency(self, image: Image.Image) -> bool:
         """이미지에 투명 영역이 있는지 확인"""
         if image.mode == 'RGBA':
@@ -175,7 +279,7 @@ class BackgroundRemover:
             배경이 제거된 RGBA 이미지
         """
         try:
-            from rembg import remove, new_session
+            from rembg import remove
 
             # RGBA로 변환
             if image.mode != 'RGBA':
@@ -186,10 +290,9 @@ class BackgroundRemover:
             image.save(img_bytes, format='PNG')
             img_bytes.seek(0)
 
-            # 세션 생성 (모델 지정)
+            # 모델별 세션 재사용
             try:
-                session = new_session(model)
-                print(f"[BackgroundRemover] 모델 사용: {model}")
+                session = self._get_session(model)
             except Exception as e:
                 print(f"[BackgroundRemover] 모델 '{model}' 로드 실패, 기본값 사용: {e}")
                 session = None
@@ -400,12 +503,7 @@ class BackgroundRemover:
         if not original_path:
             return original_path
 
-        cache_path = self._get_cache_path(original_path)
-
-        if cache_path.exists():
-            return str(cache_path)
-
-        # 배경 제거 실행
+        # 캐시가 있으면 remove_background가 바로 캐시 경로를 반환
         result = self.remove_background(original_path)
         return result if result else original_path
 
@@ -563,32 +661,65 @@ def remove_background_batch(
     image_paths: list,
     output_dir: str = None,
     force: bool = False,
-    progress_callback=None
+    progress_callback=None,
+    model: str = DEFAULT_MODEL,
+    max_workers: int = None
 ) -> list:
     """
     여러 이미지 배경 일괄 제거
 
+    모델 세션 하나를 공유하면서 워커 풀로 병렬 처리합니다.
+
     Args:
         image_paths: 이미지 경로 목록
         output_dir: 출력 디렉토리
         force: 캐시 무시
-        progress_callback: (current, total, filename) 콜백
+        progress_callback: (current, total, filename) 콜백 (완료 순서대로 호출)
+        model: 사용할 모델
+        max_workers: 동시 처리 수 (기본: min(4, CPU 코어 수))
 
     Returns:
-        출력 파일 경로 목록
+        출력 파일 경로 목록 (입력 순서, 실패한 이미지 제외)
     """
-    results = []
     total = len(image_paths)
+    if total == 0:
+        return []
+
     remover = get_background_remover()
+    workers = max_workers or min(4, os.cpu_count() or 1)
 
-    for i, img_path in enumerate(image_paths):
-        filename = Path(img_path).name
+    # 세션을 미리 만들어 워커들이 같은 세션을 쓰도록 함
+    if remover._rembg_available:
+        try:
+            remover._get_session(model)
+        except Exception as e:
+            print(f"[BackgroundRemover] 모델 '{model}' 세션 준비 실패: {e}")
 
-        if progress_callback:
-            progress_callback(i + 1, total, filename)
+    outputs = [None] * total
+    start_time = time.time()
 
-        result = remover.remove_background(img_path, force=force)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(remover.remove_background, img_path, force=force, model=model): i
+            for i, img_path in enumerate(image_paths)
+        }
 
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                outputs[i] = future.result()
+            except Exception as e:
+                print(f"[BackgroundRemover] 처리 실패 ({image_paths[i]}): {e}")
+
+            if progress_callback:
+                progress_callback(done, total, Path(image_paths[i]).name)
+
+    elapsed = time.time() - start_time
+    print(f"[BackgroundRemover] 일괄 처리 완료: {total}장, {elapsed:.1f}초 "
+          f"({total / max(elapsed, 1e-6):.2f}장/초, 워커 {workers}개)")
+
+    results = []
+    for img_path, result in zip(image_paths, outputs):
         if result:
             if output_dir:
                 import shutil
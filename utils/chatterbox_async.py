@@ -8,11 +8,15 @@ GPU 메모리 제한을 고려하여 동시 요청 수를 제한합니다.
 
 import asyncio
 import aiohttp
+import queue
+import threading
 import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 
+from utils.tts_cache import get_tts_cache
+
 
 CHATTERBOX_URL = "http://localhost:8100"
 
@@ -234,6 +238,20 @@ def run_parallel_generation(
 # ThreadPoolExecutor 기반 병렬 처리 (대안)
 # ============================================================
 
+def _request_settings(params: Dict) -> Dict:
+    """서버에 보내는 생성 설정 (캐시 키와 동일하게 유지)"""
+    return {
+        "language": params.get("language", "ko"),
+        "voice_ref_path": params.get("voice_ref_path"),
+        "exaggeration": params.get("exaggeration", 0.5),
+        "cfg_weight": params.get("cfg_weight", 0.5),
+        "temperature": params.get("temperature", 0.8),
+        "speed": params.get("speed", 1.0),
+        "repetition_penalty": params.get("repetition_penalty", 1.3),
+        "seed": params.get("seed"),
+    }
+
+
 def generate_single_scene_sync(scene: Dict, params: Dict) -> Dict:
     """
     단일 씬 동기 생성 (스레드용)
@@ -246,16 +264,7 @@ def generate_single_scene_sync(scene: Dict, params: Dict) -> Dict:
 
     request_data = {
         "text": text,
-        "settings": {
-            "language": params.get("language", "ko"),
-            "voice_ref_path": params.get("voice_ref_path"),
-            "exaggeration": params.get("exaggeration", 0.5),
-            "cfg_weight": params.get("cfg_weight", 0.5),
-            "temperature": params.get("temperature", 0.8),
-            "speed": params.get("speed", 1.0),
-            "repetition_penalty": params.get("repetition_penalty", 1.3),
-            "seed": params.get("seed"),
-        }
+        "settings": _request_settings(params)
     }
 
     start_time = time.time()
@@ -351,46 +360,68 @@ def run_threaded_generation(
 
 
 # ============================================================
-# 서버 배치 엔드포인트 활용 (단일 요청으로 여러 씬 처리)
+# 서버 배치 엔드포인트 활용 (파이프라인: 청크 제출 + 다운로드 중첩)
 # ============================================================
 
-def generate_batch_via_server(
-    scenes: List[Dict],
-    params: Dict,
-    progress_callback: Optional[Callable] = None
-) -> List[Dict]:
-    """
-    서버의 /generate/batch 엔드포인트를 활용한 배치 생성
+# 한 번에 /generate/batch로 보내는 씬 수
+BATCH_CHUNK_SIZE = 4
 
-    단일 HTTP 요청으로 여러 씬을 처리합니다.
-    네트워크 오버헤드가 줄어들지만, 진행 상황 확인이 어렵습니다.
+# 동시 다운로드 수
+BATCH_DOWNLOAD_CONCURRENCY = 4
 
-    Args:
-        scenes: 씬 리스트 [{"scene_id": 1, "text": "..."}, ...]
-        params: TTS 파라미터
-        progress_callback: 진행 콜백 (배치 완료 후 한 번만 호출됨)
+# 이벤트 루프별 공유 세션 {id(loop): (loop, session)}
+_async_sessions: Dict[int, tuple] = {}
 
-    Returns:
-        생성 결과 리스트
-    """
-    if not scenes:
-        return []
+# 동기 호출용 백그라운드 이벤트 루프 (프로세스당 1개 → 세션/연결 풀 재사용)
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
 
-    print(f"[Batch] {len(scenes)}개 씬 배치 생성 시작")
-    start_time = time.time()
 
-    # 배치 요청 데이터 구성
-    batch_items = []
-    for scene in scenes:
-        batch_items.append({
+async def get_async_session() -> aiohttp.ClientSession:
+    """
+    현재 이벤트 루프의 공유 aiohttp 세션
+
+    배치마다 세션을 새로 만들지 않고 keep-alive 연결을 재사용합니다.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _async_sessions.get(id(loop))
+    if entry is None or entry[0] is not loop or entry[1].closed:
+        connector = aiohttp.TCPConnector(limit=BATCH_DOWNLOAD_CONCURRENCY + 2, keepalive_timeout=60)
+        entry = (loop, aiohttp.ClientSession(connector=connector))
+        _async_sessions[id(loop)] = entry
+    return entry[1]
+
+
+async def close_async_session():
+    """현재 이벤트 루프의 공유 세션 닫기"""
+    entry = _async_sessions.pop(id(asyncio.get_running_loop()), None)
+    if entry and not entry[1].closed:
+        await entry[1].close()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """동기 코드에서 비동기 배치를 돌리는 전용 루프 (데몬 스레드)"""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="chatterbox-batch-loop",
+                daemon=True
+            ).start()
+        return _background_loop
+
+
+def _batch_request(scenes: List[Dict], params: Dict) -> Dict:
+    """/generate/batch 요청 데이터"""
+    return {
+        "items": [{
             "text": scene.get("text", ""),
             "voice_id": params.get("voice_ref_path", "default"),
             "exaggeration": params.get("exaggeration", 0.5),
             "language": params.get("language", "ko")
-        })
-
-    request_data = {
-        "items": batch_items,
+        } for scene in scenes],
         "settings": {
             "language": params.get("language", "ko"),
             "cfg_weight": params.get("cfg_weight", 0.5),
@@ -401,85 +432,236 @@ def generate_batch_via_server(
         }
     }
 
+
+async def iter_batch_results(
+    scenes: List[Dict],
+    params: Dict,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    max_downloads: int = BATCH_DOWNLOAD_CONCURRENCY,
+    use_cache: bool = True,
+    base_url: Optional[str] = None
+) -> AsyncIterator[Dict]:
+    """
+    배치 엔드포인트 파이프라인 - 끝난 씬부터 결과를 내보내는 비동기 이터레이터
+
+    씬을 chunk_size개씩 /generate/batch로 보내고, 청크가 끝나면 그 파일들을
+    백그라운드로 다운로드하면서 바로 다음 청크를 제출합니다.
+    (합성과 다운로드가 겹치고, 호출자는 앞쪽 씬의 후처리를 먼저 시작할 수 있음)
+
+    Args:
+        scenes: 씬 리스트 [{"scene_id": 1, "text": "..."}, ...]
+        params: TTS 파라미터
+        chunk_size: 배치 요청 1회당 씬 수
+        max_downloads: 동시 다운로드 수
+        use_cache: TTS 결과 캐시 사용 여부 (히트는 맨 먼저 반환)
+        base_url: Chatterbox 서버 주소 (기본 CHATTERBOX_URL)
+
+    Yields:
+        완료 순서대로 결과 dict (index = 입력 위치, scene_id, audio_data, duration, success, ...)
+    """
+    if not scenes:
+        return
+
+    base_url = base_url or CHATTERBOX_URL
+    session = await get_async_session()
+    cache = get_tts_cache() if use_cache else None
+    settings = _request_settings(params)
+    results: asyncio.Queue = asyncio.Queue()
+    download_slots = asyncio.Semaphore(max_downloads)
+    start_time = time.time()
+
+    def failure(index: int, scene: Dict, error: str) -> Dict:
+        return {
+            "index": index,
+            "scene_id": scene.get("scene_id", index),
+            "success": False,
+            "error": error
+        }
+
+    # 캐시 히트는 즉시 반환, 나머지만 합성
+    pending = []
+    for index, scene in enumerate(scenes):
+        text = scene.get("text", "")
+        key = cache.make_key(text, settings) if cache and text.strip() else None
+        hit = cache.get(key) if key else None
+        if hit:
+            results.put_nowait({
+                "index": index,
+                "scene_id": scene.get("scene_id", index),
+                "text": text,
+                "audio_data": hit["audio_data"],
+                "duration": hit.get("duration", 0),
+                "generation_time": 0.0,
+                "cache_hit": True,
+                "success": True
+            })
+        else:
+            pending.append((index, scene, key))
+
+    async def download(index: int, scene: Dict, key: Optional[str], item: Dict):
+        audio_data = None
+        error = None
+        async with download_slots:
+            try:
+                async with session.get(
+                    f"{base_url}{item['audio_url']}",
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status == 200:
+                        audio_data = await response.read()
+                    else:
+                        error = f"다운로드 HTTP {response.status}"
+            except Exception as e:
+                error = f"다운로드 실패: {e}"
+
+        if audio_data is None:
+            await results.put(failure(index, scene, error))
+            return
+
+        duration = item.get("duration", 0)
+        if key:
+            cache.put(key, audio_data, duration)
+        await results.put({
+            "index": index,
+            "scene_id": scene.get("scene_id", index),
+            "text": scene.get("text", ""),
+            "audio_data": audio_data,
+            "duration": duration,
+            "generation_time": time.time() - start_time,
+            "success": True
+        })
+
+    async def submit_chunks():
+        downloads = []
+        scheduled = set()
+        try:
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                try:
+                    # 씬당 30초 타임아웃
+                    async with session.post(
+                        f"{base_url}/generate/batch",
+                        json=_batch_request([scene for _, scene, _ in chunk], params),
+                        timeout=aiohttp.ClientTimeout(total=max(120, len(chunk) * 30))
+                    ) as response:
+                        if response.status == 200:
+                            items = (await response.json()).get("results", [])
+                            chunk_error = None
+                        else:
+                            items = []
+                            chunk_error = f"HTTP {response.status}"
+                except asyncio.TimeoutError:
+                    items, chunk_error = [], "배치 요청 타임아웃"
+                except aiohttp.ClientError as e:
+                    items, chunk_error = [], str(e)
+
+                if chunk_error:
+                    print(f"[Batch] 청크 실패 ({len(chunk)}개 씬): {chunk_error}")
+
+                for pos, (index, scene, key) in enumerate(chunk):
+                    scheduled.add(index)
+                    item = items[pos] if pos < len(items) else {}
+                    if item.get("success") and item.get("audio_url"):
+                        downloads.append(asyncio.create_task(download(index, scene, key, item)))
+                    else:
+                        await results.put(failure(
+                            index, scene, chunk_error or item.get("error", "배치 생성 실패")
+                        ))
+
+            await asyncio.gather(*downloads)
+        except Exception as e:
+            # 예기치 못한 오류 - 아직 제출하지 못한 씬은 실패로 반환 (이터레이터가 멈추지 않도록)
+            print(f"[Batch] 실패: {e}")
+            for index, scene, _ in pending:
+                if index not in scheduled:
+                    await results.put(failure(index, scene, str(e)))
+
+    producer = asyncio.create_task(submit_chunks())
     try:
-        # 배치 생성 요청 (씬당 30초 타임아웃)
-        timeout = max(120, len(scenes) * 30)
-        response = requests.post(
-            f"{CHATTERBOX_URL}/generate/batch",
-            json=request_data,
-            timeout=timeout
-        )
+        for _ in range(len(scenes)):
+            yield await results.get()
+    finally:
+        if not producer.done():
+            producer.cancel()
 
-        if response.status_code != 200:
-            print(f"[Batch] HTTP 오류: {response.status_code}")
-            return [{
-                "scene_id": s.get("scene_id", i),
-                "success": False,
-                "error": f"HTTP {response.status_code}"
-            } for i, s in enumerate(scenes)]
 
-        batch_result = response.json()
-        results_data = batch_result.get("results", [])
+def iter_batch_results_sync(scenes: List[Dict], params: Dict, **kwargs) -> Iterator[Dict]:
+    """
+    iter_batch_results의 동기 버전 (Streamlit 등 동기 코드용)
 
-        # 결과 변환
-        results = []
-        for i, scene in enumerate(scenes):
-            scene_id = scene.get("scene_id", i)
-            result_item = results_data[i] if i < len(results_data) else {}
+    공유 백그라운드 루프에서 파이프라인을 돌리고, 결과는 완료 순서대로
+    호출한 스레드에서 내보냅니다 (진행 콜백/UI 갱신을 호출 스레드에서 할 수 있음).
+    """
+    results: queue.Queue = queue.Queue()
+    done = object()
 
-            if result_item.get("success"):
-                # 오디오 다운로드
-                audio_url = result_item.get("audio_url", "")
-                audio_data = None
+    async def pump():
+        try:
+            async for result in iter_batch_results(scenes, params, **kwargs):
+                results.put(result)
+        except Exception as e:
+            results.put(e)
+        finally:
+            results.put(done)
 
-                if audio_url:
-                    try:
-                        full_url = f"{CHATTERBOX_URL}{audio_url}"
-                        audio_resp = requests.get(full_url, timeout=30)
-                        if audio_resp.status_code == 200:
-                            audio_data = audio_resp.content
-                    except:
-                        pass
-
-                results.append({
-                    "scene_id": scene_id,
-                    "text": scene.get("text", ""),
-                    "audio_data": audio_data,
-                    "duration": result_item.get("duration", 0),
-                    "success": True
-                })
-            else:
-                results.append({
-                    "scene_id": scene_id,
-                    "success": False,
-                    "error": result_item.get("error", "배치 생성 실패")
-                })
+    asyncio.run_coroutine_threadsafe(pump(), _get_background_loop())
+
+    while True:
+        item = results.get()
+        if item is done:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
-        elapsed = time.time() - start_time
-        success_count = sum(1 for r in results if r.get("success"))
 
-        print(f"[Batch] 완료: {success_count}/{len(scenes)}개 성공, 총 {elapsed:.1f}초")
+def generate_batch_via_server(
+    scenes: List[Dict],
+    params: Dict,
+    progress_callback: Optional[Callable] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    use_cache: bool = False
+) -> List[Dict]:
+    """
+    서버의 /generate/batch 엔드포인트를 활용한 배치 생성
+
+    chunk_size개씩 배치 요청을 보내고, 완료된 청크의 파일은 다음 청크가
+    합성되는 동안 병렬로 다운로드합니다 (iter_batch_results).
+
+    Args:
+        scenes: 씬 리스트 [{"scene_id": 1, "text": "..."}, ...]
+        params: TTS 파라미터
+        progress_callback: 진행 콜백 (씬이 끝날 때마다 호출됨)
+        chunk_size: 배치 요청 1회당 씬 수
+        use_cache: TTS 결과 캐시 사용 여부 (generate_scenes_optimal은 직접 캐시 처리)
 
+    Returns:
+        생성 결과 리스트 (입력 순서)
+    """
+    if not scenes:
+        return []
+
+    print(f"[Batch] {len(scenes)}개 씬 배치 생성 시작 (청크 {chunk_size}개)")
+    start_time = time.time()
+
+    results: List[Optional[Dict]] = [None] * len(scenes)
+    completed = 0
+
+    for result in iter_batch_results_sync(scenes, params, chunk_size=chunk_size, use_cache=use_cache):
+        results[result.pop("index")] = result
+        completed += 1
         if progress_callback:
-            progress_callback(len(scenes), len(scenes), f"배치 생성 완료 ({success_count}개 성공)")
+            progress_callback(completed, len(scenes), f"씬 {result.get('scene_id')} 완료")
 
-        return results
+    elapsed = time.time() - start_time
+    success_count = sum(1 for r in results if r and r.get("success"))
 
-    except requests.exceptions.Timeout:
-        print(f"[Batch] 타임아웃")
-        return [{
-            "scene_id": s.get("scene_id", i),
-            "success": False,
-            "error": "배치 요청 타임아웃"
-        } for i, s in enumerate(scenes)]
+    print(f"[Batch] 완료: {success_count}/{len(scenes)}개 성공, 총 {elapsed:.1f}초")
 
-    except Exception as e:
-        print(f"[Batch] 실패: {e}")
-        return [{
-            "scene_id": s.get("scene_id", i),
-            "success": False,
-            "error": str(e)
-        } for i, s in enumerate(scenes)]
+    return [
+        r or {"scene_id": s.get("scene_id", i), "success": False, "error": "결과 없음"}
+        for i, (r, s) in enumerate(zip(results, scenes))
+    ]
 
 
 def generate_scenes_optimal(
@@ -487,13 +669,15 @@ def generate_scenes_optimal(
     params: Dict,
     max_concurrent: int = 2,
     use_batch_endpoint: bool = False,
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    use_cache: bool = True
 ) -> List[Dict]:
     """
     최적의 방법으로 씬 생성 (자동 선택)
 
     - 씬 수가 적으면 (<=3): 스레드 병렬 처리
     - 씬 수가 많으면 (>3): 배치 엔드포인트 또는 스레드 병렬
+    - 텍스트/음성/파라미터가 이전과 같은 씬은 캐시에서 바로 반환 (합성 생략)
 
     Args:
         scenes: 씬 리스트
@@ -501,6 +685,7 @@ def generate_scenes_optimal(
         max_concurrent: 최대 동시 요청 수
         use_batch_endpoint: 배치 엔드포인트 강제 사용 여부
         progress_callback: 진행 콜백
+        use_cache: TTS 결과 캐시 사용 여부
 
     Returns:
         생성 결과 리스트
@@ -508,9 +693,66 @@ def generate_scenes_optimal(
     if not scenes:
         return []
 
-    # 배치 엔드포인트 사용 (진행 상황 확인 불필요한 경우)
-    if use_batch_endpoint:
-        return generate_batch_via_server(scenes, params, progress_callback)
+    cache = get_tts_cache() if use_cache else None
+    settings = _request_settings(params)
 
-    # 기본: 스레드 병렬 처리 (진행 상황 실시간 확인 가능)
-    return run_threaded_generation(scenes, params, max_concurrent, progress_callback)
+    # 캐시 조회 → 바뀐 씬만 합성
+    cached_results = {}
+    pending = []
+    keys = {}
+    for scene in scenes:
+        scene_id = scene.get("scene_id", 0)
+        text = scene.get("text", "")
+        if cache and text.strip():
+            keys[scene_id] = cache.make_key(text, settings)
+            hit = cache.get(keys[scene_id])
+            if hit:
+                cached_results[scene_id] = {
+                    "scene_id": scene_id,
+                    "text": text,
+                    "audio_data": hit["audio_data"],
+                    "duration": hit.get("duration", 0),
+                    "generation_time": 0.0,
+                    "cache_hit": True,
+                    "success": True
+                }
+                continue
+        pending.append(scene)
+
+    if cached_results:
+        print(f"[Optimal] 캐시 사용 {len(cached_results)}개, 합성 {len(pending)}개")
+
+    generated = []
+    if pending:
+        offset = len(cached_results)
+
+        def report(current, total, message):
+            if progress_callback:
+                progress_callback(offset + current, len(scenes), message)
+
+        # 배치 엔드포인트 사용 (진행 상황 확인 불필요한 경우)
+        if use_batch_endpoint:
+            generated = generate_batch_via_server(pending, params, report)
+        else:
+            # 기본: 스레드 병렬 처리 (진행 상황 실시간 확인 가능)
+            generated = run_threaded_generation(pending, params, max_concurrent, report)
+    elif progress_callback:
+        progress_callback(len(scenes), len(scenes), "모든 씬 캐시 사용")
+
+    # 새로 합성한 결과 저장
+    for result in generated:
+        key = keys.get(result.get("scene_id"))
+        if key and result.get("success") and result.get("audio_data"):
+            cache.put(key, result["audio_data"], result.get("duration", 0))
+
+    # 씬 순서대로 병합
+    by_id = {r.get("scene_id"): r for r in generated}
+    by_id.update(cached_results)
+    return [
+        by_id.get(scene.get("scene_id", 0), {
+            "scene_id": scene.get("scene_id", 0),
+            "success": False,
+            "error": "결과 없음"
+        })
+        for scene in scenes
+    ]
@@ -293,19 +293,12 @@ def generate_with_chunking(
             "chunks": 1
         }
 
-    # 병합
-    combined = AudioSegment.empty()
-    pause = AudioSegment.silent(duration=pause_ms)
-
-    for idx, audio in enumerate(audio_segments):
-        if idx > 0:
-            combined += pause
-        combined += audio
-
-    # 바이트로 변환
+    # 병합 (WAV로 바로 기록, 청크 수에 선형)
     import io
+    from utils.audio_concat import concat_to_wav
+
     output = io.BytesIO()
-    combined.export(output, format="wav")
+    chunk_offsets_ms = concat_to_wav(audio_segments, output, gaps_ms=pause_ms)
     output.seek(0)
 
     total_duration = sum(chunk_durations) + (len(audio_segments) - 1) * (pause_ms / 1000)
@@ -316,6 +309,7 @@ def generate_with_chunking(
         "success": True,
         "audio_data": output.read(),
         "duration": total_duration,
+        "chunk_offsets_ms": chunk_offsets_ms,
         "chunks": len(chunks)
     }
 
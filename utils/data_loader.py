@@ -357,6 +357,8 @@ def get_project_progress(project_path: Path) -> Dict:
     """
     프로젝트 진행 상황 반환
 
+    단계 결과 폴더의 mtime이 그대로면 프로젝트 인덱스에 저장된 값을 씁니다.
+
     Returns:
         {
             "completed_steps": [1, 2, 3],
@@ -364,19 +366,8 @@ def get_project_progress(project_path: Path) -> Dict:
             "total_steps": 7
         }
     """
-    completed = []
-    for step in range(1, 8):
-        if check_step_completed(project_path, step):
-            completed.append(step)
-
-    current = max(completed) + 1 if completed else 1
-    current = min(current, 7)
-
-    return {
-        "completed_steps": completed,
-        "current_step": current,
-        "total_steps": 7
-    }
+    from utils.project_index import get_project_index
+    return get_project_index().progress(project_path)
 
 
 # === 씬/캐릭터 관련 함수 ===
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반 디스크 캐시 (LRU 용량 제한) - TTS/이미지 결과 캐시 공통 부분
+
+저장 구조 (cache_dir):
+  <key><suffix>  - 결과 바이트 (오디오, 이미지 등)
+  <key>.json     - 메타데이터
+
+용량 정책:
+  총 용량이 max_size_mb를 넘으면 마지막 사용이 오래된 항목부터 삭제 (LRU)
+  조회 시 파일 mtime을 갱신해 사용 시각으로 씀 (프로세스 재시작 후에도 순서 유지)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class ContentAddressedCache:
+    """키 → (바이트, 메타데이터) 디스크 캐시"""
+
+    # 결과 파일 확장자
+    DATA_SUFFIX = ".bin"
+
+    # 저장 실패 로그 접두어
+    LOG_PREFIX = "[DiskCache]"
+
+    def __init__(self, cache_dir: Path, max_size_mb: float):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+
+        # 키 -> 바이트 크기 (오래된 순)
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.cache_dir / f"{key}{self.DATA_SUFFIX}", self.cache_dir / f"{key}.json"
+
+    def _ensure_index(self):
+        """첫 사용 시 디렉토리를 스캔해 LRU 인덱스 구성 (lock 안에서 호출)"""
+        if self._entries is not None:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        found = []
+        for data_path in self.cache_dir.glob(f"*{self.DATA_SUFFIX}"):
+            try:
+                stat = data_path.stat()
+                meta_size = data_path.with_suffix(".json").stat().st_size
+            except OSError:
+                continue
+            found.append((stat.st_mtime, data_path.stem, stat.st_size + meta_size))
+
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(found))
+        self._total_bytes = sum(self._entries.values())
+
+    def _evict(self):
+        """용량 초과 시 오래된 항목부터 삭제 (lock 안에서 호출)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            for path in self._paths(key):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def _get(self, key: str) -> Optional[Tuple[bytes, Dict]]:
+        """캐시 조회 → (데이터, 메타데이터) 또는 None"""
+        data_path, meta_path = self._paths(key)
+
+        with self._lock:
+            self._ensure_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            try:
+                data = data_path.read_bytes()
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # 외부에서 지워졌거나 손상 → 인덱스에서 제거
+                self._total_bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        now = time.time()
+        try:
+            os.utime(data_path, (now, now))
+        except OSError:
+            pass
+
+        return data, meta
+
+    def _put(self, key: str, data: bytes, meta: Dict) -> None:
+        """결과 저장 (원자적 교체 후 용량 정리)"""
+        if not data:
+            return
+
+        data_path, meta_path = self._paths(key)
+        meta_text = json.dumps({"created_at": time.time(), **meta}, ensure_ascii=False)
+
+        with self._lock:
+            self._ensure_index()
+            try:
+                tmp_path = data_path.with_suffix(f"{self.DATA_SUFFIX}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(data)
+                meta_path.write_text(meta_text, encoding="utf-8")
+                os.replace(tmp_path, data_path)
+            except OSError as e:
+                print(f"{self.LOG_PREFIX} 저장 실패: {e}")
+                return
+
+            size = len(data) + len(meta_text.encode("utf-8"))
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def stats(self) -> Dict:
+        """캐시 상태"""
+        with self._lock:
+            self._ensure_index()
+            return {
+                "entries": len(self._entries),
+                "size_mb": round(self._total_bytes / 1024 / 1024, 1),
+                "max_size_mb": round(self.max_bytes / 1024 / 1024, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._ensure_index()
+            for key in list(self._entries):
+                for path in self._paths(key):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+            self._entries.clear()
+            self._total_bytes = 0
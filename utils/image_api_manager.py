@@ -14,10 +14,14 @@ import os
 import time
 import base64
 import requests
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from utils.image_cache import get_image_cache, report_cache_hit
+from utils.rate_limiter import get_rate_limiter, is_rate_limit_error
+
 
 @dataclass
 class GenerationResult:
@@ -158,16 +162,6 @@ class ImageAPIManager:
         # ImageFX 클라이언트 (지연 초기화)
         self._imagefx_client = None
 
-        # Rate limit 추적
-        self._last_call_time: Dict[str, float] = {}
-        self._rate_limits = {
-            "Together.ai FLUX": 1.0,       # FLUX.2 유료 모델 기준 1초 간격
-            "Google ImageFX": 3.0,         # ImageFX는 3초 간격 권장
-            "OpenAI DALL-E": 1.0,          # 1초 간격
-            "Stability AI": 1.0,           # 1초 간격
-            "Replicate SDXL": 0.5,         # 0.5초 간격
-        }
-
     def _load_imagefx_auth_token(self) -> str:
         """ImageFX Authorization 토큰 로드 (환경변수 > 파일 순서)"""
         # 1. 환경 변수에서 먼저 확인
@@ -262,7 +256,8 @@ class ImageAPIManager:
         width: int = 1024,
         height: int = 1024,
         negative_prompt: str = "",
-        skip_rate_limit: bool = False
+        skip_rate_limit: bool = False,
+        seed: Optional[int] = None
     ) -> GenerationResult:
         """
         이미지 생성 (통합 인터페이스)
@@ -275,29 +270,56 @@ class ImageAPIManager:
             height: 이미지 높이
             negative_prompt: 네거티브 프롬프트
             skip_rate_limit: Rate limit 대기 스킵 여부
+            seed: 랜덤 시드 (지정하면 같은 요청은 이미지 캐시에서 재사용)
 
         Returns:
             GenerationResult
         """
         start_time = time.time()
 
-        # Rate limit 체크
-        if not skip_rate_limit:
-            self._wait_for_rate_limit(api_provider, model)
+        # 같은 seed 요청은 디스크 캐시에서 (API 호출/비용 없음)
+        cache_key = None
+        if seed is not None:
+            cache_key = get_image_cache().make_key(
+                prompt, api_provider, model, width, height, seed=seed, negative_prompt=negative_prompt
+            )
+            image_data = get_image_cache().get(cache_key)
+            if image_data:
+                print(f"[ImageAPI] {api_provider} 캐시 사용")
+                report_cache_hit(api_provider, model)
+                return GenerationResult(
+                    success=True,
+                    image_data=image_data,
+                    elapsed_time=time.time() - start_time
+                )
+
+        # Rate limit: 제공자/모델별 공유 토큰 버킷 (config.settings.IMAGE_RATE_LIMITS)
+        limiter = None if skip_rate_limit else get_rate_limiter(api_provider, model)
 
         try:
-            if api_provider == "Together.ai FLUX":
-                result = self._generate_together(prompt, model, width, height)
-            elif api_provider == "Google ImageFX":
-                result = self._generate_imagefx(prompt, model, width, height)
-            elif api_provider == "OpenAI DALL-E":
-                result = self._generate_openai(prompt, model, width, height)
-            elif api_provider == "Stability AI":
-                result = self._generate_stability(prompt, model, width, height, negative_prompt)
-            elif api_provider == "Replicate SDXL":
-                result = self._generate_replicate(prompt, model, width, height, negative_prompt)
-            else:
-                return GenerationResult(success=False, error=f"Unknown API: {api_provider}")
+            with (limiter.slot() if limiter else nullcontext()):
+                if api_provider == "Together.ai FLUX":
+                    result = self._generate_together(prompt, model, width, height, seed)
+                elif api_provider == "Google ImageFX":
+                    result = self._generate_imagefx(prompt, model, width, height)
+                elif api_provider == "OpenAI DALL-E":
+                    result = self._generate_openai(prompt, model, width, height)
+                elif api_provider == "Stability AI":
+                    result = self._generate_stability(prompt, model, width, height, negative_prompt)
+                elif api_provider == "Replicate SDXL":
+                    result = self._generate_replicate(prompt, model, width, height, negative_prompt)
+                else:
+                    return GenerationResult(success=False, error=f"Unknown API: {api_provider}")
+
+            # 429 응답이면 같은 제공자/모델의 다음 요청을 백오프
+            if limiter:
+                if not result.success and is_rate_limit_error(result.error):
+                    limiter.penalize()
+                else:
+                    limiter.report_success()
+
+            if cache_key and result.success and result.image_data:
+                get_image_cache().put(cache_key, result.image_data, model=model or "")
 
             elapsed = time.time() - start_time
             result.elapsed_time = elapsed
@@ -311,20 +333,6 @@ class ImageAPIManager:
             print(f"[ImageAPI] {api_provider} 오류: {e}")
             return GenerationResult(success=False, error=str(e), elapsed_time=elapsed)
 
-    def _wait_for_rate_limit(self, api_provider: str, model: str = None):
-        """Rate limit 대기"""
-        min_interval = self._rate_limits.get(api_provider, 1.0)
-
-        last_call = self._last_call_time.get(api_provider, 0)
-        elapsed = time.time() - last_call
-
-        if elapsed < min_interval:
-            wait_time = min_interval - elapsed
-            print(f"[RateLimit] {api_provider}: {wait_time:.1f}초 대기")
-            time.sleep(wait_time)
-
-        self._last_call_time[api_provider] = time.time()
-
     # ═══════════════════════════════════════════════════════
     # Together.ai FLUX
     # ═══════════════════════════════════════════════════════
@@ -333,7 +341,8 @@ class ImageAPIManager:
         prompt: str,
         model: str,
         width: int,
-        height: int
+        height: int,
+        seed: Optional[int] = None
     ) -> GenerationResult:
         """Together.ai FLUX 이미지 생성"""
 
@@ -361,7 +370,8 @@ class ImageAPIManager:
                 height=min(1792, max(64, height)),
                 steps=steps,
                 n=1,
-                response_format="b64_json"
+                response_format="b64_json",
+                **({"seed": seed} if seed is not None else {})
             )
 
             if response.data and response.data[0].b64_json:
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 생성 결과 캐시 - 요청 내용 주소 기반
+
+기존 문제:
+  스토리보드 재실행, 세그먼트 재그룹화 때마다 같은 (프롬프트, 모델, 크기, steps, seed)를
+  다시 요청해서 같은 이미지에 비용을 반복 지불
+
+해결책:
+  - 키 = hash(제공자, 모델, 정규화한 프롬프트, 크기, steps, seed, 네거티브 프롬프트)
+  - seed가 있는 요청만 디스크에서 재사용 (seed 없이 재생성하면 새 이미지를 원하는 것)
+  - 한 배치 안의 같은 요청은 한 번만 생성하고 복사 (seed 없어도)
+  - 캐시/중복 제거로 생략한 요청은 APIManager.record_usage(cache_hit=True)로,
+    실제 생성은 cache_hit=False로 기록 → 이미지 생성 기준 적중률/절감액 확인
+
+저장 구조 (data/cache/images): <key>.img + <key>.json, 용량 초과 시 LRU 삭제
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import CACHE_DIR
+from utils.disk_cache import ContentAddressedCache
+from utils.rate_limiter import canonical_provider
+
+IMAGE_CACHE_DIR = CACHE_DIR / "images"
+IMAGE_CACHE_MAX_MB = 1024
+
+# 키 형식이 바뀌면 올려서 이전 항목을 자연스럽게 무효화
+_KEY_VERSION = 1
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백 차이만 있는 프롬프트를 같은 요청으로 취급"""
+    return " ".join((prompt or "").split())
+
+
+class ImageResultCache(ContentAddressedCache):
+    """이미지 생성 결과 디스크 캐시 (LRU 용량 제한)"""
+
+    DATA_SUFFIX = ".img"
+    LOG_PREFIX = "[ImageCache]"
+
+    def __init__(self, cache_dir: Path = IMAGE_CACHE_DIR, max_size_mb: int = IMAGE_CACHE_MAX_MB):
+        super().__init__(cache_dir, max_size_mb)
+
+    def make_key(
+        self,
+        prompt: str,
+        provider: str,
+        model: str,
+        width: int,
+        height: int,
+        steps: Optional[int] = None,
+        seed: Optional[int] = None,
+        negative_prompt: str = ""
+    ) -> str:
+        """정규화한 요청 → 캐시 키"""
+        payload = json.dumps(
+            {
+                "v": _KEY_VERSION,
+                "provider": canonical_provider(provider),
+                "model": model or "",
+                "prompt": normalize_prompt(prompt),
+                "negative_prompt": normalize_prompt(negative_prompt),
+                "size": [int(width), int(height)],
+                "steps": steps,
+                "seed": seed,
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 → 이미지 바이트 또는 None"""
+        found = self._get(key)
+        return found[0] if found else None
+
+    def put(self, key: str, image_data: bytes, **meta) -> None:
+        """생성 결과 저장"""
+        self._put(key, image_data, meta)
+
+
+def image_price(model: str) -> float:
+    """모델 이미지 1장 가격 (USD)"""
+    from utils.image_api_manager import get_model_info
+    return get_model_info(model or "").get("price", 0.0)
+
+
+def report_cache_hit(provider: str, model: str, count: int = 1, step_name: str = "image_cache"):
+    """캐시/중복 제거로 생략한 생성을 APIManager 사용량에 기록 (적중률/절감액 집계)"""
+    try:
+        from core.api.api_manager import get_api_manager
+        get_api_manager().record_usage(
+            provider=canonical_provider(provider),
+            model_id=model or "",
+            function="image_generation",
+            units_used=count,
+            cache_hit=True,
+            cost_saved=image_price(model) * count,
+            step_name=step_name
+        )
+    except Exception as e:
+        print(f"[ImageCache] 사용량 기록 실패: {e}")
+
+
+def report_generation(
+    provider: str,
+    model: str,
+    success: bool,
+    duration_seconds: float = 0.0,
+    error_message: str = "",
+    step_name: str = "image_generation"
+):
+    """실제 API로 생성한 요청을 사용량에 기록 (적중률 분모: 캐시 적중 + 실제 생성)"""
+    try:
+        from core.api.api_manager import get_api_manager
+        get_api_manager().record_usage(
+            provider=canonical_provider(provider),
+            model_id=model or "",
+            function="image_generation",
+            units_used=1,
+            duration_seconds=duration_seconds,
+            success=success,
+            error_message=error_message or "",
+            step_name=step_name
+        )
+    except Exception as e:
+        print(f"[ImageCache] 사용량 기록 실패: {e}")
+
+
+# 싱글톤 인스턴스
+_image_cache_instance: Optional[ImageResultCache] = None
+
+
+def get_image_cache() -> ImageResultCache:
+    """이미지 캐시 싱글톤 인스턴스 반환"""
+    global _image_cache_instance
+    if _image_cache_instance is None:
+        _image_cache_instance = ImageResultCache()
+    return _image_cache_instance
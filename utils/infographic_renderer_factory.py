@@ -161,13 +161,16 @@ def record_videos(
     Returns:
         {scene_id: video_path, ...}
     """
+    from utils.infographic_video_recorder import RECORDER_POOL_WORKERS
+
     recorder = get_video_recorder(output_dir)
     try:
         return recorder.record_multiple_scenes(
             infographic_data,
             duration=duration,
             fast_mode=fast_mode,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            workers=RECORDER_POOL_WORKERS
         )
     finally:
         recorder.close()
@@ -41,6 +41,9 @@ import traceback
 import logging
 import base64
 import re
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Callable
 
@@ -371,6 +374,93 @@ def check_video_recorder_available() -> Tuple[bool, str]:
     return True, "Selenium + FFmpeg 비디오 레코더 사용 가능"
 
 
+class FramePipeEncoder:
+    """
+    캡처 프레임을 FFmpeg stdin(image2pipe)으로 바로 흘려보내는 인코더
+
+    프레임 파일을 디스크에 쓰지 않고, 별도 writer 스레드가 큐에서 PNG 바이트를 꺼내
+    FFmpeg에 전달하므로 캡처와 인코딩이 동시에 진행됩니다.
+    큐가 가득 차면 write()가 블록되어 캡처 루프가 자연스럽게 늦춰집니다.
+    """
+
+    def __init__(self, cmd: List[str], max_queue: int = 30):
+        self.cmd = cmd
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_queue)
+        self._proc: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self.frames_written = 0
+        self.max_backlog = 0
+
+    def start(self):
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    def _writer(self):
+        stdin = self._proc.stdin
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if self._error is not None:
+                continue  # 파이프가 깨졌으면 남은 프레임은 버림
+            try:
+                stdin.write(frame)
+                self.frames_written += 1
+            except (BrokenPipeError, OSError) as e:
+                self._error = e
+
+    @property
+    def failed(self) -> bool:
+        return self._error is not None
+
+    def write(self, frame: bytes):
+        """프레임 1장 전달 (큐가 가득 차면 블록)"""
+        self._queue.put(frame)
+        self.max_backlog = max(self.max_backlog, self._queue.qsize())
+
+    def close(self, timeout: float = 300) -> Tuple[int, str]:
+        """
+        입력 종료 후 FFmpeg 완료 대기
+
+        Returns:
+            (returncode, stderr 일부)
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+        try:
+            # communicate()가 stdin을 닫고 종료를 기다림
+            _, stderr = self._proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            _, stderr = self._proc.communicate()
+            return -1, "FFmpeg 타임아웃"
+
+        stderr_text = stderr.decode('utf-8', errors='ignore') if stderr else ""
+        return self._proc.returncode, stderr_text[-300:]
+
+    def abort(self):
+        """캡처 중 예외 발생 시 FFmpeg 강제 종료"""
+        if self._proc and self._proc.poll() is None:
+            self._proc.kill()
+        if self._thread and self._thread.is_alive():
+            self._error = self._error or RuntimeError("aborted")
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+
+# 병렬 녹화 기본 Chrome 인스턴스 수 (Chrome 1개 ≈ 코어 2개 사용)
+RECORDER_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
 # ============================================================
 # 비디오 레코더 클래스
 # ============================================================
@@ -444,6 +534,9 @@ class InfographicVideoRecorder:
         self._driver_path = None
         self._ffmpeg_path = find_ffmpeg()
 
+        # 애니메이션 캡처 통계 {scene_index: {"capture_fps", "dropped_frames", "encode_lag", ...}}
+        self.scene_capture_stats: Dict[int, dict] = {}
+
         logger.info(f"[VideoRecorder] 초기화: 캔버스={canvas_width}x{canvas_height} → 출력={output_width}x{output_height}")
 
     def __enter__(self):
@@ -1290,46 +1383,11 @@ class InfographicVideoRecorder:
             preserve_layout: fullscreen_mode=False일 때 레이아웃 보존 여부
         """
         try:
-            # 1. HTML에서 캔버스 크기 자동 감지 및 드라이버 조정
-            self._update_driver_for_canvas(html_content)
-
-            driver = self._ensure_driver()
-            temp_dir = self._get_temp_dir()
-
-            # 2. HTML 저장 및 로드
-            html_file = os.path.join(temp_dir, f"scene_{scene_index}.html")
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            file_url = f"file:///{html_file.replace(os.sep, '/')}"
-            driver.get(file_url)
-            time.sleep(0.5)  # 폰트/스타일 로드 대기
-
-            # 3. 씬 표시 방식 선택
-            if fullscreen_mode:
-                # 🔴 핵심: 캔버스를 뷰포트 전체로 확장 (인포그래픽이 크게 보임)
-                self._prepare_scene_fullscreen(driver, scene_index)
-                logger.info(f"[씬 {scene_index + 1}] 전체화면 모드 적용")
-            elif preserve_layout:
-                # 원본 레이아웃 보존
-                self._show_only_scene_exact_layout(driver, scene_index)
-            else:
-                # 강제 중앙 정렬 (레거시)
-                self._show_only_scene_centered(driver, scene_index)
-            time.sleep(0.3)  # 렌더링 대기
-
-            # 4. 스크린샷 캡처
-            screenshot_path = os.path.join(temp_dir, f"scene_{scene_index}_hq.png")
-            driver.save_screenshot(screenshot_path)
-
-            # 캡처 크기 로깅
-            if PIL_AVAILABLE:
-                try:
-                    from PIL import Image
-                    with Image.open(screenshot_path) as img:
-                        logger.info(f"📸 씬 {scene_index + 1} 캡처: {img.size[0]}x{img.size[1]}")
-                except:
-                    pass
+            screenshot_path, html_file = self._capture_scene_still(
+                html_content, scene_index,
+                preserve_layout=preserve_layout,
+                fullscreen_mode=fullscreen_mode
+            )
 
             # 5. 비디오 변환 (업스케일 포함)
             success = self._image_to_video_hq(
@@ -1353,6 +1411,62 @@ class InfographicVideoRecorder:
             traceback.print_exc()
             return False
 
+    def _capture_scene_still(
+        self,
+        html_content: str,
+        scene_index: int,
+        preserve_layout: bool = True,
+        fullscreen_mode: bool = True
+    ) -> Tuple[str, str]:
+        """
+        빠른 모드 1단계: 씬 정지 화면 캡처 (인코딩은 호출자가 수행)
+
+        Returns:
+            (스크린샷 경로, 임시 HTML 경로)
+        """
+        # 1. HTML에서 캔버스 크기 자동 감지 및 드라이버 조정
+        self._update_driver_for_canvas(html_content)
+
+        driver = self._ensure_driver()
+        temp_dir = self._get_temp_dir()
+
+        # 2. HTML 저장 및 로드
+        html_file = os.path.join(temp_dir, f"scene_{scene_index}.html")
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+        file_url = f"file:///{html_file.replace(os.sep, '/')}"
+        driver.get(file_url)
+        time.sleep(0.5)  # 폰트/스타일 로드 대기
+
+        # 3. 씬 표시 방식 선택
+        if fullscreen_mode:
+            # 🔴 핵심: 캔버스를 뷰포트 전체로 확장 (인포그래픽이 크게 보임)
+            self._prepare_scene_fullscreen(driver, scene_index)
+            logger.info(f"[씬 {scene_index + 1}] 전체화면 모드 적용")
+        elif preserve_layout:
+            # 원본 레이아웃 보존
+            self._show_only_scene_exact_layout(driver, scene_index)
+        else:
+            # 강제 중앙 정렬 (레거시)
+            self._show_only_scene_centered(driver, scene_index)
+        time.sleep(0.3)  # 렌더링 대기
+
+        # 4. 스크린샷 캡처
+        screenshot_path = os.path.join(temp_dir, f"scene_{scene_index}_hq.png")
+        driver.save_screenshot(screenshot_path)
+
+        # 캡처 크기 로깅
+        if PIL_AVAILABLE:
+            try:
+                from PIL import Image
+                with Image.open(screenshot_path) as img:
+                    logger.info(f"📸 씬 {scene_index + 1} 캡처: {img.size[0]}x{img.size[1]}")
+            except:
+                pass
+
+        return screenshot_path, html_file
+
     # ================================================================
     # CSS 애니메이션 실시간 캡처 모드
     # ================================================================
@@ -1472,6 +1586,111 @@ class InfographicVideoRecorder:
             logger.warning(f"애니메이션 리셋 오류: {e}")
             return False
 
+    def _freeze_animations(self, driver, scene_index: int) -> bool:
+        """
+        가상 시간 캡처 준비 - 모든 애니메이션을 일시정지하고 시킹 함수 설치
+
+        CDP Animation 도메인으로 재생 속도를 0으로 고정하고,
+        Web Animations API(document.getAnimations)로 CSS 애니메이션/트랜지션을
+        프레임 시각에 맞춰 직접 이동시킵니다. 스크린샷이 느려도 프레임이 밀리지 않습니다.
+        """
+        try:
+            driver.execute_cdp_cmd('Animation.enable', {})
+            driver.execute_cdp_cmd('Animation.setPlaybackRate', {'playbackRate': 0})
+        except Exception as e:
+            logger.debug(f"Animation 도메인 사용 불가 (JS 시킹만 사용): {e}")
+
+        js_code = f"""
+        (function() {{
+            var targetScene = document.querySelectorAll('.scene')[{scene_index}];
+            if (!targetScene || !document.getAnimations) return false;
+
+            // 애니메이션별 기준 시각 (나중에 생성된 애니메이션은 발견 시점부터 0)
+            var baseTimes = new WeakMap();
+            var currentMs = 0;
+
+            window.__vtSeek = function(ms) {{
+                currentMs = ms;
+                var anims = document.getAnimations();
+                for (var i = 0; i < anims.length; i++) {{
+                    var anim = anims[i];
+                    if (!baseTimes.has(anim)) baseTimes.set(anim, currentMs);
+                    try {{
+                        anim.pause();
+                        anim.currentTime = Math.max(0, currentMs - baseTimes.get(anim));
+                    }} catch(e) {{}}
+                }}
+                // 스타일 반영 강제
+                targetScene.offsetHeight;
+                return anims.length;
+            }};
+
+            window.__vtSeek(0);
+            return true;
+        }})();
+        """
+        try:
+            return bool(driver.execute_script(js_code))
+        except Exception as e:
+            logger.warning(f"애니메이션 고정 오류: {e}")
+            return False
+
+    def _seek_animations(self, driver, time_ms: float) -> int:
+        """가상 시간 캡처 - 모든 애니메이션을 time_ms 시점으로 이동"""
+        return driver.execute_script(
+            "return window.__vtSeek ? window.__vtSeek(arguments[0]) : -1;",
+            time_ms
+        )
+
+    def _release_animations(self, driver):
+        """가상 시간 캡처 종료 - 애니메이션 재생 속도 복원"""
+        try:
+            driver.execute_cdp_cmd('Animation.setPlaybackRate', {'playbackRate': 1})
+            driver.execute_cdp_cmd('Animation.disable', {})
+        except Exception:
+            pass
+
+    def _frame_input_color_args(self) -> List[str]:
+        """프레임 입력 색공간 명시 (sRGB 소스임을 알림)"""
+        return [
+            '-color_primaries', 'bt709',
+            '-color_trc', 'iec61966-2-1',
+            '-colorspace', 'bt709',
+        ]
+
+    def _frame_encode_args(self, output_fps: int) -> List[str]:
+        """프레임 시퀀스 → H.264 인코딩 옵션 (화질 프리셋 적용)"""
+        q = self.quality_preset
+        crf = q.get('crf', 18)
+        preset = q.get('preset', 'medium')
+        target_w = q.get('width', 1920)
+        target_h = q.get('height', 1080)
+        pix_fmt = q.get('pixel_format', 'yuv420p')  # 🔴 v3.10: yuv444p→yuv420p (WMP 호환)
+        profile = q.get('profile', 'high')
+
+        # 비디오 필터 (고품질 스케일링)
+        vf_parts = [
+            f'fps={output_fps}',
+            f'scale={target_w}:{target_h}:flags=lanczos+accurate_rnd+full_chroma_int'  # 🔴 고품질 스케일링
+        ]
+        vf = ','.join(vf_parts)
+
+        return [
+            # 코덱
+            '-c:v', 'libx264',
+            '-preset', preset,
+            '-crf', str(crf),
+            '-pix_fmt', pix_fmt,  # 🔴 v3.9: 프리셋에서 가져온 픽셀 포맷 사용
+            '-vf', vf,
+            '-movflags', '+faststart',
+            '-profile:v', profile,  # 🔴 v3.9: 프리셋에서 가져온 프로파일 사용
+            # 🔴 v3.12: 색감 보존 핵심 설정
+            '-color_range', 'pc',              # Full Range (0-255)
+            '-colorspace', 'bt709',
+            '-color_primaries', 'bt709',
+            '-color_trc', 'iec61966-2-1',      # sRGB 감마
+        ]
+
     def _encode_frames_to_video(
         self,
         frames_dir: str,
@@ -1498,45 +1717,15 @@ class InfographicVideoRecorder:
 
             logger.info(f"🎬 {len(frame_files)}프레임 → 비디오 인코딩 ({input_fps}fps → {output_fps}fps)")
 
-            q = self.quality_preset
-            crf = q.get('crf', 18)
-            preset = q.get('preset', 'medium')
-            target_w = q.get('width', 1920)
-            target_h = q.get('height', 1080)
-            pix_fmt = q.get('pixel_format', 'yuv420p')  # 🔴 v3.10: yuv444p→yuv420p (WMP 호환)
-            profile = q.get('profile', 'high')
-
-            # 비디오 필터 (고품질 스케일링)
-            vf_parts = [
-                f'fps={output_fps}',
-                f'scale={target_w}:{target_h}:flags=lanczos+accurate_rnd+full_chroma_int'  # 🔴 고품질 스케일링
-            ]
-            vf = ','.join(vf_parts)
-
             # 🔴 v3.12: 색감 보존 설정 추가 (Problem 59)
             cmd = [
                 self._ffmpeg_path,
                 '-y',
-                # 입력 색공간 명시 (sRGB 소스임을 알림)
-                '-color_primaries', 'bt709',
-                '-color_trc', 'iec61966-2-1',
-                '-colorspace', 'bt709',
+                *self._frame_input_color_args(),
                 # 입력 파일
                 '-framerate', str(input_fps),
                 '-i', input_pattern,
-                # 코덱
-                '-c:v', 'libx264',
-                '-preset', preset,
-                '-crf', str(crf),
-                '-pix_fmt', pix_fmt,  # 🔴 v3.9: 프리셋에서 가져온 픽셀 포맷 사용
-                '-vf', vf,
-                '-movflags', '+faststart',
-                '-profile:v', profile,  # 🔴 v3.9: 프리셋에서 가져온 프로파일 사용
-                # 🔴 v3.12: 색감 보존 핵심 설정
-                '-color_range', 'pc',              # Full Range (0-255)
-                '-colorspace', 'bt709',
-                '-color_primaries', 'bt709',
-                '-color_trc', 'iec61966-2-1',      # sRGB 감마
+                *self._frame_encode_args(output_fps),
                 output_path
             ]
 
@@ -1717,7 +1906,9 @@ class InfographicVideoRecorder:
         duration: float,
         output_path: str,
         capture_fps: int = 15,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        streaming: bool = True,
+        virtual_time: bool = False
     ) -> bool:
         """
         🎬 CSS 애니메이션 실시간 캡처
@@ -1732,10 +1923,22 @@ class InfographicVideoRecorder:
             output_path: 출력 비디오 경로
             capture_fps: 캡처 FPS (10-20 권장)
             progress_callback: 진행률 콜백 (0-100)
+            streaming: True면 프레임 파일 없이 FFmpeg image2pipe로 바로 인코딩
+                       (캡처와 인코딩이 동시 진행, 결과는 self.scene_capture_stats)
+            virtual_time: True면 애니메이션을 멈추고 프레임마다 시각을 이동시켜 캡처
+                          (스크린샷 속도와 무관하게 프레임 정확, 30/60fps 권장)
 
         Returns:
             성공 여부
         """
+        if streaming and self._ffmpeg_path:
+            return self._record_scene_streaming(
+                html_content, scene_index, duration, output_path,
+                capture_fps=capture_fps,
+                progress_callback=progress_callback,
+                virtual_time=virtual_time
+            )
+
         try:
             driver = self._ensure_driver()
             temp_dir = self._get_temp_dir()
@@ -1758,6 +1961,8 @@ class InfographicVideoRecorder:
 
             # 3. 애니메이션 리셋 (처음부터 시작)
             self._reset_animations(driver, scene_index)
+            if virtual_time:
+                virtual_time = self._freeze_animations(driver, scene_index)
 
             # 4. 프레임 캡처 시작
             total_frames = int(duration * capture_fps)
@@ -1771,6 +1976,9 @@ class InfographicVideoRecorder:
             for frame_num in range(total_frames):
                 frame_start = time.time()
 
+                if virtual_time:
+                    self._seek_animations(driver, frame_num * 1000.0 / capture_fps)
+
                 try:
                     # CDP를 통한 빠른 스크린샷 시도
                     screenshot_data = driver.execute_cdp_cmd(
@@ -1793,7 +2001,9 @@ class InfographicVideoRecorder:
                     progress = int((frame_num + 1) / total_frames * 100)
                     progress_callback(progress)
 
-                # 타이밍 조절
+                # 타이밍 조절 (가상 시간 모드는 대기 없이 최대 속도)
+                if virtual_time:
+                    continue
                 elapsed = time.time() - frame_start
                 sleep_time = frame_interval - elapsed
                 if sleep_time > 0.001:
@@ -1801,17 +2011,29 @@ class InfographicVideoRecorder:
 
             actual_duration = time.time() - start_time
             actual_fps = captured_count / actual_duration if actual_duration > 0 else capture_fps
+            if virtual_time:
+                self._release_animations(driver)
 
             logger.info(f"📸 {captured_count}프레임 캡처 완료 (실제 {actual_fps:.1f}fps, {actual_duration:.1f}초)")
 
             # 5. 비디오 인코딩
+            encode_start = time.time()
             success = self._encode_frames_to_video(
                 frames_dir=frames_dir,
                 output_path=output_path,
-                input_fps=int(actual_fps) or capture_fps,
+                input_fps=capture_fps if virtual_time else (int(actual_fps) or capture_fps),
                 output_fps=self.fps
             )
 
+            self.scene_capture_stats[scene_index] = {
+                'mode': 'files',
+                'virtual_time': virtual_time,
+                'capture_fps': round(actual_fps, 2),
+                'frames': captured_count,
+                'dropped_frames': 0 if virtual_time else max(0, total_frames - captured_count),
+                'encode_lag': round(time.time() - encode_start, 2),
+            }
+
             # 6. 정리
             try:
                 shutil.rmtree(frames_dir)
@@ -1822,10 +2044,176 @@ class InfographicVideoRecorder:
             return success
 
         except Exception as e:
+            if virtual_time and self._driver is not None:
+                self._release_animations(self._driver)
             logger.error(f"❌ 씬 {scene_index + 1} 애니메이션 캡처 오류: {e}")
             traceback.print_exc()
             return False
 
+    def _capture_frame_png(self, driver) -> bytes:
+        """현재 화면을 PNG 바이트로 캡처 (CDP 우선, 실패 시 일반 스크린샷)"""
+        try:
+            screenshot_data = driver.execute_cdp_cmd(
+                'Page.captureScreenshot',
+                {'format': 'png', 'quality': 100}
+            )
+            return base64.b64decode(screenshot_data['data'])
+        except Exception:
+            return driver.get_screenshot_as_png()
+
+    def _record_scene_streaming(
+        self,
+        html_content: str,
+        scene_index: int,
+        duration: float,
+        output_path: str,
+        capture_fps: int = 15,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        virtual_time: bool = False
+    ) -> bool:
+        """
+        스트리밍 애니메이션 캡처 - 프레임을 FFmpeg stdin으로 바로 전달
+
+        FFmpeg 입력 FPS를 capture_fps로 고정하고, 캡처가 늦어져 놓친 슬롯은
+        직전 프레임을 반복해 채웁니다 (영상 길이 = duration 유지).
+        반복으로 채운 슬롯 수를 dropped_frames로 기록합니다.
+
+        virtual_time=True면 슬롯마다 애니메이션 시각을 이동시킨 뒤 캡처하므로
+        드롭이 없고, 스크린샷이 빠르면 실시간보다 빠르게 끝납니다.
+        """
+        encoder = None
+        html_file = None
+        driver = None
+
+        try:
+            driver = self._ensure_driver()
+            temp_dir = self._get_temp_dir()
+
+            # 1. HTML 로드
+            html_file = os.path.join(temp_dir, f"scene_anim_{scene_index}.html")
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+            file_url = f"file:///{html_file.replace(os.sep, '/')}"
+            driver.get(file_url)
+
+            # 2. 씬 준비
+            self._prepare_scene_for_animation(driver, scene_index)
+            time.sleep(0.5)  # 리소스 로드 대기
+
+            # 3. FFmpeg 파이프 시작 (애니메이션 리셋 전에 띄워 기동 지연을 숨김)
+            cmd = [
+                self._ffmpeg_path,
+                '-y',
+                '-loglevel', 'error',
+                *self._frame_input_color_args(),
+                '-f', 'image2pipe',
+                '-c:v', 'png',
+                '-framerate', str(capture_fps),
+                '-i', '-',
+                *self._frame_encode_args(self.fps),
+                output_path
+            ]
+            encoder = FramePipeEncoder(cmd, max_queue=max(capture_fps * 2, 8))
+            encoder.start()
+
+            # 4. 애니메이션 리셋 (처음부터 시작)
+            self._reset_animations(driver, scene_index)
+            if virtual_time:
+                virtual_time = self._freeze_animations(driver, scene_index)
+
+            # 5. 프레임 캡처 → 파이프
+            total_frames = int(duration * capture_fps)
+            frame_interval = 1.0 / capture_fps
+
+            mode_str = "가상 시간" if virtual_time else "스트리밍"
+            logger.info(f"🎬 씬 {scene_index + 1}: {total_frames}프레임 {mode_str} 캡처 ({duration}초, {capture_fps}fps)")
+
+            start_time = time.time()
+            captured_count = 0
+            dropped_count = 0
+            slot = 0
+
+            while virtual_time and slot < total_frames and not encoder.failed:
+                # 프레임 시각으로 이동 → 캡처 (벽시계와 무관)
+                self._seek_animations(driver, slot * 1000.0 / capture_fps)
+                encoder.write(self._capture_frame_png(driver))
+                captured_count += 1
+                slot += 1
+
+                if progress_callback:
+                    progress_callback(int(slot / total_frames * 100))
+
+            while slot < total_frames and not encoder.failed:
+                frame = self._capture_frame_png(driver)
+                captured_count += 1
+
+                # 캡처가 늦어져 지나간 슬롯은 같은 프레임으로 채움
+                elapsed = time.time() - start_time
+                next_slot = min(total_frames, max(slot + 1, int(elapsed / frame_interval) + 1))
+                for _ in range(next_slot - slot):
+                    encoder.write(frame)
+                dropped_count += next_slot - slot - 1
+                slot = next_slot
+
+                if progress_callback:
+                    progress_callback(int(slot / total_frames * 100))
+
+                sleep_time = start_time + slot * frame_interval - time.time()
+                if sleep_time > 0.001:
+                    time.sleep(sleep_time)
+
+            capture_end = time.time()
+            actual_duration = capture_end - start_time
+            actual_fps = captured_count / actual_duration if actual_duration > 0 else capture_fps
+
+            # 6. 인코딩 마무리 - 캡처 종료 후 남은 인코딩 시간이 encode lag
+            returncode, stderr = encoder.close()
+            encode_lag = time.time() - capture_end
+
+            stats = {
+                'mode': 'stream',
+                'virtual_time': virtual_time,
+                'capture_fps': round(actual_fps, 2),
+                'realtime_factor': round(duration / actual_duration, 2) if actual_duration > 0 else 0.0,
+                'frames': captured_count,
+                'dropped_frames': dropped_count,
+                'encode_lag': round(encode_lag, 2),
+                'max_backlog': encoder.max_backlog,
+            }
+            self.scene_capture_stats[scene_index] = stats
+
+            logger.info(
+                f"📸 씬 {scene_index + 1}: {captured_count}프레임 캡처 (실제 {actual_fps:.1f}fps), "
+                f"드롭 {dropped_count}프레임, 인코딩 지연 {encode_lag:.2f}초, 최대 대기열 {encoder.max_backlog}"
+            )
+
+            if returncode != 0:
+                logger.warning(f"FFmpeg 경고: {stderr or 'Unknown'}")
+
+            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                size_mb = os.path.getsize(output_path) / (1024 * 1024)
+                logger.info(f"✅ 애니메이션 비디오 생성 완료: {size_mb:.2f} MB")
+                return True
+
+            return False
+
+        except Exception as e:
+            if encoder is not None:
+                encoder.abort()
+            logger.error(f"❌ 씬 {scene_index + 1} 스트리밍 캡처 오류: {e}")
+            traceback.print_exc()
+            return False
+
+        finally:
+            if virtual_time and driver is not None:
+                self._release_animations(driver)
+            if html_file:
+                try:
+                    os.remove(html_file)
+                except OSError:
+                    pass
+
     # ================================================================
     # 선택적 씬 녹화
     # ================================================================
@@ -1842,7 +2230,10 @@ class InfographicVideoRecorder:
         preserve_layout: bool = True,
         fullscreen_mode: bool = True,  # 🔴 신규: 전체화면 모드 (인포그래픽이 크게 보임)
         fade_effect: bool = True,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        animation_streaming: bool = True,
+        animation_virtual_time: bool = False,
+        workers: int = 1
     ) -> Dict[int, str]:
         """
         선택된 씬들만 녹화 - 크기 최적화 + 고화질
@@ -1858,6 +2249,9 @@ class InfographicVideoRecorder:
             preserve_layout: True면 원본 레이아웃 보존
             fullscreen_mode: True면 캔버스 전체화면 확장 (권장)
             fade_effect: 페이드 인/아웃 효과
+            animation_streaming: 애니메이션 프레임을 파일 없이 FFmpeg로 바로 스트리밍
+            animation_virtual_time: 가상 시간으로 애니메이션을 프레임 단위로 이동하며 캡처
+            workers: 동시에 띄울 Chrome 인스턴스 수 (2 이상이면 드라이버 풀 병렬 녹화)
         """
         os.makedirs(output_dir, exist_ok=True)
         results = {}
@@ -1867,6 +2261,20 @@ class InfographicVideoRecorder:
         self._update_driver_for_canvas(html_content)
         logger.info(f"[VideoRecorder] 녹화 시작: {total}개 씬, 캔버스={self.canvas_width}x{self.canvas_height} → 출력={self.output_width}x{self.output_height}")
 
+        if workers > 1 and total > 1:
+            return self._record_scenes_parallel(
+                html_content, scene_indices, duration, output_dir,
+                workers=workers,
+                animation_mode=animation_mode,
+                animation_fps=animation_fps,
+                preserve_layout=preserve_layout,
+                fullscreen_mode=fullscreen_mode,
+                fade_effect=fade_effect,
+                progress_callback=progress_callback,
+                animation_streaming=animation_streaming,
+                animation_virtual_time=animation_virtual_time
+            )
+
         for i, scene_idx in enumerate(scene_indices):
             output_path = os.path.join(output_dir, f"infographic_scene_{scene_idx + 1:03d}.mp4")
 
@@ -1887,7 +2295,9 @@ class InfographicVideoRecorder:
                     duration=duration,
                     output_path=output_path,
                     capture_fps=animation_fps,
-                    progress_callback=scene_progress
+                    progress_callback=scene_progress,
+                    streaming=animation_streaming,
+                    virtual_time=animation_virtual_time
                 )
             else:
                 # 빠른 정적 이미지 기반 + 전체화면 모드
@@ -1906,6 +2316,181 @@ class InfographicVideoRecorder:
 
         return results
 
+    # ================================================================
+    # 병렬 녹화 (Chrome 드라이버 풀 + FFmpeg 인코딩 큐)
+    # ================================================================
+
+    def _spawn_worker(self) -> "InfographicVideoRecorder":
+        """같은 설정의 워커 레코더 생성 (드라이버/임시 폴더는 워커 전용)"""
+        worker = InfographicVideoRecorder(
+            output_dir=self.output_dir,
+            canvas_width=self.canvas_width,
+            canvas_height=self.canvas_height,
+            output_width=self.output_width,
+            output_height=self.output_height,
+            fps=self.fps,
+            quality=self.quality_name
+        )
+        worker._driver_path = self._driver_path
+        return worker
+
+    def _record_scenes_parallel(
+        self,
+        html_content: str,
+        scene_indices: List[int],
+        duration: float,
+        output_dir: str,
+        workers: int,
+        animation_mode: bool = False,
+        animation_fps: int = 15,
+        preserve_layout: bool = True,
+        fullscreen_mode: bool = True,
+        fade_effect: bool = True,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        animation_streaming: bool = True,
+        animation_virtual_time: bool = False,
+        encode_workers: Optional[int] = None
+    ) -> Dict[int, str]:
+        """
+        여러 Chrome 인스턴스에 씬을 나눠 동시에 녹화
+
+        - 캡처: 워커 레코더 N개가 각자 드라이버로 씬을 처리
+        - 인코딩: 빠른 모드의 FFmpeg 변환은 별도 인코딩 큐에서 실행되어
+          드라이버는 인코딩을 기다리지 않고 다음 씬으로 넘어감
+          (애니메이션 모드는 스트리밍 파이프가 이미 캡처와 인코딩을 겹침)
+        - 진행률 콜백은 호출 스레드에서만 호출 (Streamlit 안전)
+
+        Returns:
+            {scene_index: video_path} - 순차 녹화와 동일한 형태
+        """
+        total = len(scene_indices)
+        workers = min(workers, total)
+        encode_workers = encode_workers or workers
+
+        # 첫 워커를 만들기 전에 드라이버 경로를 한 번만 확인
+        if self._driver_path is None:
+            self._driver_path = get_chromedriver_path()
+
+        pool: "queue.Queue[InfographicVideoRecorder]" = queue.Queue()
+        spawned: List[InfographicVideoRecorder] = []
+        for _ in range(workers):
+            worker = self._spawn_worker()
+            spawned.append(worker)
+            pool.put(worker)
+
+        logger.info(f"[VideoRecorder] 병렬 녹화: {total}개 씬, Chrome {workers}개, 인코더 {encode_workers}개")
+        start_time = time.time()
+
+        results = {}
+        encode_executor = ThreadPoolExecutor(max_workers=encode_workers, thread_name_prefix="ffmpeg")
+
+        def encode_still(worker, scene_idx, screenshot_path, html_file, output_path):
+            try:
+                return worker._image_to_video_hq(
+                    screenshot_path, duration, output_path, fade_effect=fade_effect
+                )
+            finally:
+                for path in (screenshot_path, html_file):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+        def record_one(scene_idx):
+            output_path = os.path.join(output_dir, f"infographic_scene_{scene_idx + 1:03d}.mp4")
+            worker = pool.get()
+            try:
+                if animation_mode:
+                    ok = worker.record_scene_with_animation(
+                        html_content=html_content,
+                        scene_index=scene_idx,
+                        duration=duration,
+                        output_path=output_path,
+                        capture_fps=animation_fps,
+                        streaming=animation_streaming,
+                        virtual_time=animation_virtual_time
+                    )
+                    return ok, output_path
+
+                # 빠른 모드: 캡처만 하고 인코딩은 큐로 넘김
+                try:
+                    screenshot_path, html_file = worker._capture_scene_still(
+                        html_content, scene_idx,
+                        preserve_layout=preserve_layout,
+                        fullscreen_mode=fullscreen_mode
+                    )
+                except Exception as e:
+                    logger.error(f"씬 {scene_idx + 1} 캡처 오류: {e}")
+                    return False, output_path
+
+                # 임시 파일명이 씬별로 고유하므로 인코딩 중에도 워커를 바로 반환해도 안전
+                encode_future = encode_executor.submit(
+                    encode_still, worker, scene_idx, screenshot_path, html_file, output_path
+                )
+                return encode_future, output_path
+            finally:
+                pool.put(worker)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chrome") as capture_executor:
+                capture_futures = {
+                    capture_executor.submit(record_one, scene_idx): scene_idx
+                    for scene_idx in scene_indices
+                }
+
+                # 캡처 완료 → (빠른 모드면) 인코딩 완료 순서로 수집
+                pending = {}
+                done_count = 0
+                for future in as_completed(capture_futures):
+                    scene_idx = capture_futures[future]
+                    try:
+                        outcome, output_path = future.result()
+                    except Exception as e:
+                        logger.error(f"씬 {scene_idx + 1} 녹화 오류: {e}")
+                        outcome, output_path = False, None
+
+                    if isinstance(outcome, Future):
+                        pending[outcome] = (scene_idx, output_path)
+                        continue
+
+                    done_count += 1
+                    self._collect_scene_result(results, scene_idx, outcome, output_path)
+                    if progress_callback:
+                        progress_callback(done_count, total, f"씬 {scene_idx + 1} 녹화 완료 ({done_count}/{total})")
+
+                for encode_future in as_completed(pending):
+                    scene_idx, output_path = pending[encode_future]
+                    try:
+                        ok = encode_future.result()
+                    except Exception as e:
+                        logger.error(f"씬 {scene_idx + 1} 인코딩 오류: {e}")
+                        ok = False
+
+                    done_count += 1
+                    self._collect_scene_result(results, scene_idx, ok, output_path)
+                    if progress_callback:
+                        progress_callback(done_count, total, f"씬 {scene_idx + 1} 녹화 완료 ({done_count}/{total})")
+
+        finally:
+            encode_executor.shutdown(wait=True)
+            for worker in spawned:
+                self.scene_capture_stats.update(worker.scene_capture_stats)
+                worker.close()
+
+        elapsed = time.time() - start_time
+        logger.info(f"[VideoRecorder] 병렬 녹화 완료: {len(results)}/{total}개, {elapsed:.1f}초 "
+                    f"(씬당 {elapsed / max(total, 1):.1f}초)")
+
+        # 입력 순서 유지
+        return {idx: results[idx] for idx in scene_indices if idx in results}
+
+    def _collect_scene_result(self, results: Dict[int, str], scene_idx: int, ok: bool, output_path: Optional[str]):
+        if ok and output_path:
+            results[scene_idx] = output_path
+            print(f"✅ 씬 {scene_idx + 1} 녹화 완료 → {self.output_width}x{self.output_height}")
+        else:
+            print(f"❌ 씬 {scene_idx + 1} 녹화 실패")
+
     # ================================================================
     # 기존 API 호환
     # ================================================================
@@ -1963,9 +2548,14 @@ class InfographicVideoRecorder:
         scene_ids: List[int] = None,
         duration: float = None,
         fast_mode: bool = True,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        workers: int = 1
     ) -> Dict[int, str]:
-        """여러 씬 일괄 녹화 (기존 API 호환)"""
+        """
+        여러 씬 일괄 녹화 (기존 API 호환)
+
+        workers가 2 이상이면 Chrome 드라이버 풀로 병렬 녹화합니다.
+        """
         results = {}
         html_code = infographic_data.html_code
 
@@ -1985,6 +2575,31 @@ class InfographicVideoRecorder:
         rec_duration = duration or infographic_data.default_video_duration
         total = len(target_scenes)
 
+        if workers > 1 and total > 1:
+            if not SELENIUM_AVAILABLE or not check_ffmpeg_available()[0]:
+                for scene in target_scenes:
+                    scene.render_error = "Selenium 미설치" if not SELENIUM_AVAILABLE else "FFmpeg 미설치"
+                return results
+
+            by_index = {scene.scene_id - 1: scene for scene in target_scenes}
+            recorded = self.record_selected_scenes(
+                html_code, list(by_index.keys()), rec_duration, self.output_dir,
+                progress_callback=progress_callback,
+                workers=workers
+            )
+
+            for scene_index, scene in by_index.items():
+                video_path = recorded.get(scene_index)
+                if video_path:
+                    scene.video_path = video_path
+                    scene.video_duration = rec_duration
+                    scene.is_video_ready = True
+                    scene.render_error = None
+                    results[scene.scene_id] = video_path
+                else:
+                    scene.render_error = "녹화 실패"
+            return results
+
         try:
             for i, scene in enumerate(target_scenes):
                 if progress_callback:
@@ -2115,7 +2730,8 @@ def record_videos_sync(
     try:
         return recorder.record_multiple_scenes(
             infographic_data, scene_ids, duration, fast_mode=fast_mode,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            workers=RECORDER_POOL_WORKERS
         )
     finally:
         recorder.close()
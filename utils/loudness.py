@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+ITU-R BS.1770-4 라우드니스 측정기 (NumPy)
+
+모든 정규화 모듈이 공유하는 단일 LUFS 측정기:
+- K-weighting (고역 쉘빙 + RLB 하이패스) - 구간별 FFT 중첩 가산(overlap-add)으로 적용
+- 400ms 블록 / 75% 중첩, 절대 게이트(-70 LUFS) + 상대 게이트(-10 LU)
+- 선택적으로 모멘터리(400ms) / 숏텀(3s) 라우드니스 곡선 (100ms 간격)
+- 구간 단위 스트리밍 측정: 긴 나레이션도 추가 메모리는 구간 크기(수 MB)로 고정
+
+FFmpeg loudnorm 호출 없이 프로세스 생성 0회로 측정합니다.
+"""
+
+import io
+from typing import Dict, Optional
+
+import numpy as np
+
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+BLOCK_SEC = 0.4
+SHORT_TERM_SEC = 3.0
+STEP_SEC = 0.1
+
+# BS.1770 K-weighting 아날로그 원형 (임의 샘플레이트용)
+_SHELF_GAIN_DB = 3.99984385397
+_SHELF_Q = 0.7071752369554193
+_SHELF_FC = 1681.9744509555319
+_HIGHPASS_Q = 0.5003270373253953
+_HIGHPASS_FC = 38.13547087613982
+
+# 스트리밍 구간 크기 (채널당 샘플 수)
+CHUNK_SAMPLES = 1 << 16
+
+
+def _k_weighting_biquads(sample_rate: int):
+    """샘플레이트에 맞는 K-weighting 2단 biquad 계수 [(b, a), (b, a)] - 48kHz에서 규격 계수와 일치"""
+    # 1단: 고역 쉘빙 (머리 음향 효과)
+    k = np.tan(np.pi * _SHELF_FC / sample_rate)
+    vh = 10 ** (_SHELF_GAIN_DB / 20)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / _SHELF_Q + k * k
+    shelf_b = np.array([
+        (vh + vb * k / _SHELF_Q + k * k) / a0,
+        2 * (k * k - vh) / a0,
+        (vh - vb * k / _SHELF_Q + k * k) / a0,
+    ])
+    shelf_a = np.array([1.0, 2 * (k * k - 1) / a0, (1 - k / _SHELF_Q + k * k) / a0])
+
+    # 2단: RLB 하이패스 (분자는 규격대로 [1, -2, 1])
+    k = np.tan(np.pi * _HIGHPASS_FC / sample_rate)
+    a0 = 1 + k / _HIGHPASS_Q + k * k
+    hp_b = np.array([1.0, -2.0, 1.0])
+    hp_a = np.array([1.0, 2 * (k * k - 1) / a0, (1 - k / _HIGHPASS_Q + k * k) / a0])
+
+    return [(shelf_b, shelf_a), (hp_b, hp_a)]
+
+
+def _k_weighting_impulse(sample_rate: int) -> np.ndarray:
+    """K-weighting 임펄스 응답 (0.5초로 절단 - IIR 응답은 수십 ms 안에 감쇠)"""
+    length = max(1, sample_rate // 2)
+    n_fft = 1 << int(np.ceil(np.log2(4 * length)))
+
+    freqs = np.fft.rfftfreq(n_fft)
+    z_inv = np.exp(-2j * np.pi * freqs)
+    response = np.ones_like(z_inv)
+    for b, a in _k_weighting_biquads(sample_rate):
+        response *= (b[0] + b[1] * z_inv + b[2] * z_inv ** 2) / (a[0] + a[1] * z_inv + a[2] * z_inv ** 2)
+
+    return np.fft.irfft(response, n=n_fft)[:length]
+
+
+def _sample_scale(samples: np.ndarray) -> float:
+    """정수 PCM이면 -1.0 ~ 1.0 변환 배율"""
+    if np.issubdtype(samples.dtype, np.integer):
+        return 1.0 / float(1 << (8 * samples.dtype.itemsize - 1))
+    return 1.0
+
+
+def _k_weighted_chunks(samples: np.ndarray, sample_rate: int):
+    """
+    K-weighting을 구간 단위로 적용 (FFT 중첩 가산)
+
+    Yields:
+        (시작 위치, 필터 출력 float64 (c, channels)) - 입력 순서대로
+    """
+    impulse = _k_weighting_impulse(sample_rate)
+    tail_len = len(impulse) - 1
+    chunk = max(CHUNK_SAMPLES, 1 << int(np.ceil(np.log2(tail_len + 1))))
+    n_fft = 1 << int(np.ceil(np.log2(chunk + tail_len)))
+    response = np.fft.rfft(impulse, n=n_fft)[:, None]
+
+    scale = _sample_scale(samples)
+    n, channels = samples.shape
+    tail = np.zeros((tail_len, channels))
+
+    for offset in range(0, n, chunk):
+        block = samples[offset:offset + chunk].astype(np.float64)
+        if scale != 1.0:
+            block *= scale
+        c = block.shape[0]
+
+        filtered = np.fft.irfft(np.fft.rfft(block, n=n_fft, axis=0) * response, n=n_fft, axis=0)
+        filtered[:tail_len] += tail
+        tail = filtered[c:c + tail_len].copy()
+        yield offset, filtered[:c]
+
+
+def k_weight(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """K-weighting 필터 적용 (채널 축 = 1, 구간 단위로 계산)"""
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    out = np.empty(samples.shape, dtype=np.float64)
+    for offset, filtered in _k_weighted_chunks(samples, sample_rate):
+        out[offset:offset + filtered.shape[0]] = filtered
+    return out
+
+
+def _power_at(samples: np.ndarray, sample_rate: int, positions: np.ndarray) -> np.ndarray:
+    """
+    K-weighting 출력 제곱의 누적합을 지정 위치에서만 샘플링 (스트리밍)
+
+    Args:
+        positions: 오름차순 샘플 위치 (0 ~ n)
+
+    Returns:
+        (len(positions), channels) - positions[i] 이전 샘플들의 파워 합
+    """
+    values = np.zeros((len(positions), samples.shape[1]))
+    running = np.zeros(samples.shape[1])
+    for offset, filtered in _k_weighted_chunks(samples, sample_rate):
+        c = filtered.shape[0]
+        cumsum = np.cumsum(filtered ** 2, axis=0)
+        lo = np.searchsorted(positions, offset + 1, side="left")
+        hi = np.searchsorted(positions, offset + c, side="right")
+        if hi > lo:
+            values[lo:hi] = running + cumsum[positions[lo:hi] - offset - 1]
+        running = running + cumsum[-1]
+    return values
+
+
+def _window_powers(window_starts: np.ndarray, window: int, positions: np.ndarray, cumulative: np.ndarray) -> np.ndarray:
+    """위치별 누적 파워 → 슬라이딩 윈도우 평균 파워 (채널별)"""
+    if len(window_starts) == 0:
+        return np.empty((0, cumulative.shape[1]))
+    begin = np.searchsorted(positions, window_starts)
+    end = np.searchsorted(positions, window_starts + window)
+    return (cumulative[end] - cumulative[begin]) / window
+
+
+def _to_lufs(power: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore"):
+        return -0.691 + 10 * np.log10(power)
+
+
+def measure_loudness(
+    samples: np.ndarray,
+    sample_rate: int,
+    momentary: bool = False,
+    short_term: bool = False
+) -> Dict:
+    """
+    BS.1770 라우드니스 측정
+
+    Args:
+        samples: float 버퍼 (-1.0 ~ 1.0) 또는 정수 PCM, shape (n,) 또는 (n, channels)
+        sample_rate: 샘플레이트
+        momentary: True면 모멘터리 라우드니스 곡선 포함 (400ms, 100ms 간격)
+        short_term: True면 숏텀 라우드니스 곡선 포함 (3s, 100ms 간격)
+
+    Returns:
+        {"integrated": float(LUFS, 무음이면 -inf), "momentary": ndarray, "short_term": ndarray}
+    """
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        samples = samples[:, None]
+
+    result: Dict = {"integrated": float("-inf")}
+    n = samples.shape[0]
+    if n == 0:
+        return result
+
+    block = int(round(BLOCK_SEC * sample_rate))
+    step = int(round(STEP_SEC * sample_rate))
+    window = int(round(SHORT_TERM_SEC * sample_rate))
+
+    # 필요한 위치의 누적 파워만 저장 (전체 필터 출력을 메모리에 두지 않음)
+    block_starts = np.arange(0, n - block + 1, step) if n >= block else np.empty(0, dtype=np.int64)
+    short_starts = (
+        np.arange(0, n - window + 1, step) if short_term and n >= window else np.empty(0, dtype=np.int64)
+    )
+    positions = np.unique(np.concatenate([
+        [0, n], block_starts, block_starts + block, short_starts + window,
+    ]).astype(np.int64))
+    cumulative = _power_at(samples, sample_rate, positions)
+
+    # 채널 가중치 (모노/스테레오/3채널 = 1.0)
+    block_power = _window_powers(block_starts, block, positions, cumulative).sum(axis=1)
+    if len(block_power) == 0:
+        # 400ms 미만 클립은 전체를 블록 1개로 취급
+        block_power = (cumulative[-1] / n).sum(keepdims=True)
+
+    block_lufs = _to_lufs(block_power)
+
+    # 절대 게이트 → 상대 게이트
+    gated = block_power[block_lufs > ABSOLUTE_GATE_LUFS]
+    if len(gated):
+        relative_gate = _to_lufs(gated.mean()) + RELATIVE_GATE_LU
+        gated = block_power[(block_lufs > ABSOLUTE_GATE_LUFS) & (block_lufs > relative_gate)]
+        if len(gated):
+            result["integrated"] = float(_to_lufs(gated.mean()))
+
+    if momentary:
+        result["momentary"] = block_lufs if block_power.shape[0] else np.empty(0)
+    if short_term:
+        result["short_term"] = _to_lufs(_window_powers(short_starts, window, positions, cumulative).sum(axis=1))
+
+    return result
+
+
+def integrated_loudness(samples: np.ndarray, sample_rate: int) -> float:
+    """통합 라우드니스 (LUFS, 무음이면 -inf)"""
+    return measure_loudness(samples, sample_rate)["integrated"]
+
+
+def audiosegment_to_array(audio) -> np.ndarray:
+    """pydub AudioSegment → float64 (n, channels) 버퍼"""
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
+    samples /= float(1 << (8 * audio.sample_width - 1))
+    return samples.reshape(-1, audio.channels)
+
+
+def audiosegment_lufs(audio) -> float:
+    """AudioSegment 통합 라우드니스 (LUFS, 무음이면 -inf) - PCM 버퍼를 복사 없이 구간 단위로 측정"""
+    if audio.sample_width in (2, 4):
+        dtype = np.int16 if audio.sample_width == 2 else np.int32
+        samples = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+        return integrated_loudness(samples, audio.frame_rate)
+    return integrated_loudness(audiosegment_to_array(audio), audio.frame_rate)
+
+
+def wav_bytes_lufs(audio_data: bytes) -> Optional[float]:
+    """WAV 바이트 통합 라우드니스 (디코딩 실패 시 None)"""
+    try:
+        from pydub import AudioSegment
+        audio = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
+    except Exception:
+        return None
+    return audiosegment_lufs(audio)
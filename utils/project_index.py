@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+프로젝트 인덱스 - 사이드바 목록/진행 상황 캐시
+
+기존 문제:
+  - list_projects: Streamlit rerun마다 PROJECTS_DIR의 모든 config.json을 열어서 파싱
+  - get_project_progress: 1~7단계마다 check_step_completed (audio/voice_*.mp3 glob,
+    본문 이미지 전체 목록) → 프로젝트 300개 이상이면 사이드바가 수 초
+
+해결책:
+  - 매니페스트 파일 1개 (data/cache/project_index.json)에 프로젝트별 config + mtime 저장
+  - create_project / update_project_config / update_project_step가 항목을 직접 갱신
+  - list_projects: 프로젝트마다 config.json stat 1회, mtime이 다른 항목만 다시 파싱
+    (외부 수정 반영 - 기존 파일 수정은 PROJECTS_DIR mtime을 바꾸지 않음)
+    PROJECTS_DIR mtime이 바뀌었으면 (폴더 추가/삭제) 폴더 목록도 다시 확인
+  - 진행 상황: 단계별 결과 폴더 mtime이 그대로면 저장된 완료 단계 반환
+    (폴더 안 파일 추가/삭제 시 폴더 mtime이 바뀜)
+
+매니페스트는 PROJECTS_DIR 밖에 둡니다 (안에 쓰면 폴더 mtime이 바뀌어 매번 재검사).
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import CACHE_DIR, PROJECTS_DIR
+
+PROJECT_INDEX_PATH = CACHE_DIR / "project_index.json"
+
+# 형식이 바뀌면 올려서 다시 만들기
+_INDEX_VERSION = 1
+
+# 단계 완료 판정에 쓰는 폴더 (utils.data_loader.check_step_completed 기준)
+PROGRESS_DIRS = ["research", "scripts", "audio", "prompts", "images/content", "export"]
+
+
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class ProjectIndex:
+    """프로젝트 config/진행 상황 인덱스 (매니페스트 + 메모리)"""
+
+    def __init__(self, projects_dir: Path = PROJECTS_DIR, index_path: Path = PROJECT_INDEX_PATH):
+        self.projects_dir = Path(projects_dir)
+        self.index_path = Path(index_path)
+        self._lock = threading.RLock()
+
+        # {project_id: {"config": {...}, "config_mtime": float, "progress": {...}}}
+        self._entries: Dict[str, Dict] = {}
+        self._dir_mtime: Optional[float] = None
+        self._sorted: Optional[List[Dict]] = None
+
+        self._load()
+
+    # ------------------------------------------------------------
+    # 매니페스트 읽기/쓰기
+    # ------------------------------------------------------------
+
+    def _load(self):
+        """매니페스트 로드 (없거나 형식이 다르면 빈 인덱스)"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != _INDEX_VERSION or data.get("projects_dir") != str(self.projects_dir):
+            return
+        self._entries = data.get("projects", {})
+        self._dir_mtime = data.get("dir_mtime")
+
+    def _save(self):
+        """매니페스트 저장 (임시 파일 → 교체)"""
+        data = {
+            "version": _INDEX_VERSION,
+            "projects_dir": str(self.projects_dir),
+            "dir_mtime": self._dir_mtime,
+            "projects": self._entries,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[ProjectIndex] 저장 실패: {e}")
+
+    # ------------------------------------------------------------
+    # 목록
+    # ------------------------------------------------------------
+
+    def _read_config(self, project_id: str) -> Optional[Dict]:
+        """
+        config.json 파싱 → 인덱스 항목 (파일이 없으면 None)
+
+        파싱 실패 (수동 편집 오타, 다른 세션이 쓰는 도중)는 config None으로 돌려줘서
+        항목과 mtime은 남깁니다 - 파일이 고쳐지면 mtime이 바뀌어 다시 파싱됨
+        """
+        config_path = self.projects_dir / project_id / "config.json"
+        config_mtime = _mtime(config_path)
+        if config_mtime is None:
+            return None
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            print(f"[ProjectIndex] config.json 읽기 실패: {project_id}")
+            config = None
+        return {"config": config, "config_mtime": config_mtime}
+
+    def _reread(self, project_id: str, previous: Optional[Dict]) -> Optional[Dict]:
+        """항목 다시 읽기 (읽기 실패 시 마지막 정상 config 유지, 진행 상황 유지)"""
+        fresh = self._read_config(project_id)
+        if fresh is None or not previous:
+            return fresh
+        if fresh["config"] is None:
+            fresh["config"] = previous.get("config")
+        if "progress" in previous:
+            fresh["progress"] = previous["progress"]
+        return fresh
+
+    def _reconcile(self, dir_mtime: Optional[float]):
+        """폴더 추가/삭제 반영 - config.json mtime이 바뀐 항목만 다시 파싱"""
+        entries = {}
+        if self.projects_dir.exists():
+            for project_dir in self.projects_dir.iterdir():
+                if not project_dir.is_dir():
+                    continue
+                project_id = project_dir.name
+                entry = self._entries.get(project_id)
+                config_mtime = _mtime(project_dir / "config.json")
+                if config_mtime is None:
+                    continue
+                if entry is None or entry.get("config_mtime") != config_mtime:
+                    entry = self._reread(project_id, entry)
+                    if entry is None:
+                        continue
+                entries[project_id] = entry
+
+        self._entries = entries
+        self._dir_mtime = dir_mtime
+        self._sorted = None
+        self._save()
+
+    def _refresh_changed(self):
+        """config.json mtime이 바뀐 항목만 다시 파싱 (외부 편집 반영)"""
+        changed = False
+        for project_id, entry in list(self._entries.items()):
+            config_mtime = _mtime(self.projects_dir / project_id / "config.json")
+            if config_mtime == entry.get("config_mtime"):
+                continue
+            fresh = self._reread(project_id, entry) if config_mtime is not None else None
+            if fresh is None:
+                del self._entries[project_id]
+            else:
+                self._entries[project_id] = fresh
+            changed = True
+
+        if changed:
+            self._sorted = None
+            self._save()
+
+    def list_projects(self) -> List[Dict]:
+        """프로젝트 config 목록 (최신순)"""
+        with self._lock:
+            dir_mtime = _mtime(self.projects_dir)
+            if dir_mtime != self._dir_mtime:
+                self._reconcile(dir_mtime)
+            else:
+                self._refresh_changed()
+            if self._sorted is None:
+                self._sorted = sorted(
+                    (entry["config"] for entry in self._entries.values() if entry.get("config") is not None),
+                    key=lambda x: x.get("created_at", ""),
+                    reverse=True
+                )
+            return [dict(config) for config in self._sorted]
+
+    def update(self, project_id: str, config: Optional[Dict] = None):
+        """
+        프로젝트 항목 갱신 (config.json을 쓴 직후 호출)
+
+        Args:
+            project_id: 프로젝트 ID (폴더명)
+            config: 방금 저장한 config (없으면 파일에서 다시 읽음)
+        """
+        with self._lock:
+            config_path = self.projects_dir / project_id / "config.json"
+            previous = self._entries.get(project_id)
+            if config is None:
+                entry = self._reread(project_id, previous)
+            else:
+                entry = {"config": config, "config_mtime": _mtime(config_path)}
+                if previous and "progress" in previous:
+                    entry["progress"] = previous["progress"]
+            if entry is None:
+                self._entries.pop(project_id, None)
+            else:
+                self._entries[project_id] = entry
+            self._sorted = None
+            self._save()
+
+    def remove(self, project_id: str):
+        """프로젝트 항목 삭제"""
+        with self._lock:
+            if self._entries.pop(project_id, None) is not None:
+                self._sorted = None
+                self._save()
+
+    # ------------------------------------------------------------
+    # 진행 상황
+    # ------------------------------------------------------------
+
+    def progress(self, project_path: Path) -> Dict:
+        """
+        프로젝트 진행 상황 (단계 결과 폴더 mtime이 그대로면 저장된 값)
+
+        Returns:
+            {"completed_steps": [...], "current_step": int, "total_steps": 7}
+        """
+        from utils.data_loader import check_step_completed
+
+        project_path = Path(project_path)
+        signature = [_mtime(project_path / folder) for folder in PROGRESS_DIRS]
+
+        with self._lock:
+            entry = self._entries.get(project_path.name)
+            cached = entry.get("progress") if entry else None
+            if cached and cached.get("signature") == signature:
+                completed = cached["completed_steps"]
+            else:
+                completed = [step for step in range(1, 8) if check_step_completed(project_path, step)]
+                if entry is not None and project_path.parent == self.projects_dir:
+                    entry["progress"] = {"signature": signature, "completed_steps": completed}
+                    self._save()
+
+        current = max(completed) + 1 if completed else 1
+        current = min(current, 7)
+
+        return {
+            "completed_steps": list(completed),
+            "current_step": current,
+            "total_steps": 7
+        }
+
+
+# 싱글톤 인스턴스
+_project_index_instance: Optional[ProjectIndex] = None
+_project_index_lock = threading.Lock()
+
+
+def get_project_index() -> ProjectIndex:
+    """프로젝트 인덱스 싱글톤 인스턴스 반환"""
+    global _project_index_instance
+    with _project_index_lock:
+        if _project_index_instance is None:
+            _project_index_instance = ProjectIndex()
+        return _project_index_instance
@@ -28,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import PROJECTS_DIR
 from config.constants import PROJECT_STATUS, WORKFLOW_STEPS
+from utils.project_index import get_project_index
 
 
 def init_session_state():
@@ -168,6 +169,7 @@ def create_project(name: str, language: str = "ko") -> str:
 
     with open(project_path / "config.json", "w", encoding="utf-8") as f:
         json.dump(config, f, ensure_ascii=False, indent=2)
+    get_project_index().update(project_id, config)
 
     # 현재 프로젝트로 설정
     set_current_project(project_id)
@@ -196,6 +198,7 @@ def update_project_config(updates: Dict):
 
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
+        get_project_index().update(project_path.name, config)
 
 
 def update_project_step(step: int):
@@ -212,27 +215,12 @@ def list_projects() -> List[Dict]:
     """
     프로젝트 목록 반환 (최신순)
 
+    프로젝트 인덱스에서 읽고, 폴더가 추가/삭제됐거나 config.json이 바뀐 항목만 다시 파싱합니다.
+
     Returns:
         프로젝트 config 딕셔너리 리스트
     """
-    projects = []
-
-    if not PROJECTS_DIR.exists():
-        return projects
-
-    for project_dir in PROJECTS_DIR.iterdir():
-        if project_dir.is_dir():
-            config_path = project_dir / "config.json"
-            if config_path.exists():
-                try:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        config = json.load(f)
-                        projects.append(config)
-                except (json.JSONDecodeError, IOError):
-                    continue
-
-    # 최신순 정렬
-    return sorted(projects, key=lambda x: x.get("created_at", ""), reverse=True)
+    return get_project_index().list_projects()
 
 
 def delete_project(project_id: str) -> bool:
@@ -251,6 +239,7 @@ def delete_project(project_id: str) -> bool:
     if project_path.exists():
         try:
             shutil.rmtree(project_path)
+            get_project_index().remove(project_id)
 
             # 현재 프로젝트였다면 초기화
             if st.session_state.get("current_project_id") == project_id:
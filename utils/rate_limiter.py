@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 API 공용 Rate limiter (토큰 버킷)
+
+기존 문제:
+  - ImageGenerator.generate_batch: together면 유료 모델도 매 장 6초 고정 대기
+  - TogetherImageClient.generate_batch: 한 장씩 순차 호출
+  - ImageAPIManager: 제공자별 마지막 호출 시각을 따로 관리
+  → 유료 요금제도 병렬로 못 쓰고, 무료 요금제는 한도를 제각각 계산
+
+해결책:
+  - 제공자/모델별 스레드 안전 토큰 버킷 1개 (config.settings.IMAGE_RATE_LIMITS)
+    rpm: 분당 요청 수, concurrency: 동시 요청 수, burst: 버킷 크기
+  - 배치는 map_rate_limited로 한도 안에서 동시 실행
+  - 429 응답이면 버킷을 비우고 지수 백오프 후 재시도
+
+사용법:
+    limiter = get_rate_limiter("together", model)
+    with limiter.slot():
+        result = call_api()
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from config.settings import IMAGE_RATE_LIMITS
+
+# 429 재시도 횟수
+RATE_LIMIT_RETRIES = 3
+
+# 백오프 최대 대기 (초)
+MAX_BACKOFF_SEC = 60.0
+
+# ImageAPIManager 제공자 표시 이름 → IMAGE_RATE_LIMITS 키
+_PROVIDER_ALIASES = {
+    "Together.ai FLUX": "together",
+    "Google ImageFX": "imagefx",
+    "OpenAI DALL-E": "openai",
+    "Stability AI": "stability",
+    "Replicate SDXL": "replicate",
+}
+
+# 설정에 없는 제공자 기본값
+_DEFAULT_LIMIT = {"rpm": 60, "concurrency": 1}
+
+
+class TokenBucketLimiter:
+    """
+    스레드 안전 토큰 버킷 + 동시 요청 제한
+
+    토큰은 초당 rpm/60개씩 채워지고 최대 burst개까지 쌓입니다.
+    burst=1이면 요청 간격이 정확히 60/rpm초로 유지됩니다 (무료 요금제용).
+    """
+
+    def __init__(self, rpm: float, concurrency: int = 1, burst: Optional[int] = None, name: str = ""):
+        self.rpm = rpm
+        self.concurrency = max(1, int(concurrency))
+        self.capacity = max(1, int(burst or self.concurrency))
+        self.name = name
+
+        self._rate = rpm / 60.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+
+        # 통계
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """토큰 1개 확보 (필요하면 대기), 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    self.total_wait += waited
+                    return waited
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self._rate)
+            time.sleep(wait)
+            waited += wait
+
+    @contextmanager
+    def slot(self):
+        """동시 요청 슬롯 + 토큰을 잡고 API 호출 구간 실행"""
+        self._slots.acquire()
+        try:
+            waited = self.acquire()
+            if waited >= 0.5:
+                print(f"[RateLimit] {self.name}: {waited:.1f}초 대기")
+            yield
+        finally:
+            self._slots.release()
+
+    def penalize(self, retry_after: Optional[float] = None) -> float:
+        """
+        429 응답 반영 - 버킷을 비우고 일정 시간 모든 요청 보류
+
+        Args:
+            retry_after: 서버가 알려준 대기 시간 (없으면 60/rpm초부터 두 배씩)
+
+        Returns:
+            보류 시간 (초)
+        """
+        with self._lock:
+            self._consecutive_throttles += 1
+            self.throttled += 1
+            delay = retry_after if retry_after else min(
+                MAX_BACKOFF_SEC, (60.0 / self.rpm) * (2 ** (self._consecutive_throttles - 1))
+            )
+            now = time.monotonic()
+            self._tokens = 0.0
+            self._updated = now
+            self._blocked_until = max(self._blocked_until, now + delay)
+
+        print(f"[RateLimit] {self.name}: 429 응답 - {delay:.1f}초 보류")
+        return delay
+
+    def report_success(self):
+        """성공 응답 - 백오프 단계 초기화"""
+        with self._lock:
+            self._consecutive_throttles = 0
+
+    def stats(self) -> Dict:
+        """요청/대기/429 통계"""
+        return {
+            "name": self.name,
+            "rpm": self.rpm,
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 2),
+        }
+
+
+def canonical_provider(provider: str) -> str:
+    """제공자 표시 이름("Together.ai FLUX" 등) → 짧은 키("together" 등)"""
+    return _PROVIDER_ALIASES.get(provider, provider)
+
+
+def is_rate_limit_error(error: Any) -> bool:
+    """오류 메시지/예외가 429(Rate limit) 응답인지"""
+    text = str(error or "").lower()
+    return "429" in text or "rate limit" in text or "rate_limit" in text or "too many requests" in text
+
+
+def get_rate_limit_config(provider: str, model: str = "") -> Dict:
+    """제공자/모델에 해당하는 {"rpm", "concurrency", "burst"} 설정"""
+    provider = canonical_provider(provider)
+    rules = IMAGE_RATE_LIMITS.get(provider, {})
+    for pattern, limit in rules.items():
+        if pattern != "*" and pattern in (model or ""):
+            return limit
+    return rules.get("*", _DEFAULT_LIMIT)
+
+
+# 제공자/모델별 공유 인스턴스
+_limiters: Dict[Tuple[str, str], TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str = "") -> TokenBucketLimiter:
+    """제공자/모델별 Rate limiter (프로세스 내 공유)"""
+    key = (canonical_provider(provider), model or "")
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limit = get_rate_limit_config(*key)
+            limiter = TokenBucketLimiter(
+                rpm=limit["rpm"],
+                concurrency=limit.get("concurrency", 1),
+                burst=limit.get("burst"),
+                name=f"{key[0]}/{key[1] or '*'}"
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def map_rate_limited(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    limiter: TokenBucketLimiter,
+    is_throttled: Callable[[Any], bool],
+    max_retries: int = RATE_LIMIT_RETRIES
+) -> Iterator[Tuple[int, Any]]:
+    """
+    items를 limiter 한도(동시 요청/분당 요청) 안에서 병렬 처리
+
+    is_throttled(result)가 참이면 limiter.penalize() 후 재시도합니다.
+
+    Yields:
+        완료 순서대로 (입력 인덱스, 결과)
+    """
+    def run(item):
+        result = None
+        for attempt in range(max_retries + 1):
+            with limiter.slot():
+                result = func(item)
+            if not is_throttled(result):
+                limiter.report_success()
+                return result
+            if attempt < max_retries:
+                limiter.penalize()
+        return result
+
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=min(limiter.concurrency, max(1, len(items)))) as executor:
+        futures = {executor.submit(run, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+TTS 결과 캐시 - 내용 주소 기반 (재실행/프로젝트 간 공유)
+
+키 = hash(엔진, 텍스트, 음성 레퍼런스 파일 내용 해시, 생성 설정)
+  → 텍스트/음성/파라미터가 그대로인 씬은 다시 합성하지 않음
+  → 150개 씬 중 3개만 수정하면 3개만 합성
+
+저장 구조 (data/cache/tts):
+  <key>.wav   - 오디오
+  <key>.json  - 메타데이터 (duration 등)
+
+용량 정책 (utils.disk_cache.ContentAddressedCache):
+  총 용량이 max_size_mb를 넘으면 마지막 사용이 오래된 항목부터 삭제 (LRU)
+  조회 시 파일 mtime을 갱신해 사용 시각으로 씀 (프로세스 재시작 후에도 순서 유지)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import CACHE_DIR
+from utils.disk_cache import ContentAddressedCache
+
+TTS_CACHE_DIR = CACHE_DIR / "tts"
+TTS_CACHE_MAX_MB = 2048
+
+# 키 형식이 바뀌면 올려서 이전 항목을 자연스럽게 무효화
+_KEY_VERSION = 1
+
+
+class TTSResultCache(ContentAddressedCache):
+    """TTS 합성 결과 디스크 캐시 (LRU 용량 제한)"""
+
+    DATA_SUFFIX = ".wav"
+    LOG_PREFIX = "[TTSCache]"
+
+    def __init__(self, cache_dir: Path = TTS_CACHE_DIR, max_size_mb: int = TTS_CACHE_MAX_MB):
+        super().__init__(cache_dir, max_size_mb)
+
+        # 음성 레퍼런스 해시 메모: 경로 -> (mtime_ns, size, hash)
+        self._voice_memo: Dict[str, Tuple[int, int, str]] = {}
+
+    # ------------------------------------------------------------
+    # 키
+    # ------------------------------------------------------------
+
+    def _voice_hash(self, voice_ref_path: Optional[str]) -> Optional[str]:
+        """음성 레퍼런스 파일 내용 해시 (같은 (mtime, size)면 재사용)"""
+        if not voice_ref_path:
+            return None
+        try:
+            stat = os.stat(voice_ref_path)
+        except OSError:
+            # 서버 쪽 경로 등 로컬에 없는 파일 → 경로 자체로 구분
+            return f"path:{voice_ref_path}"
+
+        with self._lock:
+            memo = self._voice_memo.get(voice_ref_path)
+        if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+        digest = hashlib.sha256()
+        with open(voice_ref_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        voice_hash = digest.hexdigest()
+
+        with self._lock:
+            self._voice_memo[voice_ref_path] = (stat.st_mtime_ns, stat.st_size, voice_hash)
+        return voice_hash
+
+    def make_key(self, text: str, settings: Dict, engine: str = "chatterbox") -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            text: 합성 텍스트
+            settings: 서버에 보내는 생성 설정 (voice_ref_path는 파일 내용 해시로 대체)
+            engine: TTS 엔진 이름
+        """
+        normalized = {k: v for k, v in settings.items() if k != "voice_ref_path"}
+        normalized["voice"] = self._voice_hash(settings.get("voice_ref_path"))
+
+        payload = json.dumps(
+            {"v": _KEY_VERSION, "engine": engine, "text": text, "settings": normalized},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Returns:
+            {"audio_data": bytes, "duration": float, ...} 또는 None
+        """
+        found = self._get(key)
+        if found is None:
+            return None
+        audio_data, meta = found
+        return {**meta, "audio_data": audio_data}
+
+    def put(self, key: str, audio_data: bytes, duration: float, **meta) -> None:
+        """합성 결과 저장 (원자적 교체 후 용량 정리)"""
+        self._put(key, audio_data, {"duration": duration, **meta})
+
+
+# 싱글톤 인스턴스
+_tts_cache_instance: Optional[TTSResultCache] = None
+
+
+def get_tts_cache() -> TTSResultCache:
+    """TTS 캐시 싱글톤 인스턴스 반환"""
+    global _tts_cache_instance
+    if _tts_cache_instance is None:
+        _tts_cache_instance = TTSResultCache()
+    return _tts_cache_instance
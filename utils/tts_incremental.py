@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+문장 단위 증분 재합성 - 수정된 문장만 다시 생성
+
+기존 문제:
+  오타 하나를 고쳐도 씬 전체(때로는 모든 씬)를 다시 합성 → 수 분 소요
+
+해결책:
+  1. 씬 텍스트를 문장 단위로 분리 (TTSNaturalnessOptimizer._split_sentences)
+  2. 프로젝트에 저장된 직전 버전(문장별 오디오 + 매니페스트)과 diff
+  3. 바뀐/추가된 문장만 합성, 나머지는 저장된 테이크 재사용
+  4. 짧은 크로스페이드로 이어붙이고 문장별 시작/끝(ms)을 다시 계산 → SRT 타이밍 일치
+
+저장 구조 (<store_dir>/scene_XXX):
+  manifest.json      - {"params_key", "sentences": [{"text", "file", "duration_ms"}]}
+  <sha1(text)>.wav   - 문장 테이크 (내용 이름이므로 위치가 바뀌어도 재사용)
+
+음성/파라미터(params_key)가 바뀌면 모든 문장을 다시 합성합니다.
+"""
+
+import difflib
+import hashlib
+import io
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pydub import AudioSegment
+
+from utils.tts_naturalness import get_naturalness_optimizer
+
+# 문장 사이 크로스페이드 (ms)
+SENTENCE_CROSSFADE_MS = 20
+
+# 프로젝트 내 저장 위치 (<project>/data/tts_takes)
+TAKES_DIRNAME = "tts_takes"
+
+# (문장 텍스트) → (WAV 바이트, 길이 초) 또는 None
+SentenceSynthesizer = Callable[[str], Optional[Tuple[bytes, float]]]
+
+
+def get_takes_dir(project_dir) -> Path:
+    """프로젝트의 문장 테이크 저장 경로"""
+    return Path(project_dir) / "data" / TAKES_DIRNAME
+
+
+def split_sentences(text: str) -> List[str]:
+    """씬 텍스트 → 문장 목록 (문장부호 유지)"""
+    return get_naturalness_optimizer()._split_sentences(text, keep_punctuation=True)
+
+
+def diff_sentences(old: List[str], new: List[str]) -> List[Optional[int]]:
+    """
+    새 문장 목록의 각 문장이 재사용할 수 있는 이전 문장 인덱스
+
+    Returns:
+        len(new) 길이 리스트 - 이전 문장 인덱스 또는 None(재합성 필요)
+    """
+    reuse: List[Optional[int]] = [None] * len(new)
+    matcher = difflib.SequenceMatcher(a=old, b=new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                reuse[j1 + offset] = i1 + offset
+    return reuse
+
+
+def splice_sentences(
+    takes: List[AudioSegment],
+    crossfade_ms: int = SENTENCE_CROSSFADE_MS
+) -> Tuple[AudioSegment, List[Tuple[int, int]]]:
+    """
+    문장 테이크를 크로스페이드로 이어붙이기
+
+    Returns:
+        (병합 오디오, 문장별 (start_ms, end_ms)) - 크로스페이드 구간은 다음 문장에 포함
+    """
+    if not takes:
+        return AudioSegment.empty(), []
+
+    combined = takes[0]
+    starts = [0]
+
+    for take in takes[1:]:
+        fade = min(crossfade_ms, len(combined), len(take))
+        starts.append(len(combined) - fade)
+        combined = combined.append(take, crossfade=fade) if fade > 0 else combined + take
+
+    spans = []
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(combined)
+        spans.append((start, end))
+    return combined, spans
+
+
+class IncrementalSceneSynthesizer:
+    """씬 단위 증분 재합성기 (문장 테이크 저장 + diff + 스플라이스)"""
+
+    def __init__(
+        self,
+        store_dir,
+        synthesize: SentenceSynthesizer,
+        crossfade_ms: int = SENTENCE_CROSSFADE_MS
+    ):
+        self.store_dir = Path(store_dir)
+        self.synthesize = synthesize
+        self.crossfade_ms = crossfade_ms
+
+    def _scene_dir(self, scene_id) -> Path:
+        return self.store_dir / f"scene_{int(scene_id):03d}"
+
+    def _load_manifest(self, scene_dir: Path) -> Dict:
+        try:
+            with open(scene_dir / "manifest.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"params_key": None, "sentences": []}
+
+    def _save_manifest(self, scene_dir: Path, manifest: Dict):
+        tmp_path = scene_dir / "manifest.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(scene_dir / "manifest.json")
+
+    def plan(self, scene_id, text: str, params_key: str) -> Dict:
+        """재합성 계획 (실행 없이 재사용/합성 문장 수만 계산)"""
+        sentences = split_sentences(text)
+        manifest = self._load_manifest(self._scene_dir(scene_id))
+        if manifest.get("params_key") != params_key:
+            return {"sentences": len(sentences), "reused": 0, "synthesize": len(sentences)}
+
+        old = [s["text"] for s in manifest.get("sentences", [])]
+        reused = sum(1 for r in diff_sentences(old, sentences) if r is not None)
+        return {"sentences": len(sentences), "reused": reused, "synthesize": len(sentences) - reused}
+
+    def synthesize_scene(self, scene_id, text: str, params_key: str) -> Dict:
+        """
+        씬 증분 재합성
+
+        Args:
+            scene_id: 씬 번호
+            text: 현재 씬 텍스트
+            params_key: 음성/파라미터 식별 키 (바뀌면 전체 재합성)
+
+        Returns:
+            {
+                "success", "audio_data"(WAV), "duration"(초),
+                "sentences": [{"text", "start_ms", "end_ms", "reused"}],
+                "reused_count", "synthesized_count", "error"(실패 시)
+            }
+        """
+        scene_dir = self._scene_dir(scene_id)
+        scene_dir.mkdir(parents=True, exist_ok=True)
+
+        sentences = split_sentences(text)
+        if not sentences:
+            return {"success": False, "error": "빈 텍스트", "audio_data": None, "duration": 0}
+
+        manifest = self._load_manifest(scene_dir)
+        old_entries = manifest.get("sentences", []) if manifest.get("params_key") == params_key else []
+        reuse = diff_sentences([e["text"] for e in old_entries], sentences)
+
+        entries = []
+        takes = []
+        synthesized = 0
+
+        for sentence, old_index in zip(sentences, reuse):
+            take = None
+            entry = old_entries[old_index] if old_index is not None else None
+
+            if entry:
+                try:
+                    take = AudioSegment.from_file(scene_dir / entry["file"], format="wav")
+                    entry = {**entry, "reused": True}
+                except Exception:
+                    # 테이크 파일 유실 → 재합성
+                    take = None
+
+            if take is None:
+                generated = self.synthesize(sentence)
+                if not generated:
+                    return {
+                        "success": False,
+                        "error": f"문장 합성 실패: {sentence[:30]}",
+                        "audio_data": None,
+                        "duration": 0
+                    }
+
+                audio_data, _ = generated
+                file_name = f"{hashlib.sha1(sentence.encode('utf-8')).hexdigest()[:16]}.wav"
+                (scene_dir / file_name).write_bytes(audio_data)
+                take = AudioSegment.from_file(io.BytesIO(audio_data), format="wav")
+                entry = {"text": sentence, "file": file_name, "duration_ms": len(take), "reused": False}
+                synthesized += 1
+
+            entries.append(entry)
+            takes.append(take)
+
+        combined, spans = splice_sentences(takes, self.crossfade_ms)
+
+        self._save_manifest(scene_dir, {
+            "params_key": params_key,
+            "sentences": [{k: e[k] for k in ("text", "file", "duration_ms")} for e in entries]
+        })
+        self._prune(scene_dir, {e["file"] for e in entries})
+
+        output = io.BytesIO()
+        combined.export(output, format="wav")
+
+        return {
+            "success": True,
+            "audio_data": output.getvalue(),
+            "duration": len(combined) / 1000,
+            "sentences": [
+                {"text": e["text"], "start_ms": start, "end_ms": end, "reused": e["reused"]}
+                for e, (start, end) in zip(entries, spans)
+            ],
+            "reused_count": len(sentences) - synthesized,
+            "synthesized_count": synthesized
+        }
+
+    def _prune(self, scene_dir: Path, keep: set):
+        """매니페스트에서 빠진 테이크 삭제"""
+        for path in scene_dir.glob("*.wav"):
+            if path.name not in keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+def chatterbox_sentence_synthesizer(params: Dict, timeout: int = 180) -> SentenceSynthesizer:
+    """
+    Chatterbox 서버로 문장 1개를 합성하는 함수 생성 (TTS 결과 캐시 경유)
+
+    Args:
+        params: TTS 파라미터 (voice_ref_path, exaggeration, ...)
+        timeout: 요청 타임아웃 (초)
+    """
+    from utils.tts_parallel_generator import SequentialTTSGenerator
+
+    generator = SequentialTTSGenerator(timeout=timeout)
+
+    def synthesize(sentence: str) -> Optional[Tuple[bytes, float]]:
+        result = generator._generate_single({"scene_id": 0, "text": sentence}, params)
+        if result.get("success") and result.get("audio_data"):
+            return result["audio_data"], result.get("duration", 0)
+        print(f"[IncrementalTTS] 문장 합성 실패: {result.get('error')}")
+        return None
+
+    return synthesize
+
+
+def sentences_to_srt(sentences: List[Dict], offset_ms: int = 0, start_index: int = 1) -> str:
+    """문장 타이밍 → SRT 문자열 (offset_ms만큼 밀어서 씬 위치 반영)"""
+    from core.tts.silence_padder import ms_to_srt_time
+
+    lines = []
+    for i, s in enumerate(sentences, start_index):
+        lines.append(str(i))
+        lines.append(f"{ms_to_srt_time(int(offset_ms + s['start_ms']))} --> "
+                     f"{ms_to_srt_time(int(offset_ms + s['end_ms']))}")
+        lines.append(s["text"])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def scenes_to_srt(scenes: List[Dict]) -> str:
+    """
+    씬별 문장 타이밍 → SRT (씬마다 앞 씬들 길이만큼 밀어서 이어붙임)
+
+    정규화/속도 보정으로 씬 길이가 바뀌었으면 문장 타이밍을 같은 비율로 맞춥니다.
+
+    Args:
+        scenes: 오디오 순서대로 [{"sentences": [...], "duration": 초}, ...]
+    """
+    blocks = []
+    offset_ms = 0
+    index = 1
+    for scene in scenes:
+        sentences = scene.get("sentences") or []
+        duration_ms = int(round(scene.get("duration", 0) * 1000))
+        if sentences:
+            spliced_ms = sentences[-1]["end_ms"]
+            scale = duration_ms / spliced_ms if duration_ms and spliced_ms else 1.0
+            scaled = [
+                {**s, "start_ms": s["start_ms"] * scale, "end_ms": s["end_ms"] * scale}
+                for s in sentences
+            ]
+            blocks.append(sentences_to_srt(scaled, offset_ms, index))
+            index += len(sentences)
+        offset_ms += duration_ms
+    return "\n".join(blocks)
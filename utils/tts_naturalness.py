@@ -235,8 +235,12 @@ class TTSNaturalnessOptimizer:
 
         return variation * self.variation_strength
 
-    def _split_sentences(self, text: str) -> List[str]:
-        """문장 분리"""
+    def _split_sentences(self, text: str, keep_punctuation: bool = False) -> List[str]:
+        """문장 분리 (keep_punctuation=True면 문장부호 유지 - 문장 단위 재합성용)"""
+
+        if keep_punctuation:
+            sentences = re.findall(r'[^.!?]+[.!?]*', text)
+            return [s.strip() for s in sentences if s.strip(" .!?\n\t")]
 
         # 간단한 문장 분리
         sentences = re.split(r'[.!?]\s*', text)
@@ -21,6 +21,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from utils.tts_cache import get_tts_cache
+
 CHATTERBOX_URL = "http://localhost:8100"
 
 # 스레드 로컬 세션
@@ -45,6 +47,105 @@ def get_thread_session() -> requests.Session:
     return _thread_local.session
 
 
+def _cache_hit_result(scene_id, text: str, char_count: int, cached: Dict) -> Dict:
+    """캐시 항목 → 성공 결과 (generation_time=0, cache_hit=True)"""
+    return {
+        "scene_id": scene_id,
+        "text": text,
+        "text_preview": text[:50] + "..." if len(text) > 50 else text,
+        "char_count": char_count,
+        "audio_data": cached["audio_data"],
+        "duration": cached.get("duration", 0),
+        "chunks_count": 1,
+        "status": "success",
+        "success": True,
+        "cache_hit": True,
+        "generation_time": 0.0
+    }
+
+
+class AIMDConcurrencyController:
+    """
+    AIMD 동시성 제어기 (TCP 혼잡 제어 방식)
+
+    - 정상 완료: 한도 += 1/한도 (한도만큼 완료될 때마다 +1)
+    - 오류/타임아웃 또는 글자당 지연이 기준의 latency_tolerance배 초과: 한도 *= decrease_factor
+    - 한 번의 혼잡에 연속으로 줄이지 않도록, 마지막 감소 이후 시작된 요청만 감소를 유발
+
+    기준 지연은 관측된 글자당 최소 지연 (서버가 혼자 처리할 때의 속도에 수렴)
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        latency_tolerance: float = 1.5,
+        decrease_factor: float = 0.5
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(min(initial_limit or 2, self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+
+        self.in_flight = 0
+        self.peak_limit = int(self.limit)
+        self.increases = 0
+        self.decreases = 0
+
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def acquire(self) -> float:
+        """슬롯이 날 때까지 대기 후 점유, 시작 시각 반환"""
+        with self._cond:
+            while self.in_flight >= self.current_limit:
+                self._cond.wait()
+            self.in_flight += 1
+            return time.time()
+
+    def release(self, started_at: float, ok: bool, units: int = 1, sample: bool = True):
+        """
+        슬롯 반납 + 한도 조정
+
+        Args:
+            started_at: acquire()가 반환한 시작 시각
+            ok: 요청 성공 여부
+            units: 작업량 (글자 수) - 지연을 글자당으로 정규화
+            sample: False면 한도 조정 없이 반납만 (캐시 적중 등)
+        """
+        with self._cond:
+            self.in_flight -= 1
+
+            if sample:
+                per_unit = (time.time() - started_at) / max(units, 1)
+                congested = not ok or (
+                    self._baseline is not None
+                    and per_unit > self._baseline * self.latency_tolerance
+                )
+
+                if ok and (self._baseline is None or per_unit < self._baseline):
+                    self._baseline = per_unit
+
+                if congested:
+                    if started_at > self._last_decrease:
+                        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                        self._last_decrease = time.time()
+                        self.decreases += 1
+                elif self.limit < self.max_limit:
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                    self.increases += 1
+                    self.peak_limit = max(self.peak_limit, self.current_limit)
+
+            self._cond.notify_all()
+
+
 class ParallelTTSGenerator:
     """
     수정된 병렬 TTS 생성기
@@ -53,24 +154,38 @@ class ParallelTTSGenerator:
     1. audio_data 필수 검증
     2. 응답 키 호환성 처리
     3. 상세 디버그 로깅
+
+    adaptive=True면 max_workers를 상한으로 AIMD 제어기가 동시 요청 수를 조정
+    (씬은 긴 텍스트부터 투입해 마지막 꼬리 지연을 줄임)
     """
 
     def __init__(
         self,
         api_url: str = CHATTERBOX_URL,
         max_workers: int = 3,
-        timeout: int = 300  # 5분 타임아웃
+        timeout: int = 300,  # 5분 타임아웃
+        use_cache: bool = True,
+        adaptive: bool = False
     ):
         self.api_url = api_url
         self.max_workers = max_workers
         self.timeout = timeout
+        self.cache = get_tts_cache() if use_cache else None
+        self.adaptive = adaptive
         self._lock = threading.Lock()
         self._completed = 0
 
+        # 마지막 실행 통계 (동시성/병렬 효율)
+        self.last_run_stats: Dict = {}
+
         print(f"\n[ParallelGen] 초기화")
-        print(f"  ⚡ 동시 처리: {max_workers}개")
+        if adaptive:
+            print(f"  ⚡ 동시 처리: 적응형 (최대 {max_workers}개)")
+        else:
+            print(f"  ⚡ 동시 처리: {max_workers}개")
         print(f"  ⏱️ 타임아웃: {timeout}초")
         print(f"  🌐 API: {api_url}")
+        print(f"  💾 결과 캐시: {'사용' if use_cache else '미사용'}")
 
     def generate_all(
         self,
@@ -95,13 +210,19 @@ class ParallelTTSGenerator:
         results = [None] * total
         task_times = {}
 
-        def wrapped_generate(idx: int, scene: Dict) -> Dict:
+        controller = AIMDConcurrencyController(self.max_workers) if self.adaptive else None
+
+        # 긴 텍스트부터 투입 (결과는 원래 순서로 저장)
+        order = sorted(range(total), key=lambda i: len(scenes[i].get("text", "")), reverse=True)
+
+        def wrapped_generate(idx: int, scene: Dict, slot_start: Optional[float] = None) -> Dict:
             """래퍼 함수"""
             task_start = time.time()
             scene_id = scene.get("scene_id", idx + 1)
 
             print(f"[Scene {scene_id}] 🔄 시작 (t={task_start - start_time:.1f}s)")
 
+            result = None
             try:
                 result = self._generate_single(scene, params)
             except Exception as e:
@@ -118,6 +239,14 @@ class ParallelTTSGenerator:
                     "status": "failed",
                     "error": f"Exception: {e}"
                 }
+            finally:
+                if controller:
+                    controller.release(
+                        slot_start,
+                        ok=bool(result and result.get("success")),
+                        units=len(scene.get("text", "")),
+                        sample=not (result and result.get("cache_hit"))
+                    )
 
             gen_time = time.time() - task_start
             task_times[idx] = gen_time
@@ -128,7 +257,9 @@ class ParallelTTSGenerator:
                 current = self._completed
 
             # 결과 로깅
-            if result.get("success") and result.get("audio_data"):
+            if result.get("cache_hit"):
+                print(f"[Scene {scene_id}] 💾 캐시 사용 (오디오: {result.get('duration', 0):.1f}초)")
+            elif result.get("success") and result.get("audio_data"):
                 audio_size = len(result.get("audio_data", b""))
                 duration = result.get("duration", 0)
                 print(f"[Scene {scene_id}] ✅ 완료 {gen_time:.1f}초 (오디오: {duration:.1f}초, {audio_size//1024}KB)")
@@ -143,15 +274,17 @@ class ParallelTTSGenerator:
                 except Exception:
                     pass
 
-            result["generation_time"] = gen_time
+            result["generation_time"] = 0.0 if result.get("cache_hit") else gen_time
             return result
 
         # 병렬 실행
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_idx = {
-                executor.submit(wrapped_generate, idx, scene): idx
-                for idx, scene in enumerate(scenes)
-            }
+            future_to_idx = {}
+            for idx in order:
+                # 적응형: 제어기 한도 안에서만 투입 (호출 스레드가 대기)
+                slot_start = controller.acquire() if controller else None
+                future = executor.submit(wrapped_generate, idx, scenes[idx], slot_start)
+                future_to_idx[future] = idx
 
             for future in as_completed(future_to_idx):
                 idx = future_to_idx[future]
@@ -184,9 +317,25 @@ class ParallelTTSGenerator:
 
         print(f"\n{'='*60}")
         print(f"[ParallelGen] ✅ 완료: {success_count}/{total}개 성공")
+        cache_hits = sum(1 for r in results if r and r.get("cache_hit"))
+        if cache_hits:
+            print(f"[ParallelGen] 💾 캐시 사용: {cache_hits}개 (합성 {total - cache_hits}개)")
         print(f"[ParallelGen] ⏱️ 총 시간: {total_time:.1f}초")
         print(f"[ParallelGen] 📊 병렬 효율: {efficiency:.2f}x")
 
+        self.last_run_stats = {
+            "mode": "adaptive" if controller else "fixed",
+            "concurrency": controller.current_limit if controller else self.max_workers,
+            "peak_concurrency": controller.peak_limit if controller else self.max_workers,
+            "increases": controller.increases if controller else 0,
+            "decreases": controller.decreases if controller else 0,
+            "efficiency": round(efficiency, 2),
+            "total_time": round(total_time, 2),
+        }
+        if controller:
+            print(f"[ParallelGen] ⚡ 적응형 동시성: 최종 {controller.current_limit}개 "
+                  f"(최대 {controller.peak_limit}개, 증가 {controller.increases}회, 감소 {controller.decreases}회)")
+
         # 개별 결과 상태 출력
         print(f"[ParallelGen] 개별 결과:")
         for idx, r in enumerate(results):
@@ -242,6 +391,13 @@ class ParallelTTSGenerator:
             }
         }
 
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(text, request_data["settings"])
+            cached = self.cache.get(cache_key)
+            if cached:
+                return _cache_hit_result(scene_id, text, char_count, cached)
+
         try:
             session = get_thread_session()
 
@@ -311,6 +467,9 @@ class ParallelTTSGenerator:
                 0
             )
 
+            if cache_key:
+                self.cache.put(cache_key, audio_data, duration)
+
             # ⭐ 성공!
             return {
                 "scene_id": scene_id,
@@ -350,10 +509,12 @@ class SequentialTTSGenerator:
     def __init__(
         self,
         api_url: str = CHATTERBOX_URL,
-        timeout: int = 300
+        timeout: int = 300,
+        use_cache: bool = True
     ):
         self.api_url = api_url
         self.timeout = timeout
+        self.cache = get_tts_cache() if use_cache else None
 
         self.session = requests.Session()
         adapter = HTTPAdapter(
@@ -404,14 +565,16 @@ class SequentialTTSGenerator:
             result = self._generate_single(scene, params)
             gen_time = time.time() - gen_start
 
-            if result.get("success") and result.get("audio_data"):
+            if result.get("cache_hit"):
+                print(f"[Scene {scene_id}] 💾 캐시 사용 (오디오: {result.get('duration', 0):.1f}초)")
+            elif result.get("success") and result.get("audio_data"):
                 audio_size = len(result.get("audio_data", b"")) // 1024
                 duration = result.get("duration", 0)
                 print(f"[Scene {scene_id}] ✅ {gen_time:.1f}초 (오디오: {duration:.1f}초, {audio_size}KB)")
             else:
                 print(f"[Scene {scene_id}] ❌ {result.get('error', 'Unknown')}")
 
-            result["generation_time"] = gen_time
+            result["generation_time"] = 0.0 if result.get("cache_hit") else gen_time
             results.append(result)
 
         total_time = time.time() - total_start
@@ -467,6 +630,13 @@ class SequentialTTSGenerator:
             }
         }
 
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(text, request_data["settings"])
+            cached = self.cache.get(cache_key)
+            if cached:
+                return _cache_hit_result(scene_id, text, char_count, cached)
+
         try:
             response = self.session.post(
                 f"{self.api_url}/generate",
@@ -501,6 +671,9 @@ class SequentialTTSGenerator:
 
             duration = result.get("duration_seconds") or result.get("duration") or 0
 
+            if cache_key:
+                self.cache.put(cache_key, audio_data, duration)
+
             return {
                 "scene_id": scene_id,
                 "text": text,
@@ -535,7 +708,9 @@ def generate_scenes_parallel(
     max_workers: int = 3,
     timeout_per_scene: int = 300,
     use_sequential: bool = True,  # ⭐ 기본값 순차 모드 (GPU 1개 최적)
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    use_cache: bool = True,
+    adaptive: bool = False
 ) -> List[Dict]:
     """
     TTS 생성 함수 (순차/병렬 선택)
@@ -547,6 +722,8 @@ def generate_scenes_parallel(
         timeout_per_scene: 씬당 타임아웃
         use_sequential: True=순차(GPU 1개 최적), False=병렬
         progress_callback: 진행 콜백
+        use_cache: True면 텍스트/음성/파라미터가 같은 씬은 캐시된 결과 재사용
+        adaptive: 병렬 모드에서 max_workers를 상한으로 동시 요청 수 자동 조정
 
     수정사항:
     - 기본값 순차 모드 (GPU 1개 환경에서 더 빠름)
@@ -555,7 +732,7 @@ def generate_scenes_parallel(
 
     if use_sequential:
         # ⭐ 순차 모드 (기본, GPU 1개 최적)
-        generator = SequentialTTSGenerator(timeout=timeout_per_scene)
+        generator = SequentialTTSGenerator(timeout=timeout_per_scene, use_cache=use_cache)
         try:
             results = generator.generate_all(scenes, params, progress_callback)
         finally:
@@ -564,7 +741,9 @@ def generate_scenes_parallel(
         # 병렬 모드 (멀티 GPU 환경용)
         generator = ParallelTTSGenerator(
             max_workers=max_workers,
-            timeout=timeout_per_scene
+            timeout=timeout_per_scene,
+            use_cache=use_cache,
+            adaptive=adaptive
         )
         results = generator.generate_all(scenes, params, progress_callback)
 
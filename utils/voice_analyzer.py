@@ -25,6 +25,8 @@ from pydub.silence import detect_nonsilent
 from pathlib import Path
 import warnings
 
+from utils.loudness import audiosegment_lufs
+
 warnings.filterwarnings("ignore")
 
 
@@ -486,12 +488,9 @@ class VoiceAnalyzer:
     # ============================================================
 
     def _measure_lufs(self, audio: AudioSegment) -> float:
-        """LUFS 측정"""
+        """LUFS 측정 (ITU-R BS.1770 게이팅 통합 라우드니스)"""
         try:
-            samples = np.array(audio.get_array_of_samples()).astype(np.float32)
-            samples = samples / (2**15)
-            rms = np.sqrt(np.mean(samples**2))
-            lufs = 20 * np.log10(rms + 1e-10) - 3
+            lufs = audiosegment_lufs(audio)
             return max(-60, min(0, lufs))
         except:
             return -23.0